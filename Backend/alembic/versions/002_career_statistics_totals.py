@@ -0,0 +1,45 @@
+"""Add running totals for career statistics
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PROFILE_TABLES = ('player_profiles', 'user_profiles')
+TOTAL_COLUMNS = (
+    'dismissals',
+    'balls_faced',
+    'runs_conceded',
+    'balls_bowled',
+    'best_bowling_wickets',
+    'best_bowling_runs',
+)
+
+
+def upgrade() -> None:
+    for table in PROFILE_TABLES:
+        for column in TOTAL_COLUMNS:
+            op.add_column(table, sa.Column(
+                column, sa.Integer(), nullable=True, server_default='0'))
+
+    op.add_column('innings', sa.Column(
+        'stats_applied', sa.Boolean(), nullable=True, server_default=sa.false()))
+
+
+def downgrade() -> None:
+    op.drop_column('innings', 'stats_applied')
+
+    for table in PROFILE_TABLES:
+        for column in reversed(TOTAL_COLUMNS):
+            op.drop_column(table, column)
@@ -0,0 +1,38 @@
+"""Store net run rate components on standings and tournament matches
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '003'
+down_revision: Union[str, None] = '002'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STANDING_COLUMNS = ('tied', 'runs_for', 'balls_for', 'runs_against', 'balls_against')
+MATCH_COLUMNS = ('team1_balls', 'team2_balls')
+
+
+def upgrade() -> None:
+    for column in STANDING_COLUMNS:
+        op.add_column('tournament_standings', sa.Column(
+            column, sa.Integer(), nullable=True, server_default='0'))
+
+    for column in MATCH_COLUMNS:
+        op.add_column('tournament_matches', sa.Column(
+            column, sa.Integer(), nullable=True, server_default='0'))
+
+
+def downgrade() -> None:
+    for column in reversed(MATCH_COLUMNS):
+        op.drop_column('tournament_matches', column)
+
+    for column in reversed(STANDING_COLUMNS):
+        op.drop_column('tournament_standings', column)
@@ -0,0 +1,64 @@
+"""Add composite indexes for match, ball and tournament lookups
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '004'
+down_revision: Union[str, None] = '003'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Ordered ball replay and "last ball" lookups per innings
+    op.create_index('ix_ball_events_innings_over_ball', 'ball_events',
+                    ['innings_id', 'over_number', 'ball_number'])
+
+    # Innings of a match in order
+    op.create_index('ix_innings_match_number', 'innings',
+                    ['match_id', 'innings_number'])
+
+    # "My matches", newest first
+    op.create_index('ix_matches_created_by_match_date', 'matches',
+                    ['created_by', sa.text('match_date DESC')])
+
+    # Fixtures of a tournament in schedule order, and fixture by match
+    op.create_index('ix_tournament_matches_tournament_date', 'tournament_matches',
+                    ['tournament_id', 'scheduled_date'])
+    op.create_index('ix_tournament_matches_match_id', 'tournament_matches',
+                    ['match_id'])
+
+    # Tournaments and player profiles per creator
+    op.create_index('ix_tournaments_created_by', 'tournaments', ['created_by'])
+    op.create_index('ix_player_profiles_created_by_name', 'player_profiles',
+                    ['created_by', 'name'])
+
+    # One standing row per team; drop any duplicates before enforcing it
+    op.execute("""
+        DELETE FROM tournament_standings a
+        USING tournament_standings b
+        WHERE a.tournament_id = b.tournament_id
+          AND a.team_name = b.team_name
+          AND a.ctid > b.ctid
+    """)
+    op.create_unique_constraint('uq_tournament_standings_team', 'tournament_standings',
+                                ['tournament_id', 'team_name'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_tournament_standings_team', 'tournament_standings', type_='unique')
+    op.drop_index('ix_player_profiles_created_by_name', table_name='player_profiles')
+    op.drop_index('ix_tournaments_created_by', table_name='tournaments')
+    op.drop_index('ix_tournament_matches_match_id', table_name='tournament_matches')
+    op.drop_index('ix_tournament_matches_tournament_date', table_name='tournament_matches')
+    op.drop_index('ix_matches_created_by_match_date', table_name='matches')
+    op.drop_index('ix_innings_match_number', table_name='innings')
+    op.drop_index('ix_ball_events_innings_over_ball', table_name='ball_events')
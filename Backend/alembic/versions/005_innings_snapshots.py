@@ -0,0 +1,42 @@
+"""Add per-over innings snapshots for scoreboard replay
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '005'
+down_revision: Union[str, None] = '004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table('innings_snapshots',
+                    sa.Column('id', postgresql.UUID(
+                        as_uuid=True), nullable=False),
+                    sa.Column('innings_id', postgresql.UUID(
+                        as_uuid=True), nullable=False),
+                    sa.Column('over_number', sa.Integer(), nullable=False),
+                    sa.Column('total_runs', sa.Integer(), nullable=True),
+                    sa.Column('wickets', sa.Integer(), nullable=True),
+                    sa.Column('extras', sa.Integer(), nullable=True),
+                    sa.Column('legal_balls', sa.Integer(), nullable=True),
+                    sa.Column('created_at', sa.DateTime(), nullable=True),
+                    sa.ForeignKeyConstraint(
+                        ['innings_id'], ['innings.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('id'),
+                    sa.UniqueConstraint('innings_id', 'over_number',
+                                        name='uq_innings_snapshots_over')
+                    )
+
+
+def downgrade() -> None:
+    op.drop_table('innings_snapshots')
@@ -0,0 +1,145 @@
+"""Add player identities, match rosters and player keys on ball events
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '006'
+down_revision: Union[str, None] = '005'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Must match player_service.normalize_player_name
+NORMALIZED = "lower(regexp_replace(btrim({0}), '\\s+', ' ', 'g'))"
+
+
+def upgrade() -> None:
+    op.create_table('players',
+                    sa.Column('id', postgresql.UUID(
+                        as_uuid=True), nullable=False),
+                    sa.Column('created_by', postgresql.UUID(
+                        as_uuid=True), nullable=False),
+                    sa.Column('name', sa.String(length=100), nullable=False),
+                    sa.Column('normalized_name', sa.String(
+                        length=100), nullable=False),
+                    sa.Column('player_profile_id', postgresql.UUID(
+                        as_uuid=True), nullable=True),
+                    sa.Column('created_at', sa.DateTime(), nullable=True),
+                    sa.ForeignKeyConstraint(
+                        ['created_by'], ['users.id'], ondelete='CASCADE'),
+                    sa.ForeignKeyConstraint(
+                        ['player_profile_id'], ['player_profiles.id'], ondelete='SET NULL'),
+                    sa.PrimaryKeyConstraint('id'),
+                    sa.UniqueConstraint('created_by', 'normalized_name',
+                                        name='uq_players_created_by_name')
+                    )
+    op.create_index('ix_players_player_profile_id', 'players', ['player_profile_id'])
+
+    op.create_table('match_players',
+                    sa.Column('id', postgresql.UUID(
+                        as_uuid=True), nullable=False),
+                    sa.Column('match_id', postgresql.UUID(
+                        as_uuid=True), nullable=False),
+                    sa.Column('player_id', postgresql.UUID(
+                        as_uuid=True), nullable=False),
+                    sa.Column('team', sa.String(length=100), nullable=True),
+                    sa.ForeignKeyConstraint(
+                        ['match_id'], ['matches.id'], ondelete='CASCADE'),
+                    sa.ForeignKeyConstraint(
+                        ['player_id'], ['players.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('id'),
+                    sa.UniqueConstraint('match_id', 'player_id',
+                                        name='uq_match_players_player')
+                    )
+    op.create_index('ix_match_players_player_id', 'match_players', ['player_id'])
+
+    op.add_column('ball_events', sa.Column(
+        'batsman_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.add_column('ball_events', sa.Column(
+        'bowler_id', postgresql.UUID(as_uuid=True), nullable=True))
+    op.create_foreign_key('fk_ball_events_batsman_id', 'ball_events', 'players',
+                          ['batsman_id'], ['id'], ondelete='SET NULL')
+    op.create_foreign_key('fk_ball_events_bowler_id', 'ball_events', 'players',
+                          ['bowler_id'], ['id'], ondelete='SET NULL')
+
+    # Backfill: one identity per (scorer, normalized name) seen in the ball log.
+    # Ids are derived from the key so the statement needs no uuid extension.
+    # Matches without a scorer get no identities: players.created_by is required.
+    op.execute(f"""
+        INSERT INTO players (id, created_by, name, normalized_name, created_at)
+        SELECT md5(m.created_by::text || '/' || n.normalized_name)::uuid,
+               m.created_by, min(n.name), n.normalized_name, now()
+        FROM (
+            SELECT b.innings_id, b.batsman_name AS name,
+                   {NORMALIZED.format('b.batsman_name')} AS normalized_name
+            FROM ball_events b WHERE b.batsman_name IS NOT NULL
+            UNION
+            SELECT b.innings_id, b.bowler_name,
+                   {NORMALIZED.format('b.bowler_name')}
+            FROM ball_events b WHERE b.bowler_name IS NOT NULL
+        ) n
+        JOIN innings i ON i.id = n.innings_id
+        JOIN matches m ON m.id = i.match_id
+        WHERE n.normalized_name <> ''
+          AND m.created_by IS NOT NULL
+        GROUP BY m.created_by, n.normalized_name
+    """)
+
+    op.execute(f"""
+        UPDATE players p
+        SET player_profile_id = pp.id
+        FROM player_profiles pp
+        WHERE pp.created_by = p.created_by
+          AND {NORMALIZED.format('pp.name')} = p.normalized_name
+    """)
+
+    for name_column, id_column, team_column in (
+        ('batsman_name', 'batsman_id', 'batting_team'),
+        ('bowler_name', 'bowler_id', 'bowling_team'),
+    ):
+        op.execute(f"""
+            UPDATE ball_events b
+            SET {id_column} = p.id
+            FROM innings i, matches m, players p
+            WHERE i.id = b.innings_id
+              AND m.id = i.match_id
+              AND m.created_by IS NOT NULL
+              AND p.created_by = m.created_by
+              AND p.normalized_name = {NORMALIZED.format('b.' + name_column)}
+        """)
+        op.execute(f"""
+            INSERT INTO match_players (id, match_id, player_id, team)
+            SELECT md5(i.match_id::text || '/' || b.{id_column}::text)::uuid,
+                   i.match_id, b.{id_column}, min(i.{team_column})
+            FROM ball_events b
+            JOIN innings i ON i.id = b.innings_id
+            JOIN matches m ON m.id = i.match_id
+            WHERE b.{id_column} IS NOT NULL
+              AND m.created_by IS NOT NULL
+            GROUP BY i.match_id, b.{id_column}
+            ON CONFLICT (match_id, player_id) DO NOTHING
+        """)
+
+    op.create_index('ix_ball_events_batsman_id', 'ball_events', ['batsman_id'])
+    op.create_index('ix_ball_events_bowler_id', 'ball_events', ['bowler_id'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_ball_events_bowler_id', table_name='ball_events')
+    op.drop_index('ix_ball_events_batsman_id', table_name='ball_events')
+    op.drop_constraint('fk_ball_events_bowler_id', 'ball_events', type_='foreignkey')
+    op.drop_constraint('fk_ball_events_batsman_id', 'ball_events', type_='foreignkey')
+    op.drop_column('ball_events', 'bowler_id')
+    op.drop_column('ball_events', 'batsman_id')
+    op.drop_index('ix_match_players_player_id', table_name='match_players')
+    op.drop_table('match_players')
+    op.drop_index('ix_players_player_profile_id', table_name='players')
+    op.drop_table('players')
@@ -0,0 +1,112 @@
+"""Range-partition ball_events by month and add the innings archive
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from datetime import date
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = '007'
+down_revision: Union[str, None] = '006'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Partitions created past the current month; archive_service keeps this up
+MONTHS_AHEAD = 3
+
+BALL_EVENT_INDEXES = (
+    ('ix_ball_events_innings_over_ball', ['innings_id', 'over_number', 'ball_number']),
+    ('ix_ball_events_batsman_id', ['batsman_id']),
+    ('ix_ball_events_bowler_id', ['bowler_id']),
+)
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_ball_event_constraints(primary_key: list) -> None:
+    op.create_primary_key('ball_events_pkey', 'ball_events', primary_key)
+    op.create_foreign_key('ball_events_innings_id_fkey', 'ball_events', 'innings',
+                          ['innings_id'], ['id'], ondelete='CASCADE')
+    op.create_foreign_key('fk_ball_events_batsman_id', 'ball_events', 'players',
+                          ['batsman_id'], ['id'], ondelete='SET NULL')
+    op.create_foreign_key('fk_ball_events_bowler_id', 'ball_events', 'players',
+                          ['bowler_id'], ['id'], ondelete='SET NULL')
+    for name, columns in BALL_EVENT_INDEXES:
+        op.create_index(name, 'ball_events', columns)
+
+
+def upgrade() -> None:
+    op.add_column('innings', sa.Column('is_archived', sa.Boolean(),
+                                       nullable=False, server_default=sa.false()))
+    op.create_table('innings_archives',
+                    sa.Column('innings_id', postgresql.UUID(
+                        as_uuid=True), nullable=False),
+                    sa.Column('ball_count', sa.Integer(), nullable=False),
+                    sa.Column('data', sa.LargeBinary(), nullable=False),
+                    sa.Column('archived_at', sa.DateTime(), nullable=True),
+                    sa.ForeignKeyConstraint(
+                        ['innings_id'], ['innings.id'], ondelete='CASCADE'),
+                    sa.PrimaryKeyConstraint('innings_id')
+                    )
+
+    # The partition key must be part of the primary key and cannot be NULL
+    op.execute("UPDATE ball_events SET created_at = now() WHERE created_at IS NULL")
+
+    # Constraints and indexes are recreated after the copy, once the old
+    # table (and its index names) are gone
+    op.execute("ALTER TABLE ball_events RENAME TO ball_events_unpartitioned")
+    op.execute("""
+        CREATE TABLE ball_events (LIKE ball_events_unpartitioned INCLUDING DEFAULTS)
+        PARTITION BY RANGE (created_at)
+    """)
+    op.execute("ALTER TABLE ball_events ALTER COLUMN created_at SET NOT NULL")
+
+    first = op.get_bind().execute(sa.text(
+        "SELECT date_trunc('month', min(created_at))::date FROM ball_events_unpartitioned"
+    )).scalar()
+    this_month = date.today().replace(day=1)
+    month = min(first, this_month) if first else this_month
+    last = _add_months(this_month, MONTHS_AHEAD)
+    while month <= last:
+        following = _add_months(month, 1)
+        op.execute(
+            f"CREATE TABLE ball_events_y{month.year}m{month.month:02d} "
+            f"PARTITION OF ball_events "
+            f"FOR VALUES FROM ('{month.isoformat()}') TO ('{following.isoformat()}')"
+        )
+        month = following
+    op.execute("CREATE TABLE ball_events_default PARTITION OF ball_events DEFAULT")
+
+    op.execute("INSERT INTO ball_events SELECT * FROM ball_events_unpartitioned")
+    op.drop_table('ball_events_unpartitioned')
+
+    _create_ball_event_constraints(['id', 'created_at'])
+
+
+def downgrade() -> None:
+    archived = op.get_bind().execute(sa.text("SELECT count(*) FROM innings_archives")).scalar()
+    if archived:
+        raise RuntimeError(
+            f"{archived} innings are archived; run "
+            "`python -m app.services.archive_service restore --all` before downgrading")
+
+    op.execute("ALTER TABLE ball_events RENAME TO ball_events_partitioned")
+    op.execute("CREATE TABLE ball_events (LIKE ball_events_partitioned INCLUDING DEFAULTS)")
+    op.execute("ALTER TABLE ball_events ALTER COLUMN created_at DROP NOT NULL")
+    op.execute("INSERT INTO ball_events SELECT * FROM ball_events_partitioned")
+    op.drop_table('ball_events_partitioned')
+
+    _create_ball_event_constraints(['id'])
+
+    op.drop_table('innings_archives')
+    op.drop_column('innings', 'is_archived')
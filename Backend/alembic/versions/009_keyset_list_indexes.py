@@ -0,0 +1,51 @@
+"""Add keyset pagination indexes for match, tournament and player lists
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '009'
+down_revision: Union[str, None] = '008'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Row comparisons on the sort key skip NULLs, so the sort columns must be set
+    op.execute("UPDATE matches SET match_date = coalesce(created_at, now()) WHERE match_date IS NULL")
+    op.alter_column('matches', 'match_date', existing_type=sa.DateTime(), nullable=False)
+    op.execute("UPDATE tournaments SET created_at = now() WHERE created_at IS NULL")
+    op.alter_column('tournaments', 'created_at', existing_type=sa.DateTime(), nullable=False)
+    op.execute("UPDATE player_profiles SET created_at = now() WHERE created_at IS NULL")
+    op.alter_column('player_profiles', 'created_at', existing_type=sa.DateTime(), nullable=False)
+
+    # "My matches" / "my tournaments" / "my players", newest first, one page
+    # per index range scan; the id breaks ties so the cursor is exact
+    op.drop_index('ix_matches_created_by_match_date', table_name='matches')
+    op.create_index('ix_matches_created_by_match_date', 'matches',
+                    ['created_by', sa.text('match_date DESC'), sa.text('id DESC')])
+    op.drop_index('ix_tournaments_created_by', table_name='tournaments')
+    op.create_index('ix_tournaments_created_by_created_at', 'tournaments',
+                    ['created_by', sa.text('created_at DESC'), sa.text('id DESC')])
+    op.create_index('ix_player_profiles_created_by_created_at', 'player_profiles',
+                    ['created_by', sa.text('created_at DESC'), sa.text('id DESC')])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_player_profiles_created_by_created_at', table_name='player_profiles')
+    op.drop_index('ix_tournaments_created_by_created_at', table_name='tournaments')
+    op.create_index('ix_tournaments_created_by', 'tournaments', ['created_by'])
+    op.drop_index('ix_matches_created_by_match_date', table_name='matches')
+    op.create_index('ix_matches_created_by_match_date', 'matches',
+                    ['created_by', sa.text('match_date DESC')])
+
+    op.alter_column('player_profiles', 'created_at', existing_type=sa.DateTime(), nullable=True)
+    op.alter_column('tournaments', 'created_at', existing_type=sa.DateTime(), nullable=True)
+    op.alter_column('matches', 'match_date', existing_type=sa.DateTime(), nullable=True)
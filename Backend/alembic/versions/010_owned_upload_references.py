@@ -0,0 +1,33 @@
+"""Count upload references per owning profile
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '010'
+down_revision: Union[str, None] = '009'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # References used to count saves; they now count the profiles using a key
+    op.execute("""
+        UPDATE stored_files s
+        SET ref_count = (
+            SELECT count(*) FROM player_profiles p WHERE p.profile_image_url = s.key
+        ) + (
+            SELECT count(*) FROM user_profiles u WHERE u.profile_image_url = s.key
+        )
+    """)
+
+
+def downgrade() -> None:
+    # Save counts are not recoverable; owned references are a lower bound
+    pass
@@ -0,0 +1,24 @@
+"""Index innings archives by archive time for incremental exports
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-17 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '011'
+down_revision: Union[str, None] = '010'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_innings_archives_archived_at', 'innings_archives', ['archived_at'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_innings_archives_archived_at', table_name='innings_archives')
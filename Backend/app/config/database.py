@@ -2,42 +2,103 @@
 Database Configuration and Session Management
 
 Sets up SQLAlchemy engine, session, and base class for models.
+
+Two session modes are available, selected with DB_ASYNC:
+- sync (default): a pooled psycopg2 engine; ORM work runs in the threadpool
+- async: an asyncpg engine with AsyncSession; ORM work runs through
+  `AsyncSession.run_sync`, so waiting on Postgres never blocks the event loop
+
+Routes call service functions through `run_db`, which works with either mode.
 """
 
+from typing import Any, Callable, TypeVar
+
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy import create_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import sessionmaker, Session
 
 from app.config.settings import settings
 
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.DATABASE_URL,
+T = TypeVar("T")
+
+POOL_OPTIONS = dict(
     pool_pre_ping=True,  # Verify connections before using
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
     echo=settings.DEBUG,  # Log SQL queries in debug mode
 )
 
+# Create SQLAlchemy engine
+engine = create_engine(settings.DATABASE_URL, **POOL_OPTIONS)
+
 # Create SessionLocal class for database sessions
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine and session factory, only created when enabled
+async_engine = None
+AsyncSessionLocal = None
+if settings.DB_ASYNC:
+    from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker
+
+    async_engine = create_async_engine(settings.ASYNC_DATABASE_URL, **POOL_OPTIONS)
+    # Objects stay readable after commit without an implicit (blocking) refresh
+    AsyncSessionLocal = async_sessionmaker(
+        async_engine, autoflush=False, expire_on_commit=False)
+
 # Create Base class for declarative models
 Base = declarative_base()
 
 
-def get_db():
+def get_sync_db():
     """
-    Dependency function to get database session.
+    Dependency function to get a synchronous database session.
 
     Yields:
         Session: SQLAlchemy database session
-
-    Usage in FastAPI endpoints:
-        @app.get("/items")
-        def read_items(db: Session = Depends(get_db)):
-            return db.query(Item).all()
     """
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency function to get an asynchronous database session.
+
+    Yields:
+        AsyncSession: SQLAlchemy asyncio session
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Dependency function to get database session for the configured mode.
+#
+# Usage in FastAPI endpoints:
+#     @app.get("/items")
+#     async def read_items(db=Depends(get_db)):
+#         return await run_db(db, lambda session: session.query(Item).all())
+get_db = get_async_db if settings.DB_ASYNC else get_sync_db
+
+
+async def run_db(db, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run synchronous ORM code without blocking the event loop.
+
+    Args:
+        db: Session or AsyncSession from `get_db`
+        fn: Callable taking a sync Session as its first argument
+        *args: Extra positional arguments for fn
+        **kwargs: Extra keyword arguments for fn
+
+    Returns:
+        Whatever fn returns
+    """
+    if isinstance(db, Session):
+        return await run_in_threadpool(fn, db, *args, **kwargs)
+    return await db.run_sync(fn, *args, **kwargs)
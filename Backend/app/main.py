@@ -16,18 +16,25 @@ Features:
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.staticfiles import StaticFiles
-from fastapi.responses import JSONResponse
-import time
+from fastapi.responses import JSONResponse, PlainTextResponse
+import asyncio
+import logging
 import os
 from datetime import datetime
 
 from app.config.settings import settings
 from app.config.database import engine, Base
+from app.utils.file_upload import UploadStaticFiles
+from app.utils.metrics import request_metrics
+from app.utils.middleware import BodySizeLimitMiddleware, RequestContextMiddleware
+from app.utils.request_log import start_access_log, stop_access_log
+from app.utils.responses import FastJSONResponse
 
 # Import routers
-from app.routers import auth
-# from app.routers import profiles, matches, tournaments, players, statistics
+from app.routers import auth, matches, live, players, statistics, tournaments, uploads
+# from app.routers import profiles
+
+logger = logging.getLogger(__name__)
 
 # Create uploads directory if it doesn't exist
 os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
@@ -43,6 +50,7 @@ app = FastAPI(
     description="Complete backend API for Cricket Scoreboard Flutter application",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=FastJSONResponse,
 )
 
 # Configure CORS
@@ -54,30 +62,131 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Request logging middleware
+# Request timing and security headers middleware
+
+# Route templates keyed by endpoint, so metrics group /api/matches/{match_id}
+# rather than one series per match id
+route_templates = {}
+
+
+def route_template(scope: dict) -> str:
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return "unmatched"
+    if not route_templates:
+        route_templates.update({
+            getattr(route, "endpoint", None): route.path for route in app.routes})
+    return route_templates.get(endpoint, "unmatched")
+
+
+app.add_middleware(RequestContextMiddleware, route_resolver=route_template)
+
+# Cap upload bodies before Starlette spools them to disk
+app.add_middleware(
+    BodySizeLimitMiddleware,
+    max_body_size=settings.MAX_FILE_SIZE + settings.UPLOAD_REQUEST_OVERHEAD,
+    path_prefix="/api/uploads",
+)
+
+# Background guest reaper
+
+
+async def reap_guests_periodically():
+    from app.config.database import SessionLocal
+    from app.services.auth_service import reap_abandoned_guests
+    from fastapi.concurrency import run_in_threadpool
+
+    def reap():
+        db = SessionLocal()
+        try:
+            return reap_abandoned_guests(db, settings.GUEST_RETENTION_DAYS)
+        finally:
+            db.close()
 
+    while True:
+        await asyncio.sleep(settings.GUEST_REAPER_INTERVAL_MINUTES * 60)
+        try:
+            deleted = await run_in_threadpool(reap)
+            if deleted:
+                logger.info("guest_users_reaped", extra={"fields": {"deleted": deleted}})
+        except Exception:
+            logger.exception("guest_reaper_failed")
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    start_time = time.time()
 
-    response = await call_next(request)
+# Background ball event partition maintenance and archival
+
+
+async def maintain_ball_events_periodically():
+    from app.config.database import SessionLocal
+    from app.services import archive_service
+    from fastapi.concurrency import run_in_threadpool
+
+    def maintain():
+        db = SessionLocal()
+        try:
+            archive_service.ensure_partitions(db, settings.BALL_PARTITION_MONTHS_AHEAD)
+            archived = archive_service.archive_completed_matches(
+                db, settings.BALL_ARCHIVE_AFTER_DAYS)
+            archive_service.drop_empty_partitions(db, datetime.utcnow().date().replace(day=1))
+            return archived
+        finally:
+            db.close()
 
-    process_time = time.time() - start_time
-    print(f"{datetime.now()} - {request.method} {request.url.path} - Status: {response.status_code} - Time: {process_time:.2f}s")
+    while True:
+        try:
+            archived = await run_in_threadpool(maintain)
+            if archived["matches"]:
+                logger.info("ball_events_archived", extra={"fields": archived})
+        except Exception:
+            logger.exception("ball_event_maintenance_failed")
+        await asyncio.sleep(settings.BALL_MAINTENANCE_INTERVAL_MINUTES * 60)
 
-    return response
 
-# Security headers middleware
+# Background purge of uploads no profile references
 
 
-@app.middleware("http")
-async def add_security_headers(request: Request, call_next):
-    response = await call_next(request)
-    response.headers["X-Content-Type-Options"] = "nosniff"
-    response.headers["X-Frame-Options"] = "DENY"
-    response.headers["X-XSS-Protection"] = "1; mode=block"
-    return response
+async def purge_uploads_periodically():
+    from app.utils.file_upload import purge_orphaned_uploads
+    from fastapi.concurrency import run_in_threadpool
+
+    while True:
+        await asyncio.sleep(settings.UPLOAD_PURGE_INTERVAL_MINUTES * 60)
+        try:
+            purged = await run_in_threadpool(
+                purge_orphaned_uploads, settings.UPLOAD_ORPHAN_RETENTION_HOURS)
+            if purged:
+                logger.info("orphaned_uploads_purged", extra={"fields": {"purged": purged}})
+        except Exception:
+            logger.exception("upload_purge_failed")
+
+
+@app.on_event("startup")
+async def start_logging():
+    start_access_log()
+
+
+@app.on_event("shutdown")
+async def stop_logging():
+    stop_access_log()
+
+
+@app.on_event("startup")
+async def start_guest_reaper():
+    if settings.GUEST_REAPER_INTERVAL_MINUTES > 0:
+        app.state.guest_reaper = asyncio.create_task(reap_guests_periodically())
+
+
+@app.on_event("startup")
+async def start_ball_event_maintenance():
+    if settings.BALL_MAINTENANCE_INTERVAL_MINUTES > 0:
+        app.state.ball_event_maintenance = asyncio.create_task(
+            maintain_ball_events_periodically())
+
+
+@app.on_event("startup")
+async def start_upload_purge():
+    if settings.UPLOAD_PURGE_INTERVAL_MINUTES > 0:
+        app.state.upload_purge = asyncio.create_task(purge_uploads_periodically())
 
 # Health check endpoint
 
@@ -100,13 +209,47 @@ async def healthcheck():
     except Exception as e:
         db_status = f"error: {str(e)}"
 
+    from app.utils.auth import password_hash_pool
+    from app.utils.file_upload import image_worker_pool
+
     return {
         "status": "healthy",
         "database": db_status,
+        "password_hash_pool": password_hash_pool.stats(),
+        "image_worker_pool": image_worker_pool.stats(),
         "timestamp": datetime.now().isoformat(),
         "version": settings.APP_VERSION
     }
 
+# Metrics endpoint
+
+
+@app.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def metrics():
+    """
+    Per-route latency histograms and p50/p95/p99 in Prometheus text format.
+    """
+    from app.services.scoreboard_service import get_cache_stats
+    from app.utils.auth import password_hash_pool
+    from app.utils.file_upload import image_worker_pool
+    from app.utils.request_log import dropped_log_lines
+
+    cache = get_cache_stats()
+    hashing = password_hash_pool.stats()
+    images = image_worker_pool.stats()
+    return request_metrics.render_prometheus({
+        "scoreboard_cache_hits": cache["hits"],
+        "scoreboard_cache_misses": cache["misses"],
+        "scoreboard_cache_evictions": cache["evictions"],
+        "password_hash_pending": hashing["pending"],
+        "password_hash_rejected": hashing["rejected"],
+        "password_hash_failed": hashing["failed"],
+        "image_worker_pending": images["pending"],
+        "image_worker_rejected": images["rejected"],
+        "image_worker_failed": images["failed"],
+        "access_log_dropped": dropped_log_lines(),
+    })
+
 # Root endpoint
 
 
@@ -123,16 +266,19 @@ async def root():
         "healthcheck": "/healthcheck"
     }
 
-# Mount static files for uploads
-app.mount("/uploads", StaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
+# Mount static files for uploads kept on the local filesystem
+if settings.STORAGE_BACKEND == "filesystem":
+    app.mount("/uploads", UploadStaticFiles(directory=settings.UPLOAD_DIR), name="uploads")
 
 # Include routers
 app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
 # app.include_router(profiles.router, prefix="/api/profiles", tags=["Profiles"])
-# app.include_router(matches.router, prefix="/api/matches", tags=["Matches"])
-# app.include_router(tournaments.router, prefix="/api/tournaments", tags=["Tournaments"])
-# app.include_router(players.router, prefix="/api/players", tags=["Players"])
-# app.include_router(statistics.router, prefix="/api/statistics", tags=["Statistics"])
+app.include_router(matches.router, prefix="/api/matches", tags=["Matches"])
+app.include_router(live.router, prefix="/api/live", tags=["Live"])
+app.include_router(tournaments.router, prefix="/api/tournaments", tags=["Tournaments"])
+app.include_router(players.router, prefix="/api/players", tags=["Players"])
+app.include_router(statistics.router, prefix="/api/statistics", tags=["Statistics"])
+app.include_router(uploads.router, prefix="/api/uploads", tags=["Uploads"])
 
 # Global exception handler
 
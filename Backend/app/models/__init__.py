@@ -5,9 +5,10 @@ Imports all SQLAlchemy models for easy access and Alembic auto-generation.
 """
 
 from app.models.user import User, UserProfile
-from app.models.match import Match, Innings, BallEvent
+from app.models.match import Match, Innings, BallEvent, InningsSnapshot, InningsArchive
 from app.models.tournament import Tournament, TournamentMatch, TournamentStanding
-from app.models.player import PlayerProfile
+from app.models.player import PlayerProfile, Player, MatchPlayer
+from app.models.upload import StoredFile
 
 __all__ = [
     "User",
@@ -15,8 +16,13 @@ __all__ = [
     "Match",
     "Innings",
     "BallEvent",
+    "InningsSnapshot",
+    "InningsArchive",
     "Tournament",
     "TournamentMatch",
     "TournamentStanding",
     "PlayerProfile",
+    "Player",
+    "MatchPlayer",
+    "StoredFile",
 ]
@@ -4,7 +4,7 @@ Match, Innings, and BallEvent Models
 Handles cricket match data, innings tracking, and ball-by-ball events.
 """
 
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, Index, LargeBinary, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -47,7 +47,7 @@ class Match(Base):
     status = Column(String(50), default="not_started")
     winner = Column(String(100))
     result = Column(Text)
-    match_date = Column(DateTime, default=datetime.utcnow)
+    match_date = Column(DateTime, nullable=False, default=datetime.utcnow)
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow,
                         onupdate=datetime.utcnow)
@@ -59,6 +59,10 @@ class Match(Base):
     tournament_matches = relationship(
         "TournamentMatch", back_populates="match", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_matches_created_by_match_date", "created_by", match_date.desc(), id.desc()),
+    )
+
 
 class Innings(Base):
     """
@@ -75,6 +79,8 @@ class Innings(Base):
         overs_completed: Overs completed (decimal, e.g., 19.4)
         extras: Extra runs (wides, no-balls, byes, leg-byes)
         is_complete: Whether innings is complete
+        stats_applied: Whether the innings has been folded into career statistics
+        is_archived: Whether the balls were moved to an InningsArchive
     """
     __tablename__ = "innings"
 
@@ -90,18 +96,31 @@ class Innings(Base):
     overs_completed = Column(Float, default=0.0)
     extras = Column(Integer, default=0)
     is_complete = Column(Boolean, default=False)
+    stats_applied = Column(Boolean, default=False)
+    is_archived = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
     match = relationship("Match", back_populates="innings")
     ball_events = relationship(
         "BallEvent", back_populates="innings", cascade="all, delete-orphan")
+    snapshots = relationship(
+        "InningsSnapshot", back_populates="innings", cascade="all, delete-orphan")
+    archive = relationship(
+        "InningsArchive", back_populates="innings", uselist=False, cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index("ix_innings_match_number", "match_id", "innings_number"),
+    )
 
 
 class BallEvent(Base):
     """
     BallEvent model for ball-by-ball tracking.
 
+    The table is range-partitioned by month of `created_at`, which is
+    therefore part of the primary key.
+
     Attributes:
         id: Unique ball event identifier
         innings_id: Foreign key to Innings
@@ -109,6 +128,8 @@ class BallEvent(Base):
         ball_number: Ball number in the over (1-6)
         batsman_name: Name of batsman on strike
         bowler_name: Name of bowler
+        batsman_id: Foreign key to the batsman's Player identity
+        bowler_id: Foreign key to the bowler's Player identity
         runs: Runs scored off this ball
         is_wicket: Whether a wicket fell
         wicket_type: Type of dismissal (bowled, caught, lbw, etc.)
@@ -127,6 +148,10 @@ class BallEvent(Base):
     ball_number = Column(Integer, nullable=False)
     batsman_name = Column(String(100))
     bowler_name = Column(String(100))
+    batsman_id = Column(UUID(as_uuid=True), ForeignKey(
+        "players.id", ondelete="SET NULL"))
+    bowler_id = Column(UUID(as_uuid=True), ForeignKey(
+        "players.id", ondelete="SET NULL"))
     runs = Column(Integer, default=0)
     is_wicket = Column(Boolean, default=False)
     # bowled, caught, lbw, run_out, stumped, etc.
@@ -135,7 +160,80 @@ class BallEvent(Base):
     is_no_ball = Column(Boolean, default=False)
     is_bye = Column(Boolean, default=False)
     is_leg_bye = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
 
     # Relationships
     innings = relationship("Innings", back_populates="ball_events")
+
+    __table_args__ = (
+        Index("ix_ball_events_innings_over_ball",
+              "innings_id", "over_number", "ball_number"),
+        Index("ix_ball_events_batsman_id", "batsman_id"),
+        Index("ix_ball_events_bowler_id", "bowler_id"),
+    )
+
+
+class InningsSnapshot(Base):
+    """
+    InningsSnapshot model holding innings totals at the end of an over.
+
+    Replaying the scoreboard at any over.ball starts from the latest
+    snapshot before it, so at most one over of balls is replayed.
+
+    Attributes:
+        id: Unique snapshot identifier
+        innings_id: Foreign key to Innings
+        over_number: Last over included in the totals
+        total_runs: Runs after the over
+        wickets: Wickets after the over
+        extras: Extras after the over
+        legal_balls: Legal balls bowled after the over
+    """
+    __tablename__ = "innings_snapshots"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    innings_id = Column(UUID(as_uuid=True), ForeignKey(
+        "innings.id", ondelete="CASCADE"), nullable=False)
+
+    over_number = Column(Integer, nullable=False)
+    total_runs = Column(Integer, default=0)
+    wickets = Column(Integer, default=0)
+    extras = Column(Integer, default=0)
+    legal_balls = Column(Integer, default=0)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    innings = relationship("Innings", back_populates="snapshots")
+
+    __table_args__ = (
+        UniqueConstraint("innings_id", "over_number", name="uq_innings_snapshots_over"),
+    )
+
+
+class InningsArchive(Base):
+    """
+    InningsArchive model holding the packed, compressed balls of an innings.
+
+    Balls of long-completed matches are moved here from ball_events; see
+    `archive_service`.
+
+    Attributes:
+        innings_id: Primary key and foreign key to Innings
+        ball_count: Number of archived balls
+        data: zlib-compressed `PackedBallLog.to_bytes()` output
+        archived_at: When the innings was archived
+    """
+    __tablename__ = "innings_archives"
+
+    innings_id = Column(UUID(as_uuid=True), ForeignKey(
+        "innings.id", ondelete="CASCADE"), primary_key=True)
+    ball_count = Column(Integer, nullable=False)
+    data = Column(LargeBinary, nullable=False)
+    archived_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    innings = relationship("Innings", back_populates="archive")
+
+    __table_args__ = (
+        Index("ix_innings_archives_archived_at", "archived_at"),
+    )
@@ -1,10 +1,11 @@
 """
-PlayerProfile Model
+PlayerProfile, Player and MatchPlayer Models
 
-Handles player profile information and statistics.
+Handles player profile information and statistics, and the player identities
+ball events refer to.
 """
 
-from sqlalchemy import Column, String, Integer, Float, Date, Text, DateTime, ForeignKey
+from sqlalchemy import Column, String, Integer, Float, Date, Text, DateTime, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -39,6 +40,12 @@ class PlayerProfile(Base):
         five_wicket_hauls: Number of 5-wicket hauls
         highest_score: Highest individual score
         best_bowling: Best bowling figures (e.g., "5/23")
+        dismissals: Times dismissed (batting average denominator)
+        balls_faced: Legal balls faced
+        runs_conceded: Runs conceded as bowler
+        balls_bowled: Legal balls bowled
+        best_bowling_wickets: Wickets in best bowling figures
+        best_bowling_runs: Runs in best bowling figures
 
         notes: Additional notes about the player
         profile_image_url: URL to player photo
@@ -71,13 +78,86 @@ class PlayerProfile(Base):
     highest_score = Column(Integer, default=0)
     best_bowling = Column(String(20))
 
+    # Running totals the career statistics are derived from
+    dismissals = Column(Integer, default=0)
+    balls_faced = Column(Integer, default=0)
+    runs_conceded = Column(Integer, default=0)
+    balls_bowled = Column(Integer, default=0)
+    best_bowling_wickets = Column(Integer, default=0)
+    best_bowling_runs = Column(Integer, default=0)
+
     # Additional Information
     notes = Column(Text)
     profile_image_url = Column(String(500))
 
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow,
                         onupdate=datetime.utcnow)
 
     # Relationships
     creator = relationship("User", back_populates="player_profiles")
+
+    __table_args__ = (
+        Index("ix_player_profiles_created_by_name", "created_by", "name"),
+        Index("ix_player_profiles_created_by_created_at", "created_by", created_at.desc(), id.desc()),
+    )
+
+
+class Player(Base):
+    """
+    Player identity referenced by ball events.
+
+    One identity exists per scorer and normalized name, so the same player
+    keeps one key across all matches scored by the same user. It is linked
+    to the scorer's PlayerProfile of the same name when one exists.
+
+    Attributes:
+        id: Unique player identifier
+        created_by: User who scored the player's matches
+        name: Display name as first recorded
+        normalized_name: Lower-cased name with collapsed whitespace
+        player_profile_id: Matching PlayerProfile, if any
+    """
+    __tablename__ = "players"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    created_by = Column(UUID(as_uuid=True), ForeignKey(
+        "users.id", ondelete="CASCADE"), nullable=False)
+    name = Column(String(100), nullable=False)
+    normalized_name = Column(String(100), nullable=False)
+    player_profile_id = Column(UUID(as_uuid=True), ForeignKey(
+        "player_profiles.id", ondelete="SET NULL"))
+    created_at = Column(DateTime, default=datetime.utcnow)
+
+    # Relationships
+    profile = relationship("PlayerProfile")
+
+    __table_args__ = (
+        UniqueConstraint("created_by", "normalized_name", name="uq_players_created_by_name"),
+        Index("ix_players_player_profile_id", "player_profile_id"),
+    )
+
+
+class MatchPlayer(Base):
+    """
+    Roster entry mapping a player identity to a match and team.
+
+    Attributes:
+        id: Unique roster entry identifier
+        match_id: Foreign key to Match
+        player_id: Foreign key to Player
+        team: Team the player appeared for
+    """
+    __tablename__ = "match_players"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    match_id = Column(UUID(as_uuid=True), ForeignKey(
+        "matches.id", ondelete="CASCADE"), nullable=False)
+    player_id = Column(UUID(as_uuid=True), ForeignKey(
+        "players.id", ondelete="CASCADE"), nullable=False)
+    team = Column(String(100))
+
+    __table_args__ = (
+        UniqueConstraint("match_id", "player_id", name="uq_match_players_player"),
+        Index("ix_match_players_player_id", "player_id"),
+    )
@@ -4,7 +4,7 @@ Tournament, TournamentMatch, and TournamentStanding Models
 Handles tournament management, fixtures, and standings.
 """
 
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, ARRAY
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, ForeignKey, ARRAY, Index, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
@@ -33,7 +33,7 @@ class Tournament(Base):
     name = Column(String(255), nullable=False)
     format = Column(String(50), nullable=False)  # round_robin, knockout
     teams = Column(ARRAY(String), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow,
                         onupdate=datetime.utcnow)
 
@@ -44,6 +44,10 @@ class Tournament(Base):
     standings = relationship(
         "TournamentStanding", back_populates="tournament", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_tournaments_created_by_created_at", "created_by", created_at.desc(), id.desc()),
+    )
+
 
 class TournamentMatch(Base):
     """
@@ -60,6 +64,10 @@ class TournamentMatch(Base):
         winner: Winning team name
         team1_score: Team 1 final score
         team2_score: Team 2 final score
+        team1_balls: Balls team 1 faced, counted as the full quota if all out
+        team2_balls: Balls team 2 faced, counted as the full quota if all out
+        no_result: Whether the match was abandoned; its runs and balls are left
+            out of net run rate
     """
     __tablename__ = "tournament_matches"
 
@@ -76,6 +84,9 @@ class TournamentMatch(Base):
     winner = Column(String(100))
     team1_score = Column(Integer, default=0)
     team2_score = Column(Integer, default=0)
+    team1_balls = Column(Integer, default=0)
+    team2_balls = Column(Integer, default=0)
+    no_result = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
     # Relationships
@@ -83,6 +94,11 @@ class TournamentMatch(Base):
         "Tournament", back_populates="tournament_matches")
     match = relationship("Match", back_populates="tournament_matches")
 
+    __table_args__ = (
+        Index("ix_tournament_matches_tournament_date", "tournament_id", "scheduled_date"),
+        Index("ix_tournament_matches_match_id", "match_id"),
+    )
+
 
 class TournamentStanding(Base):
     """
@@ -95,8 +111,13 @@ class TournamentStanding(Base):
         played: Matches played
         won: Matches won
         lost: Matches lost
+        tied: Matches tied or without result
         points: Total points
         net_run_rate: Net run rate
+        runs_for: Runs scored across completed matches
+        balls_for: Balls faced across completed matches
+        runs_against: Runs conceded across completed matches
+        balls_against: Balls bowled across completed matches
     """
     __tablename__ = "tournament_standings"
 
@@ -108,13 +129,20 @@ class TournamentStanding(Base):
     played = Column(Integer, default=0)
     won = Column(Integer, default=0)
     lost = Column(Integer, default=0)
+    tied = Column(Integer, default=0)
     points = Column(Integer, default=0)
     net_run_rate = Column(Float, default=0.0)
 
+    # Net run rate components
+    runs_for = Column(Integer, default=0)
+    balls_for = Column(Integer, default=0)
+    runs_against = Column(Integer, default=0)
+    balls_against = Column(Integer, default=0)
+
     # Relationships
     tournament = relationship("Tournament", back_populates="standings")
 
     # Unique constraint
     __table_args__ = (
-        {'schema': None},
+        UniqueConstraint("tournament_id", "team_name", name="uq_tournament_standings_team"),
     )
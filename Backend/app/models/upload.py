@@ -0,0 +1,33 @@
+"""
+StoredFile Model
+
+Reference counts of content-addressed uploads in object storage.
+"""
+
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime
+from datetime import datetime
+
+from app.config.database import Base
+
+
+class StoredFile(Base):
+    """
+    A stored upload original and the number of references to it.
+
+    The original and its resized variants are deleted from storage when
+    the count drops to zero. Kept in the database rather than beside the
+    files so every API replica sees the same count, whatever the backend.
+
+    Attributes:
+        key: Storage key of the original, as returned by save_file
+        ref_count: Number of saves not yet deleted
+        size: Size of the original in bytes
+        content_type: MIME type of the original
+    """
+    __tablename__ = "stored_files"
+
+    key = Column(String(500), primary_key=True)
+    ref_count = Column(Integer, nullable=False, default=0)
+    size = Column(BigInteger, nullable=False)
+    content_type = Column(String(100), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
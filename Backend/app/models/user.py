@@ -80,6 +80,12 @@ class UserProfile(Base):
         five_wicket_hauls: Number of 5-wicket hauls
         highest_score: Highest individual score
         best_bowling: Best bowling figures (e.g., "5/23")
+        dismissals: Times dismissed (batting average denominator)
+        balls_faced: Legal balls faced
+        runs_conceded: Runs conceded as bowler
+        balls_bowled: Legal balls bowled
+        best_bowling_wickets: Wickets in best bowling figures
+        best_bowling_runs: Runs in best bowling figures
     """
     __tablename__ = "user_profiles"
 
@@ -112,6 +118,14 @@ class UserProfile(Base):
     highest_score = Column(Integer, default=0)
     best_bowling = Column(String(20))
 
+    # Running totals the career statistics are derived from
+    dismissals = Column(Integer, default=0)
+    balls_faced = Column(Integer, default=0)
+    runs_conceded = Column(Integer, default=0)
+    balls_bowled = Column(Integer, default=0)
+    best_bowling_wickets = Column(Integer, default=0)
+    best_bowling_runs = Column(Integer, default=0)
+
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow,
                         onupdate=datetime.utcnow)
@@ -8,7 +8,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.orm import Session
 from datetime import timedelta
 
-from app.config.database import get_db
+from app.config.database import get_db, run_db
 from app.config.settings import settings
 from app.models.user import User, UserProfile
 from app.schemas.auth import (
@@ -18,11 +18,13 @@ from app.schemas.auth import (
     UserResponse
 )
 from app.utils.auth import (
-    hash_password,
-    verify_password,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
+    create_guest_token,
     get_current_user
 )
+from app.services import auth_service
 
 router = APIRouter()
 
@@ -35,32 +37,38 @@ async def signup(request: SignupRequest, db: Session = Depends(get_db)):
     Creates a new user account with email, password, and name.
     Also creates an associated user profile.
     """
-    # Check if email already exists
-    existing_user = db.query(User).filter(
-        User.email == request.email.lower()).first()
-    if existing_user:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Email already registered"
+    password_hash = await hash_password_async(request.password)
+
+    def create_user(session: Session) -> User:
+        # Check if email already exists
+        existing_user = session.query(User).filter(
+            User.email == request.email.lower()).first()
+        if existing_user:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Email already registered"
+            )
+
+        # Create new user
+        new_user = User(
+            email=request.email.lower(),
+            password_hash=password_hash,
+            name=request.name,
+            is_guest=False,
+            is_active=True
         )
 
-    # Create new user
-    new_user = User(
-        email=request.email.lower(),
-        password_hash=hash_password(request.password),
-        name=request.name,
-        is_guest=False,
-        is_active=True
-    )
+        session.add(new_user)
+        session.commit()
+        session.refresh(new_user)
 
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+        # Create user profile
+        user_profile = UserProfile(user_id=new_user.id)
+        session.add(user_profile)
+        session.commit()
+        return new_user
 
-    # Create user profile
-    user_profile = UserProfile(user_id=new_user.id)
-    db.add(user_profile)
-    db.commit()
+    new_user = await run_db(db, create_user)
 
     # Generate access token
     access_token = create_access_token(
@@ -86,9 +94,10 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
     Authenticates user with email and password.
     """
     # Find user by email
-    user = db.query(User).filter(User.email == request.email.lower()).first()
+    user = await run_db(db, lambda session: session.query(User).filter(
+        User.email == request.email.lower()).first())
 
-    if not user or not verify_password(request.password, user.password_hash):
+    if not user or user.is_guest or not await verify_password_async(request.password, user.password_hash):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid email or password"
@@ -117,44 +126,21 @@ async def login(request: LoginRequest, db: Session = Depends(get_db)):
 
 
 @router.post("/guest", response_model=AuthResponse)
-async def guest_login(db: Session = Depends(get_db)):
+async def guest_login():
     """
     Create guest user session.
 
-    Creates a temporary guest user account.
+    Issues a signed guest token without touching the database. A guest user
+    row is only created the first time the guest stores data.
     """
-    import uuid
-    from datetime import datetime
-
-    # Create guest user
-    guest_user = User(
-        email=f"guest_{uuid.uuid4().hex[:8]}@cricket.app",
-        password_hash=hash_password(str(uuid.uuid4())),
-        name=f"Guest User",
-        is_guest=True,
-        is_active=True
-    )
-
-    db.add(guest_user)
-    db.commit()
-    db.refresh(guest_user)
-
-    # Create user profile
-    user_profile = UserProfile(user_id=guest_user.id)
-    db.add(user_profile)
-    db.commit()
-
-    # Generate access token
-    access_token = create_access_token(
-        data={"sub": str(guest_user.id)},
-        expires_delta=timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
-    )
+    guest_id, access_token = create_guest_token()
+    guest = auth_service.build_guest_principal(guest_id)
 
     return AuthResponse(
-        id=str(guest_user.id),
-        email=guest_user.email,
-        name=guest_user.name,
-        is_guest=guest_user.is_guest,
+        id=str(guest.id),
+        email=guest.email,
+        name=guest.name,
+        is_guest=True,
         access_token=access_token,
         token_type="bearer"
     )
@@ -0,0 +1,85 @@
+"""
+Live Router
+
+Pushes score updates for a match to spectators over WebSocket, with a
+Server-Sent Events fallback for clients that cannot open a socket.
+"""
+
+import asyncio
+from uuid import UUID
+
+from fastapi import APIRouter, Request, WebSocket, WebSocketDisconnect, status
+from fastapi.responses import StreamingResponse
+
+from app.config.settings import settings
+from app.services.live_service import hub
+
+router = APIRouter()
+
+
+@router.websocket("/matches/{match_id}/ws")
+async def match_websocket(websocket: WebSocket, match_id: UUID):
+    """
+    Stream score updates for a match over a WebSocket.
+
+    Clients that fall too far behind are closed with code 1013 (try again later).
+    """
+    await websocket.accept()
+    subscription = hub.subscribe(str(match_id))
+
+    async def watch_disconnect():
+        # Drain client frames so a closed socket is noticed promptly
+        try:
+            while True:
+                await websocket.receive_text()
+        except WebSocketDisconnect:
+            pass
+
+    reader = asyncio.create_task(watch_disconnect())
+    try:
+        while not reader.done():
+            try:
+                message = await subscription.get(timeout=settings.LIVE_KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                await websocket.send_text('{"type":"ping"}')
+                continue
+
+            if message is None:
+                await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+                break
+            await websocket.send_text(message)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        reader.cancel()
+        hub.unsubscribe(subscription)
+
+
+@router.get("/matches/{match_id}/events")
+async def match_event_stream(match_id: UUID, request: Request):
+    """
+    Stream score updates for a match as Server-Sent Events.
+    """
+    async def event_stream():
+        # Subscribe once streaming starts: a generator that never runs would
+        # never reach its finally block and leak the subscription
+        subscription = hub.subscribe(str(match_id))
+        try:
+            while not await request.is_disconnected():
+                try:
+                    message = await subscription.get(timeout=settings.LIVE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": ping\n\n"
+                    continue
+
+                if message is None:
+                    break
+                yield f"data: {message}\n\n"
+        finally:
+            hub.unsubscribe(subscription)
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
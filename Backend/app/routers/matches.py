@@ -0,0 +1,299 @@
+"""
+Matches Router
+
+Handles match scoring endpoints: ball-by-ball recording and innings totals.
+
+Read and scoring responses are built as plain dicts and returned as
+FastJSONResponse, skipping per-object response_model validation.
+"""
+
+from typing import List, Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db, run_db
+from app.models.user import User
+from app.models.match import Match, Innings
+from app.schemas.match import (
+    BallEventCreate,
+    BallEventBatchCreate,
+    BallEventBatchResponse,
+    BallEventResponse,
+    InningsScoreResponse,
+    InningsVerifyResponse,
+    serialize_ball_event,
+    serialize_innings
+)
+from app.schemas.pagination import PageResponse
+from app.services import (
+    analytics_service, archive_service, replay_service, scorecard_service, scoring_service, scoreboard_service,
+    statistics_service
+)
+from app.services.live_service import hub, ball_update, batch_update
+from app.utils.auth import get_current_persisted_user, get_current_user
+from app.utils.exceptions import AuthorizationError, ResourceNotFoundError
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, parse_fields
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter()
+
+# Fields of the match list, in output order
+MATCH_LIST_FIELDS = (
+    "id", "team1", "team2", "overs_per_innings", "total_players", "toss_winner",
+    "toss_decision", "status", "winner", "result", "match_date", "created_at", "updated_at",
+)
+
+
+def get_owned_innings(db: Session, match_id: UUID, innings_id: UUID, user: User) -> Innings:
+    """
+    Load an innings of a match owned by the given user.
+
+    Raises:
+        ResourceNotFoundError: If the match or innings does not exist
+        AuthorizationError: If the user did not create the match
+    """
+    match = db.query(Match).filter(Match.id == match_id).first()
+    if match is None:
+        raise ResourceNotFoundError("Match")
+    if match.created_by != user.id:
+        raise AuthorizationError("Only the match creator can score this match")
+
+    innings = db.query(Innings).filter(
+        Innings.id == innings_id, Innings.match_id == match_id).first()
+    if innings is None:
+        raise ResourceNotFoundError("Innings")
+    return innings
+
+
+@router.get("", response_model=PageResponse)
+async def list_matches(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return; all by default"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    List the current user's matches, newest match date first.
+
+    Keyset-paginated: follow `next_cursor` for further pages.
+    """
+    selected = parse_fields(fields, MATCH_LIST_FIELDS)
+
+    def load(session: Session):
+        return paginate(
+            session.query(Match).filter(Match.created_by == current_user.id),
+            Match, ("match_date", "id"), selected, cursor, limit, scope="matches")
+
+    return FastJSONResponse(await run_db(db, load))
+
+
+@router.post(
+    "/{match_id}/innings/{innings_id}/ball-events",
+    response_model=BallEventResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def add_ball_event(
+    match_id: UUID,
+    innings_id: UUID,
+    request: BallEventCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_persisted_user)
+):
+    """
+    Record a ball and update the innings totals in the same transaction.
+    """
+    def record(session: Session):
+        innings = get_owned_innings(session, match_id, innings_id, current_user)
+        ball = scoring_service.record_ball_event(session, innings.id, request)
+        scoreboard_service.invalidate_scoreboard(match_id)
+        return serialize_ball_event(ball), ball_update(innings, ball)
+
+    response, update = await run_db(db, record)
+    if hub.subscriber_count(match_id):
+        hub.publish(match_id, update)
+    return FastJSONResponse(response, status_code=status.HTTP_201_CREATED)
+
+
+@router.post(
+    "/{match_id}/innings/{innings_id}/ball-events/batch",
+    response_model=BallEventBatchResponse,
+    status_code=status.HTTP_201_CREATED
+)
+async def add_ball_events_batch(
+    match_id: UUID,
+    innings_id: UUID,
+    request: BallEventBatchCreate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_persisted_user)
+):
+    """
+    Record a burst of queued balls in one round trip.
+
+    Balls are inserted with a single multi-row insert and the innings totals
+    are updated once for the whole batch.
+    """
+    def record(session: Session):
+        innings = get_owned_innings(session, match_id, innings_id, current_user)
+        innings = scoring_service.record_ball_events_batch(
+            session, innings.id, request.balls)
+        scoreboard_service.invalidate_scoreboard(match_id)
+        return serialize_innings(innings), batch_update(innings, len(request.balls))
+
+    innings, update = await run_db(db, record)
+    if hub.subscriber_count(match_id):
+        hub.publish(match_id, update)
+
+    return FastJSONResponse(
+        {"inserted": len(request.balls), "innings": innings},
+        status_code=status.HTTP_201_CREATED
+    )
+
+
+@router.get("/{match_id}/innings/{innings_id}", response_model=InningsScoreResponse)
+async def get_innings_score(
+    match_id: UUID,
+    innings_id: UUID,
+    db: Session = Depends(get_db)
+):
+    """
+    Get the stored aggregate totals for an innings.
+    """
+    def load(session: Session):
+        innings = session.query(Innings).filter(
+            Innings.id == innings_id, Innings.match_id == match_id).first()
+        if innings is None:
+            raise ResourceNotFoundError("Innings")
+        return serialize_innings(innings)
+
+    return FastJSONResponse(await run_db(db, load))
+
+
+@router.get("/{match_id}/innings/{innings_id}/balls", response_model=List[BallEventResponse])
+async def get_innings_balls(
+    match_id: UUID,
+    innings_id: UUID,
+    db: Session = Depends(get_db)
+):
+    """
+    Get every ball of an innings in (over, ball) order, live or archived.
+    """
+    def load(session: Session):
+        innings = session.query(Innings).filter(
+            Innings.id == innings_id, Innings.match_id == match_id).first()
+        if innings is None:
+            raise ResourceNotFoundError("Innings")
+        return [serialize_ball_event(ball)
+                for ball in archive_service.load_innings_balls(session, innings)]
+
+    return FastJSONResponse(await run_db(db, load))
+
+
+@router.post("/{match_id}/innings/{innings_id}/verify", response_model=InningsVerifyResponse)
+async def verify_innings(
+    match_id: UUID,
+    innings_id: UUID,
+    rebuild: bool = False,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_persisted_user)
+):
+    """
+    Check innings totals against the ball log.
+
+    Pass `rebuild=true` to overwrite the stored totals when they have drifted.
+    """
+    def verify(session: Session):
+        innings = get_owned_innings(session, match_id, innings_id, current_user)
+        result = scoring_service.verify_innings(session, innings.id, rebuild=rebuild)
+        if result["rebuilt"]:
+            scoreboard_service.invalidate_scoreboard(match_id)
+        return result
+
+    return await run_db(db, verify)
+
+
+@router.get("/{match_id}/innings/{innings_id}/replay")
+async def replay_innings(
+    match_id: UUID,
+    innings_id: UUID,
+    over: int = Query(..., ge=0),
+    ball: int = Query(..., ge=0),
+    db: Session = Depends(get_db)
+):
+    """
+    Get the innings scoreboard as it stood after ball `over`.`ball`.
+
+    Rebuilt from the nearest per-over snapshot, replaying at most one over.
+    """
+    return FastJSONResponse(await run_db(
+        db, replay_service.get_scoreboard_at, match_id, innings_id, over, ball))
+
+
+@router.post("/{match_id}/innings/{innings_id}/complete", response_model=InningsScoreResponse)
+async def complete_innings(
+    match_id: UUID,
+    innings_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_persisted_user)
+):
+    """
+    Mark an innings as complete and fold it into players' career statistics.
+    """
+    def complete(session: Session):
+        innings = get_owned_innings(session, match_id, innings_id, current_user)
+        innings.is_complete = True
+        session.commit()
+
+        statistics_service.apply_innings_statistics(session, innings.id)
+        scoreboard_service.invalidate_scoreboard(match_id)
+
+        session.refresh(innings)
+        return serialize_innings(innings)
+
+    return FastJSONResponse(await run_db(db, complete))
+
+
+@router.get("/scoreboard-cache/stats")
+async def get_scoreboard_cache_stats():
+    """
+    Get scoreboard cache hit/miss/eviction counters.
+    """
+    return scoreboard_service.get_cache_stats()
+
+
+@router.get("/{match_id}/scoreboard")
+async def get_scoreboard(match_id: UUID, db: Session = Depends(get_db)):
+    """
+    Get the live scoreboard of a match.
+
+    Served from cache until the next ball is recorded.
+    """
+    scoreboard = scoreboard_service.get_cached_scoreboard(match_id)
+    if scoreboard is None:
+        scoreboard = await run_db(db, scoreboard_service.load_scoreboard, match_id)
+    return FastJSONResponse(scoreboard)
+
+
+@router.get("/{match_id}/scorecard")
+async def get_scorecard(match_id: UUID, db: Session = Depends(get_db)):
+    """
+    Get the full scorecard of a match: batting and bowling cards, extras
+    and fall of wickets for every innings, in a fixed number of queries.
+    """
+    return FastJSONResponse(await run_db(db, scorecard_service.get_match_scorecard, match_id))
+
+
+@router.get("/{match_id}/innings/{innings_id}/analytics")
+async def get_innings_analytics(match_id: UUID, innings_id: UUID, db: Session = Depends(get_db)):
+    """
+    Get worm, Manhattan, run-rate, partnership and bowler spell charts of an innings.
+
+    Served from cache until the next ball of the match is recorded.
+    """
+    analytics = analytics_service.get_cached_innings_analytics(match_id, innings_id)
+    if analytics is None:
+        analytics = await run_db(
+            db, analytics_service.load_innings_analytics, match_id, innings_id)
+    return FastJSONResponse(analytics)
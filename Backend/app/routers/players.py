@@ -0,0 +1,51 @@
+"""
+Players Router
+
+Lists the player profiles a user maintains.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db, run_db
+from app.models.player import PlayerProfile
+from app.models.user import User
+from app.schemas.pagination import PageResponse
+from app.utils.auth import get_current_user
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, parse_fields
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter()
+
+# Fields of the player list, in output order
+PLAYER_LIST_FIELDS = (
+    "id", "name", "role", "batting_style", "bowling_style", "date_of_birth", "team",
+    "nationality", "matches_played", "total_runs", "total_wickets", "batting_average",
+    "bowling_average", "centuries", "half_centuries", "five_wicket_hauls",
+    "highest_score", "best_bowling", "profile_image_url", "created_at", "updated_at",
+)
+
+
+@router.get("", response_model=PageResponse)
+async def list_players(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return; all by default"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    List the current user's player profiles, newest first.
+
+    Keyset-paginated: follow `next_cursor` for further pages.
+    """
+    selected = parse_fields(fields, PLAYER_LIST_FIELDS)
+
+    def load(session: Session):
+        return paginate(
+            session.query(PlayerProfile).filter(PlayerProfile.created_by == current_user.id),
+            PlayerProfile, ("created_at", "id"), selected, cursor, limit, scope="players")
+
+    return FastJSONResponse(await run_db(db, load))
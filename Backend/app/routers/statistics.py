@@ -0,0 +1,57 @@
+"""
+Statistics Router
+
+Serves precomputed career statistics for users and player profiles, and
+ball-log totals for player identities.
+"""
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db, run_db
+from app.models.player import PlayerProfile
+from app.models.user import UserProfile
+from app.services import player_service, statistics_service
+from app.utils.exceptions import ResourceNotFoundError
+
+router = APIRouter()
+
+
+@router.get("/user/{user_id}")
+async def get_user_statistics(user_id: UUID, db: Session = Depends(get_db)):
+    """
+    Get a user's career statistics.
+    """
+    def load(session: Session):
+        profile = session.query(UserProfile).filter(
+            UserProfile.user_id == user_id).first()
+        if profile is None:
+            raise ResourceNotFoundError("User profile")
+        return statistics_service.get_profile_statistics(profile)
+
+    return await run_db(db, load)
+
+
+@router.get("/player/{player_id}")
+async def get_player_statistics(player_id: UUID, db: Session = Depends(get_db)):
+    """
+    Get a player profile's career statistics.
+    """
+    def load(session: Session):
+        profile = session.query(PlayerProfile).filter(
+            PlayerProfile.id == player_id).first()
+        if profile is None:
+            raise ResourceNotFoundError("Player profile")
+        return statistics_service.get_profile_statistics(profile)
+
+    return await run_db(db, load)
+
+
+@router.get("/identity/{player_id}")
+async def get_player_identity_totals(player_id: UUID, db: Session = Depends(get_db)):
+    """
+    Get batting and bowling totals of a player identity from the ball log.
+    """
+    return await run_db(db, player_service.get_player_totals, player_id)
@@ -0,0 +1,162 @@
+"""
+Tournaments Router
+
+Handles tournament listing, results and the points table.
+"""
+
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy.orm import Session
+
+from app.config.database import get_db, run_db
+from app.models.tournament import Tournament
+from app.models.user import User
+from app.schemas.pagination import PageResponse
+from app.schemas.tournament import (
+    TournamentResultUpdate,
+    StandingResponse,
+    StandingsResponse
+)
+from app.services import analytics_service, scorecard_service, tournament_service
+from app.utils.auth import get_current_persisted_user, get_current_user
+from app.utils.exceptions import AuthorizationError, ResourceNotFoundError
+from app.utils.pagination import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE, paginate, parse_fields
+from app.utils.responses import FastJSONResponse
+
+router = APIRouter()
+
+# Fields of the tournament list, in output order
+TOURNAMENT_LIST_FIELDS = ("id", "name", "format", "teams", "created_at", "updated_at")
+
+
+def get_owned_tournament(db: Session, tournament_id: UUID, user: User) -> Tournament:
+    """
+    Load a tournament created by the given user.
+
+    Raises:
+        ResourceNotFoundError: If the tournament does not exist
+        AuthorizationError: If the user did not create the tournament
+    """
+    tournament = db.query(Tournament).filter(
+        Tournament.id == tournament_id).first()
+    if tournament is None:
+        raise ResourceNotFoundError("Tournament")
+    if tournament.created_by != user.id:
+        raise AuthorizationError("Only the tournament creator can update results")
+    return tournament
+
+
+def standings_to_response(tournament_id: UUID, standings) -> StandingsResponse:
+    return StandingsResponse(
+        tournament_id=str(tournament_id),
+        standings=[
+            StandingResponse(
+                team_name=row.team_name,
+                played=row.played or 0,
+                won=row.won or 0,
+                lost=row.lost or 0,
+                tied=row.tied or 0,
+                points=row.points or 0,
+                net_run_rate=row.net_run_rate or 0.0,
+                runs_for=row.runs_for or 0,
+                balls_for=row.balls_for or 0,
+                runs_against=row.runs_against or 0,
+                balls_against=row.balls_against or 0
+            )
+            for row in standings
+        ]
+    )
+
+
+@router.get("", response_model=PageResponse)
+async def list_tournaments(
+    cursor: Optional[str] = Query(None, description="next_cursor of the previous page"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = Query(None, description="Comma-separated fields to return; all by default"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    List the current user's tournaments, newest first.
+
+    Keyset-paginated: follow `next_cursor` for further pages.
+    """
+    selected = parse_fields(fields, TOURNAMENT_LIST_FIELDS)
+
+    def load(session: Session):
+        return paginate(
+            session.query(Tournament).filter(Tournament.created_by == current_user.id),
+            Tournament, ("created_at", "id"), selected, cursor, limit, scope="tournaments")
+
+    return FastJSONResponse(await run_db(db, load))
+
+
+@router.put("/{tournament_id}/matches/{fixture_id}/result", response_model=StandingsResponse)
+async def update_match_result(
+    tournament_id: UUID,
+    fixture_id: UUID,
+    request: TournamentResultUpdate,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_persisted_user)
+):
+    """
+    Record a fixture result and update the two teams' standings.
+
+    Re-submitting a result corrects it: the previous result is reversed first.
+    """
+    def record(session: Session):
+        get_owned_tournament(session, tournament_id, current_user)
+        tournament_service.record_match_result(session, tournament_id, fixture_id, request)
+        return standings_to_response(
+            tournament_id, tournament_service.get_standings(session, tournament_id))
+
+    return await run_db(db, record)
+
+
+@router.get("/{tournament_id}/standings", response_model=StandingsResponse)
+async def get_standings(tournament_id: UUID, db: Session = Depends(get_db)):
+    """
+    Get the tournament points table.
+    """
+    return await run_db(db, lambda session: standings_to_response(
+        tournament_id, tournament_service.get_standings(session, tournament_id)))
+
+
+@router.get("/{tournament_id}/scorecards")
+async def get_tournament_scorecards(tournament_id: UUID, db: Session = Depends(get_db)):
+    """
+    Get every fixture of a tournament with its match scorecard.
+
+    The query count is constant in the number of fixtures.
+    """
+    return FastJSONResponse(
+        await run_db(db, scorecard_service.get_tournament_scorecards, tournament_id))
+
+
+@router.get("/{tournament_id}/analytics")
+async def get_tournament_analytics(tournament_id: UUID, db: Session = Depends(get_db)):
+    """
+    Get worm, Manhattan, run-rate, partnership and bowler spell charts for
+    every innings of a tournament's scored fixtures, loaded in one batch.
+    """
+    return FastJSONResponse(
+        await run_db(db, analytics_service.get_tournament_analytics, tournament_id))
+
+
+@router.post("/{tournament_id}/standings/recompute", response_model=StandingsResponse)
+async def recompute_standings(
+    tournament_id: UUID,
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_persisted_user)
+):
+    """
+    Rebuild the whole points table from completed fixtures.
+    """
+    def recompute(session: Session):
+        get_owned_tournament(session, tournament_id, current_user)
+        return standings_to_response(
+            tournament_id, tournament_service.recompute_standings(session, tournament_id))
+
+    return await run_db(db, recompute)
@@ -0,0 +1,77 @@
+"""
+Uploads Router
+
+Stores images through the API, or presigns uploads straight to object
+storage and registers them once the client has finished.
+"""
+
+from typing import Optional
+
+from fastapi import APIRouter, Depends, File, UploadFile
+
+from app.models.user import User
+from app.schemas.upload import (
+    DirectUploadComplete,
+    DirectUploadRequest,
+    DirectUploadResponse,
+    UploadDirectory,
+    UploadResponse
+)
+from app.utils.auth import get_current_persisted_user
+from app.utils.file_upload import (
+    IMAGE_VARIANTS,
+    VARIANT_FORMATS,
+    get_file_url,
+    presign_direct_upload,
+    save_direct_upload,
+    save_file
+)
+
+router = APIRouter()
+
+
+def upload_to_response(key: str) -> UploadResponse:
+    return UploadResponse(
+        key=key,
+        url=get_file_url(key),
+        variants={
+            f"{variant}.{image_format}": get_file_url(key, variant, image_format)
+            for variant in IMAGE_VARIANTS for image_format in VARIANT_FORMATS
+        }
+    )
+
+
+@router.post("", response_model=UploadResponse)
+async def upload_image(
+    file: UploadFile = File(...),
+    directory: Optional[UploadDirectory] = None,
+    current_user: User = Depends(get_current_persisted_user)
+):
+    """
+    Upload an image through the API.
+    """
+    return upload_to_response(await save_file(file, directory))
+
+
+@router.post("/presign", response_model=DirectUploadResponse)
+async def presign_upload(
+    request: DirectUploadRequest,
+    current_user: User = Depends(get_current_persisted_user)
+):
+    """
+    Presign an upload straight to object storage.
+
+    Only available with an object storage backend.
+    """
+    return presign_direct_upload(request.filename)
+
+
+@router.post("/complete", response_model=UploadResponse)
+async def complete_upload(
+    request: DirectUploadComplete,
+    current_user: User = Depends(get_current_persisted_user)
+):
+    """
+    Register an image uploaded to a presigned URL.
+    """
+    return upload_to_response(await save_direct_upload(request.upload_id, request.directory))
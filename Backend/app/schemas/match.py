@@ -0,0 +1,152 @@
+"""
+Match Schemas
+
+Pydantic models for match, innings, and ball event requests and responses.
+"""
+
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Optional
+from datetime import datetime
+
+from app.utils.ball_log import MAX_BALL_NUMBER, MAX_OVER_NUMBER
+
+
+class BallEventCreate(BaseModel):
+    """Schema for recording a single ball."""
+    over_number: int = Field(ge=0, le=MAX_OVER_NUMBER, description="Over number (0-based)")
+    ball_number: int = Field(ge=1, le=MAX_BALL_NUMBER, description="Ball number in the over")
+    batsman_name: Optional[str] = Field(default=None, max_length=100)
+    bowler_name: Optional[str] = Field(default=None, max_length=100)
+    runs: int = Field(default=0, ge=0, le=7)
+    is_wicket: bool = False
+    wicket_type: Optional[str] = Field(default=None, max_length=50)
+    is_wide: bool = False
+    is_no_ball: bool = False
+    is_bye: bool = False
+    is_leg_bye: bool = False
+
+
+class BallEventBatchCreate(BaseModel):
+    """Schema for flushing a queue of balls recorded offline."""
+    balls: List[BallEventCreate] = Field(min_length=1, max_length=500)
+
+    @field_validator('balls')
+    @classmethod
+    def validate_ball_order(cls, v: List[BallEventCreate]) -> List[BallEventCreate]:
+        """Require balls in strictly increasing (over_number, ball_number) order."""
+        for previous, current in zip(v, v[1:]):
+            if (current.over_number, current.ball_number) <= (previous.over_number, previous.ball_number):
+                raise ValueError(
+                    f"Balls must be in increasing order: {current.over_number}.{current.ball_number} "
+                    f"follows {previous.over_number}.{previous.ball_number}")
+        return v
+
+
+class BallEventResponse(BaseModel):
+    """Schema for ball event response."""
+    id: str
+    innings_id: str
+    over_number: int
+    ball_number: int
+    batsman_name: Optional[str] = None
+    bowler_name: Optional[str] = None
+    batsman_id: Optional[str] = None
+    bowler_id: Optional[str] = None
+    runs: int
+    is_wicket: bool
+    wicket_type: Optional[str] = None
+    is_wide: bool
+    is_no_ball: bool
+    is_bye: bool
+    is_leg_bye: bool
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+def serialize_ball_event(ball) -> dict:
+    """
+    Serialize a ball in the BallEventResponse shape without validation.
+
+    For trusted database rows on the fast response path; ids and timestamps
+    are left for the orjson encoder.
+
+    Args:
+        ball: BallEvent instance or row
+
+    Returns:
+        dict: Ball event response body
+    """
+    return {
+        "id": ball.id,
+        "innings_id": ball.innings_id,
+        "over_number": ball.over_number,
+        "ball_number": ball.ball_number,
+        "batsman_name": ball.batsman_name,
+        "bowler_name": ball.bowler_name,
+        "batsman_id": ball.batsman_id,
+        "bowler_id": ball.bowler_id,
+        "runs": ball.runs or 0,
+        "is_wicket": bool(ball.is_wicket),
+        "wicket_type": ball.wicket_type,
+        "is_wide": bool(ball.is_wide),
+        "is_no_ball": bool(ball.is_no_ball),
+        "is_bye": bool(ball.is_bye),
+        "is_leg_bye": bool(ball.is_leg_bye),
+        "created_at": ball.created_at,
+    }
+
+
+class InningsScoreResponse(BaseModel):
+    """Schema for innings aggregate totals."""
+    id: str
+    match_id: str
+    innings_number: int
+    batting_team: str
+    bowling_team: str
+    total_runs: int
+    wickets: int
+    overs_completed: float
+    extras: int
+    is_complete: bool
+
+
+def serialize_innings(innings) -> dict:
+    """
+    Serialize innings totals in the InningsScoreResponse shape without validation.
+
+    Args:
+        innings: Innings instance or row
+
+    Returns:
+        dict: Innings score response body
+    """
+    return {
+        "id": innings.id,
+        "match_id": innings.match_id,
+        "innings_number": innings.innings_number,
+        "batting_team": innings.batting_team,
+        "bowling_team": innings.bowling_team,
+        "total_runs": innings.total_runs or 0,
+        "wickets": innings.wickets or 0,
+        "overs_completed": innings.overs_completed or 0.0,
+        "extras": innings.extras or 0,
+        "is_complete": bool(innings.is_complete),
+    }
+
+
+class BallEventBatchResponse(BaseModel):
+    """Schema for batch ball ingestion result."""
+    inserted: int
+    innings: InningsScoreResponse
+
+
+class InningsVerifyResponse(BaseModel):
+    """Schema for comparing stored innings aggregates against the ball log."""
+    innings_id: str
+    consistent: bool
+    snapshots_consistent: bool
+    rebuilt: bool
+    stored: dict
+    computed: dict
@@ -0,0 +1,19 @@
+"""
+Pagination Schemas
+
+Pydantic models for keyset-paginated list responses.
+"""
+
+from pydantic import BaseModel
+from typing import Any, Dict, List, Optional
+
+
+class PageResponse(BaseModel):
+    """
+    Schema for one page of a list.
+
+    Items hold only the requested fields. Pass `next_cursor` back as
+    `cursor` for the following page; it is None on the last page.
+    """
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str] = None
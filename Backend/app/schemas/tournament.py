@@ -0,0 +1,49 @@
+"""
+Tournament Schemas
+
+Pydantic models for tournament results and standings.
+"""
+
+from pydantic import BaseModel, Field
+from typing import List, Optional
+
+
+class TournamentResultUpdate(BaseModel):
+    """
+    Schema for recording a tournament match result.
+
+    Scores may be omitted when the fixture is linked to a scored match, in
+    which case they are taken from its innings; manual scores need both
+    teams' overs. Without a winner, the side with more runs wins; equal runs
+    record a tie. A `no_result` shares the tie points, needs no scores and
+    is left out of net run rate.
+    """
+    team1_score: Optional[int] = Field(default=None, ge=0)
+    team1_overs: Optional[float] = Field(default=None, ge=0)
+    team2_score: Optional[int] = Field(default=None, ge=0)
+    team2_overs: Optional[float] = Field(default=None, ge=0)
+    winner: Optional[str] = Field(
+        default=None, description="Winning team; derived from the scores when omitted")
+    no_result: bool = Field(
+        default=False, description="Match abandoned; both teams share the tie points")
+
+
+class StandingResponse(BaseModel):
+    """Schema for a team's row in the points table."""
+    team_name: str
+    played: int
+    won: int
+    lost: int
+    tied: int
+    points: int
+    net_run_rate: float
+    runs_for: int
+    balls_for: int
+    runs_against: int
+    balls_against: int
+
+
+class StandingsResponse(BaseModel):
+    """Schema for a tournament points table."""
+    tournament_id: str
+    standings: List[StandingResponse]
@@ -0,0 +1,43 @@
+"""
+Upload Schemas
+
+Pydantic models for image uploads, through the API or direct to storage.
+"""
+
+from pydantic import BaseModel, Field
+from typing import Dict, Literal, Optional
+
+# Top-level storage directories uploads may be filed under
+UploadDirectory = Literal["users", "players", "teams"]
+
+
+class UploadResponse(BaseModel):
+    """
+    Schema for a stored image.
+
+    `key` is what to persist (e.g. as a profile image); `variants` maps
+    "<variant>.<format>" to a URL, e.g. "avatar.webp".
+    """
+    key: str
+    url: str
+    variants: Dict[str, str]
+
+
+class DirectUploadRequest(BaseModel):
+    """Schema for requesting a presigned direct-to-storage upload."""
+    filename: str = Field(..., min_length=1, max_length=255)
+
+
+class DirectUploadResponse(BaseModel):
+    """Schema for a presigned upload: POST the file to `url` with `fields`."""
+    upload_id: str
+    url: str
+    fields: Dict[str, str]
+    max_size: int
+    expires_in: int
+
+
+class DirectUploadComplete(BaseModel):
+    """Schema for registering a finished direct upload."""
+    upload_id: str
+    directory: Optional[UploadDirectory] = None
@@ -0,0 +1,542 @@
+"""
+Analytics Service
+
+Vectorized innings analytics: worm chart, Manhattan (per-over) totals,
+run-rate and required-rate curves, partnerships and bowler spells. An
+innings' balls are loaded once into NumPy arrays and every chart is computed
+with array operations instead of per-ball Python loops, so a whole season
+of innings can be processed from a single query.
+
+Per-innings results are cached under the match's scoreboard version, which
+every ball write bumps, so a cached chart is never stale. Tournament pages
+use the batch path, which loads every innings of every fixture at once.
+
+Usage:
+    python -m app.services.analytics_service season --tournament-id <uuid>
+"""
+
+from typing import Dict, Iterable, List, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.match import Match, Innings, BallEvent
+from app.models.tournament import Tournament, TournamentMatch
+from app.services import archive_service
+from app.services.scoreboard_service import get_match_version
+from app.services.scoring_service import BALLS_PER_OVER
+from app.services.statistics_service import NON_BOWLER_DISMISSALS
+from app.utils.cache import create_cache_backend
+from app.utils.exceptions import ResourceNotFoundError
+
+# Global analytics cache
+analytics_cache = create_cache_backend(
+    settings.CACHE_BACKEND,
+    max_entries=settings.ANALYTICS_CACHE_MAX_ENTRIES,
+    default_ttl=settings.ANALYTICS_CACHE_TTL_SECONDS,
+)
+
+# Ball columns loaded into arrays, in InningsArrays.from_rows order
+ANALYTICS_COLUMNS = (
+    BallEvent.over_number,
+    BallEvent.ball_number,
+    BallEvent.batsman_name,
+    BallEvent.bowler_name,
+    BallEvent.runs,
+    BallEvent.is_wicket,
+    BallEvent.wicket_type,
+    BallEvent.is_wide,
+    BallEvent.is_no_ball,
+    BallEvent.is_bye,
+    BallEvent.is_leg_bye,
+)
+
+
+def _rate(runs: np.ndarray, balls: np.ndarray) -> List[Optional[float]]:
+    """Runs per over, None where no balls were bowled."""
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rates = np.round(runs * BALLS_PER_OVER / balls, 2)
+    return [None if not np.isfinite(rate) else float(rate) for rate in rates]
+
+
+class InningsArrays:
+    """
+    Column arrays for the balls of one or more innings, in bowling order.
+
+    Player names are stored as integer codes into `batsman_names` and
+    `bowler_names`. Derived per-ball arrays follow the scoring rules in
+    `scoring_service.compute_ball_delta` and the bowler attribution in
+    `statistics_service.accumulate_ball`.
+    """
+    __slots__ = (
+        "over", "ball", "runs", "wicket", "wide", "no_ball", "bye", "leg_bye",
+        "batsman", "batsman_names", "bowler", "bowler_names", "bowler_wicket",
+        "total", "extras", "legal", "bowler_runs",
+    )
+
+    def __init__(self, over, ball, runs, wicket, wide, no_ball, bye, leg_bye,
+                 batsman, batsman_names, bowler, bowler_names, bowler_wicket):
+        self.over = over
+        self.ball = ball
+        self.runs = runs
+        self.wicket = wicket
+        self.wide = wide
+        self.no_ball = no_ball
+        self.bye = bye
+        self.leg_bye = leg_bye
+        self.batsman = batsman
+        self.batsman_names = batsman_names
+        self.bowler = bowler
+        self.bowler_names = bowler_names
+        self.bowler_wicket = bowler_wicket
+
+        extra_delivery = wide | no_ball
+        byes = bye | leg_bye
+        penalty = extra_delivery.astype(np.int64)
+        self.total = runs + penalty
+        self.extras = penalty + np.where(wide | byes, runs, 0)
+        self.legal = ~extra_delivery
+        self.bowler_runs = penalty + np.where(byes, 0, runs)
+
+    @classmethod
+    def from_rows(cls, rows: List[tuple]) -> "InningsArrays":
+        """
+        Build arrays from rows of ANALYTICS_COLUMNS.
+
+        Args:
+            rows: Ball rows in (over, ball) order
+
+        Returns:
+            InningsArrays: Column arrays for the rows
+        """
+        if rows:
+            columns = list(zip(*rows))
+        else:
+            columns = [()] * len(ANALYTICS_COLUMNS)
+
+        def ints(values):
+            return np.array([value or 0 for value in values], dtype=np.int64)
+
+        def flags(values):
+            return np.array([bool(value) for value in values], dtype=bool)
+
+        def codes(values):
+            names, inverse = np.unique(
+                np.array([value or "" for value in values], dtype=object), return_inverse=True)
+            return inverse.astype(np.int64), names
+
+        batsman, batsman_names = codes(columns[2])
+        bowler, bowler_names = codes(columns[3])
+        wicket = flags(columns[5])
+        wicket_types = np.array([value or "" for value in columns[6]], dtype=object)
+        bowler_wicket = wicket & ~np.isin(wicket_types, list(NON_BOWLER_DISMISSALS))
+
+        return cls(
+            over=ints(columns[0]),
+            ball=ints(columns[1]),
+            runs=ints(columns[4]),
+            wicket=wicket,
+            wide=flags(columns[7]),
+            no_ball=flags(columns[8]),
+            bye=flags(columns[9]),
+            leg_bye=flags(columns[10]),
+            batsman=batsman,
+            batsman_names=batsman_names,
+            bowler=bowler,
+            bowler_names=bowler_names,
+            bowler_wicket=bowler_wicket,
+        )
+
+    def slice(self, start: int, stop: int) -> "InningsArrays":
+        """View of a contiguous range of balls, sharing the name tables."""
+        part = object.__new__(InningsArrays)
+        for name in self.__slots__:
+            value = getattr(self, name)
+            if name not in ("batsman_names", "bowler_names"):
+                value = value[start:stop]
+            setattr(part, name, value)
+        return part
+
+    def __len__(self) -> int:
+        return len(self.over)
+
+
+def worm(balls: InningsArrays) -> dict:
+    """
+    Cumulative runs and wickets after every delivery.
+
+    Returns:
+        dict: Parallel lists of legal balls bowled, runs and wickets
+    """
+    return {
+        "balls": np.cumsum(balls.legal).tolist(),
+        "runs": np.cumsum(balls.total).tolist(),
+        "wickets": np.cumsum(balls.wicket).tolist(),
+    }
+
+
+def manhattan(balls: InningsArrays) -> dict:
+    """
+    Runs, extras and wickets per over.
+
+    Returns:
+        dict: Parallel per-over lists indexed by over number
+    """
+    overs = int(balls.over.max()) + 1 if len(balls) else 0
+    return {
+        "overs": list(range(overs)),
+        "runs": np.bincount(balls.over, weights=balls.total, minlength=overs).astype(int).tolist(),
+        "extras": np.bincount(balls.over, weights=balls.extras, minlength=overs).astype(int).tolist(),
+        "wickets": np.bincount(balls.over, weights=balls.wicket, minlength=overs).astype(int).tolist(),
+    }
+
+
+def run_rates(balls: InningsArrays, target: Optional[int] = None,
+              max_overs: Optional[int] = None) -> dict:
+    """
+    Run rate, and required rate when chasing, at the end of each over.
+
+    Args:
+        balls: Innings balls
+        target: Runs needed to win, for a chasing innings
+        max_overs: Overs per innings, needed for the required rate
+
+    Returns:
+        dict: Per-over lists of cumulative runs, run rate and required rate
+    """
+    overs = int(balls.over.max()) + 1 if len(balls) else 0
+    runs = np.cumsum(np.bincount(balls.over, weights=balls.total, minlength=overs))
+    legal = np.cumsum(np.bincount(balls.over, weights=balls.legal, minlength=overs))
+
+    result = {
+        "overs": list(range(overs)),
+        "runs": runs.astype(int).tolist(),
+        "run_rate": _rate(runs, legal),
+        "required_rate": None,
+    }
+    if target is not None and max_overs:
+        remaining_runs = np.maximum(target - runs, 0)
+        remaining_balls = np.maximum(max_overs * BALLS_PER_OVER - legal, 0)
+        result["required_rate"] = _rate(remaining_runs, remaining_balls)
+    return result
+
+
+def partnerships(balls: InningsArrays) -> List[dict]:
+    """
+    Runs and balls for each partnership, split at the fall of each wicket.
+
+    The ball on which a wicket falls belongs to the partnership it ends.
+
+    Returns:
+        List[dict]: Partnerships in batting order
+    """
+    if not len(balls):
+        return []
+
+    wicket = balls.wicket.astype(np.int64)
+    index = np.cumsum(wicket) - wicket
+    count = int(index[-1]) + 1
+
+    runs = np.bincount(index, weights=balls.total, minlength=count).astype(int)
+    legal = np.bincount(index, weights=balls.legal, minlength=count).astype(int)
+    ended = np.bincount(index, weights=wicket, minlength=count) > 0
+
+    # Distinct (partnership, striker) pairs, in order of first appearance
+    pairs = index * len(balls.batsman_names) + balls.batsman
+    _, first = np.unique(pairs, return_index=True)
+    first.sort()
+    batsmen: List[List[str]] = [[] for _ in range(count)]
+    for position in first:
+        name = balls.batsman_names[balls.batsman[position]]
+        if name:
+            batsmen[index[position]].append(name)
+
+    return [
+        {
+            "wicket": number + 1,
+            "runs": int(runs[number]),
+            "balls": int(legal[number]),
+            "batsmen": batsmen[number],
+            "unbroken": not bool(ended[number]),
+        }
+        for number in range(count)
+    ]
+
+
+def bowler_spells(balls: InningsArrays) -> List[dict]:
+    """
+    Group each bowler's overs into spells.
+
+    An over belongs to the bowler of its first ball. A spell is a run of
+    overs bowled from the same end, i.e. every other over without a break.
+
+    Returns:
+        List[dict]: Spells ordered by their first over
+    """
+    if not len(balls):
+        return []
+
+    starts = np.flatnonzero(np.r_[True, balls.over[1:] != balls.over[:-1]])
+    over_number = balls.over[starts]
+    over_bowler = balls.bowler[starts]
+    over_runs = np.add.reduceat(balls.bowler_runs, starts)
+    over_legal = np.add.reduceat(balls.legal.astype(np.int64), starts)
+    over_wickets = np.add.reduceat(balls.bowler_wicket.astype(np.int64), starts)
+
+    order = np.lexsort((over_number, over_bowler))
+    bowler = over_bowler[order]
+    number = over_number[order]
+    new_spell = np.r_[True, (bowler[1:] != bowler[:-1]) | (np.diff(number) != 2)]
+    spell = np.cumsum(new_spell) - 1
+    count = int(spell[-1]) + 1
+
+    runs = np.bincount(spell, weights=over_runs[order], minlength=count).astype(int)
+    legal = np.bincount(spell, weights=over_legal[order], minlength=count).astype(int)
+    wickets = np.bincount(spell, weights=over_wickets[order], minlength=count).astype(int)
+    first_over = number[new_spell]
+    last_over = np.r_[number[np.flatnonzero(new_spell)[1:] - 1], number[-1]]
+    spell_bowler = bowler[new_spell]
+
+    return [
+        {
+            "bowler": balls.bowler_names[spell_bowler[i]] or None,
+            "first_over": int(first_over[i]),
+            "last_over": int(last_over[i]),
+            "overs": f"{legal[i] // BALLS_PER_OVER}.{legal[i] % BALLS_PER_OVER}",
+            "runs": int(runs[i]),
+            "wickets": int(wickets[i]),
+        }
+        for i in np.argsort(first_over, kind="stable")
+    ]
+
+
+def compute_innings_analytics(balls: InningsArrays, target: Optional[int] = None,
+                              max_overs: Optional[int] = None) -> dict:
+    """
+    Compute every chart for one innings.
+
+    Args:
+        balls: Innings balls
+        target: Runs needed to win, for a chasing innings
+        max_overs: Overs per innings
+
+    Returns:
+        dict: worm, manhattan, run_rates, partnerships and spells
+    """
+    return {
+        "worm": worm(balls),
+        "manhattan": manhattan(balls),
+        "run_rates": run_rates(balls, target, max_overs),
+        "partnerships": partnerships(balls),
+        "spells": bowler_spells(balls),
+    }
+
+
+def _chase_target(innings: Innings, innings_list: Iterable[Innings]) -> Optional[int]:
+    """Target for a second innings: the first innings total plus one."""
+    if innings.innings_number != 2:
+        return None
+    for other in innings_list:
+        if other.innings_number == 1:
+            return (other.total_runs or 0) + 1
+    return None
+
+
+def _archived_rows(db: Session, innings: Innings) -> List[tuple]:
+    """ANALYTICS_COLUMNS rows of an archived innings."""
+    return [
+        tuple(getattr(ball, column.key) for column in ANALYTICS_COLUMNS)
+        for ball in archive_service.load_innings_balls(db, innings)
+    ]
+
+
+def _analytics_key(innings_id, version: int) -> str:
+    return f"analytics:{innings_id}:{version}"
+
+
+def get_cached_innings_analytics(match_id, innings_id) -> Optional[dict]:
+    """
+    Get cached analytics of an innings at the match's current version.
+
+    Returns:
+        Optional[dict]: Analytics, or None on cache miss
+    """
+    return analytics_cache.get(_analytics_key(innings_id, get_match_version(match_id)))
+
+
+def load_innings_analytics(db: Session, match_id: UUID, innings_id: UUID) -> dict:
+    """
+    Compute an innings' analytics from its balls and cache the result.
+
+    Args:
+        db: Database session
+        match_id: Match identifier
+        innings_id: Innings identifier
+
+    Returns:
+        dict: Innings analytics including the version they were built at
+
+    Raises:
+        ResourceNotFoundError: If the match or innings does not exist
+    """
+    version = get_match_version(match_id)
+
+    match = db.query(Match).filter(Match.id == match_id).first()
+    if match is None:
+        raise ResourceNotFoundError("Match")
+    innings_list = db.query(Innings).filter(Innings.match_id == match_id).all()
+    innings = next((i for i in innings_list if i.id == innings_id), None)
+    if innings is None:
+        raise ResourceNotFoundError("Innings")
+
+    if innings.is_archived:
+        rows = _archived_rows(db, innings)
+    else:
+        rows = db.query(*ANALYTICS_COLUMNS).filter(
+            BallEvent.innings_id == innings_id
+        ).order_by(BallEvent.over_number, BallEvent.ball_number).all()
+
+    analytics = compute_innings_analytics(
+        InningsArrays.from_rows(rows),
+        target=_chase_target(innings, innings_list),
+        max_overs=match.overs_per_innings,
+    )
+    analytics.update({
+        "innings_id": str(innings.id),
+        "innings_number": innings.innings_number,
+        "version": version,
+    })
+    analytics_cache.set(_analytics_key(innings_id, version), analytics)
+    return analytics
+
+
+def compute_matches_analytics(db: Session, match_ids: List[UUID]) -> Dict[str, dict]:
+    """
+    Compute analytics for every innings of many matches, e.g. a season.
+
+    All balls are fetched in one query and converted to arrays once; each
+    innings is then a slice of those arrays. Results are not cached.
+
+    Args:
+        db: Database session
+        match_ids: Match identifiers
+
+    Returns:
+        Dict[str, dict]: Analytics keyed by innings id
+    """
+    if not match_ids:
+        return {}
+
+    matches = {
+        match.id: match
+        for match in db.query(Match).filter(Match.id.in_(match_ids)).all()
+    }
+    innings_by_match: Dict[UUID, List[Innings]] = {}
+    innings_by_id: Dict[UUID, Innings] = {}
+    for innings in db.query(Innings).filter(Innings.match_id.in_(match_ids)).all():
+        innings_by_match.setdefault(innings.match_id, []).append(innings)
+        innings_by_id[innings.id] = innings
+    if not innings_by_id:
+        return {}
+
+    live_ids = [i.id for i in innings_by_id.values() if not i.is_archived]
+    rows = db.query(BallEvent.innings_id, *ANALYTICS_COLUMNS).filter(
+        BallEvent.innings_id.in_(live_ids)
+    ).order_by(BallEvent.innings_id, BallEvent.over_number, BallEvent.ball_number).all()
+    for innings in innings_by_id.values():
+        if innings.is_archived:
+            rows.extend((innings.id, *row) for row in _archived_rows(db, innings))
+    if not rows:
+        return {}
+
+    innings_ids = np.array([row[0] for row in rows], dtype=object)
+    balls = InningsArrays.from_rows([tuple(row[1:]) for row in rows])
+    boundaries = np.r_[0, np.flatnonzero(innings_ids[1:] != innings_ids[:-1]) + 1, len(rows)]
+
+    results = {}
+    for start, stop in zip(boundaries[:-1], boundaries[1:]):
+        innings = innings_by_id[innings_ids[start]]
+        match = matches[innings.match_id]
+        analytics = compute_innings_analytics(
+            balls.slice(start, stop),
+            target=_chase_target(innings, innings_by_match[innings.match_id]),
+            max_overs=match.overs_per_innings,
+        )
+        analytics.update({
+            "innings_id": str(innings.id),
+            "match_id": str(match.id),
+            "innings_number": innings.innings_number,
+        })
+        results[str(innings.id)] = analytics
+    return results
+
+
+def get_tournament_analytics(db: Session, tournament_id: UUID) -> dict:
+    """
+    Compute analytics for every innings of a tournament's scored fixtures.
+
+    Uses the batch path, so the ball query count does not grow with the
+    number of fixtures. Results are not cached.
+
+    Args:
+        db: Database session
+        tournament_id: Tournament identifier
+
+    Returns:
+        dict: Tournament id and analytics keyed by innings id
+
+    Raises:
+        ResourceNotFoundError: If the tournament does not exist
+    """
+    if db.query(Tournament.id).filter(Tournament.id == tournament_id).first() is None:
+        raise ResourceNotFoundError("Tournament")
+
+    match_ids = [row[0] for row in db.query(TournamentMatch.match_id).filter(
+        TournamentMatch.tournament_id == tournament_id,
+        TournamentMatch.match_id.isnot(None))]
+    return {
+        "tournament_id": str(tournament_id),
+        "innings": compute_matches_analytics(db, match_ids),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import time
+
+    from app.config.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Season analytics")
+    parser.add_argument("command", choices=["season"])
+    parser.add_argument("--tournament-id", type=UUID, required=True)
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per path; the best is reported")
+    args = parser.parse_args()
+
+    def best_ms(load) -> float:
+        timings = []
+        for _ in range(args.repeat):
+            start = time.perf_counter()
+            load()
+            timings.append(time.perf_counter() - start)
+        return round(min(timings) * 1000, 1)
+
+    session = SessionLocal()
+    try:
+        season = get_tournament_analytics(session, args.tournament_id)
+        # The same innings one by one, as the per-innings endpoint loads them
+        innings_rows = session.query(Innings.match_id, Innings.id).filter(
+            Innings.id.in_([UUID(innings_id) for innings_id in season["innings"]])).all()
+
+        def load_one_by_one():
+            for match_id, innings_id in innings_rows:
+                load_innings_analytics(session, match_id, innings_id)
+
+        print({
+            "innings": len(season["innings"]),
+            "batch_ms": best_ms(lambda: get_tournament_analytics(session, args.tournament_id)),
+            "per_innings_ms": best_ms(load_one_by_one),
+        })
+    finally:
+        session.close()
@@ -0,0 +1,346 @@
+"""
+Archive Service
+
+Maintains the ball_events partitions and the cold archive tier.
+
+ball_events is range-partitioned by month of created_at. Partitions are
+created ahead of time; months whose partition has been emptied by archival
+are dropped, which is far cheaper for vacuum and backups than deleting rows
+from one huge table.
+
+Balls of matches that are complete, folded into career statistics and idle
+for a retention period are packed with `PackedBallLog`, zlib-compressed and
+stored as one InningsArchive row per innings, then deleted from ball_events.
+Readers go through `load_innings_balls`, which serves either tier, so replay,
+scoreboards, analytics and statistics work the same for archived innings.
+
+Usage:
+    python -m app.services.archive_service partitions
+    python -m app.services.archive_service archive --older-than-days 30
+    python -m app.services.archive_service restore --all
+"""
+
+import re
+import zlib
+from datetime import date, datetime, timedelta
+from typing import Iterator, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import exists, insert, text
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.match import Match, Innings, BallEvent, InningsArchive
+from app.utils.ball_log import NameTable, PackedBallLog
+
+PARTITION_NAME = re.compile(r"^ball_events_y(\d{4})m(\d{2})$")
+
+# Column names of a BallEvent row, used when restoring archived balls
+BALL_EVENT_COLUMNS = [column.name for column in BallEvent.__table__.columns]
+
+
+def _add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    """Name of the ball_events partition holding a month."""
+    return f"ball_events_y{month.year}m{month.month:02d}"
+
+
+def ensure_partitions(db: Session, months_ahead: int) -> List[str]:
+    """
+    Create monthly ball_events partitions up to `months_ahead` months from now.
+
+    Partitions must exist before their month starts; balls that arrive for a
+    month without a partition land in ball_events_default.
+
+    Args:
+        db: Database session
+        months_ahead: Months past the current one to create
+
+    Returns:
+        List[str]: Names of the partitions created
+    """
+    existing = {
+        row[0] for row in db.execute(text("""
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'ball_events'::regclass
+        """))
+    }
+
+    created = []
+    month = date.today().replace(day=1)
+    for _ in range(months_ahead + 1):
+        following = _add_months(month, 1)
+        name = partition_name(month)
+        if name not in existing:
+            db.execute(text(
+                f"CREATE TABLE {name} PARTITION OF ball_events "
+                f"FOR VALUES FROM ('{month.isoformat()}') TO ('{following.isoformat()}')"
+            ))
+            created.append(name)
+        month = following
+    db.commit()
+    return created
+
+
+def drop_empty_partitions(db: Session, before: date) -> List[str]:
+    """
+    Drop monthly partitions that ended before `before` and hold no rows.
+
+    Args:
+        db: Database session
+        before: Only partitions for months entirely before this date are dropped
+
+    Returns:
+        List[str]: Names of the partitions dropped
+    """
+    names = [
+        row[0] for row in db.execute(text("""
+            SELECT c.relname FROM pg_inherits i
+            JOIN pg_class c ON c.oid = i.inhrelid
+            WHERE i.inhparent = 'ball_events'::regclass
+        """))
+    ]
+
+    dropped = []
+    for name in sorted(names):
+        match = PARTITION_NAME.match(name)
+        if match is None:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if _add_months(month, 1) > before:
+            continue
+        if db.execute(text(f"SELECT EXISTS (SELECT 1 FROM {name})")).scalar():
+            continue
+        db.execute(text(f"ALTER TABLE ball_events DETACH PARTITION {name}"))
+        db.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    db.commit()
+    return dropped
+
+
+def unpack_archive(archive: InningsArchive, names: Optional[NameTable] = None) -> PackedBallLog:
+    """
+    Decompress an archived innings into a packed ball log.
+
+    Args:
+        archive: InningsArchive row
+        names: Name table to intern into; a new one by default
+
+    Returns:
+        PackedBallLog: The innings' balls in (over, ball) order
+    """
+    return PackedBallLog.from_bytes(
+        archive.innings_id, zlib.decompress(archive.data), names or NameTable())
+
+
+def load_innings_balls(db: Session, innings: Innings) -> List[BallEvent]:
+    """
+    Load an innings' balls in (over, ball) order from whichever tier holds them.
+
+    Archived balls are returned as transient BallEvent instances.
+
+    Args:
+        db: Database session
+        innings: Innings whose balls to load
+
+    Returns:
+        List[BallEvent]: The innings' balls
+    """
+    if innings.is_archived:
+        archive = db.query(InningsArchive).filter(
+            InningsArchive.innings_id == innings.id).first()
+        return unpack_archive(archive).to_ball_events() if archive else []
+
+    return db.query(BallEvent).filter(
+        BallEvent.innings_id == innings.id
+    ).order_by(BallEvent.over_number, BallEvent.ball_number).all()
+
+
+def iter_archived_balls(db: Session, complete_only: bool = True) -> Iterator[Tuple[UUID, UUID, UUID, BallEvent]]:
+    """
+    Stream archived balls in match/innings order.
+
+    Only one archive is decompressed at a time.
+
+    Args:
+        db: Database session
+        complete_only: Only include completed innings
+
+    Yields:
+        tuple: (match id, match creator, innings id, transient BallEvent)
+    """
+    query = db.query(Match.id, Match.created_by, InningsArchive).join(
+        Innings, Innings.id == InningsArchive.innings_id
+    ).join(
+        Match, Match.id == Innings.match_id
+    )
+    if complete_only:
+        query = query.filter(Innings.is_complete == True)  # noqa: E712
+    query = query.order_by(Match.id, Innings.innings_number)
+
+    names = NameTable()
+    for match_id, created_by, archive in query.yield_per(100):
+        for ball in unpack_archive(archive, names):
+            yield match_id, created_by, archive.innings_id, ball
+
+
+def archive_match(db: Session, match_id: UUID) -> int:
+    """
+    Move all balls of a match into per-innings archives in one transaction.
+
+    The match row is locked with SKIP LOCKED, so concurrent archivers never
+    process the same match. The innings rows are locked too, the lock ball
+    writes take, and the match is skipped unless every innings is complete.
+
+    Args:
+        db: Database session
+        match_id: Match identifier
+
+    Returns:
+        int: Number of balls archived (0 if the match was locked, incomplete or
+            already archived)
+    """
+    match = db.query(Match).filter(Match.id == match_id).with_for_update(skip_locked=True).first()
+    if match is None:
+        db.rollback()
+        return 0
+
+    innings_list = db.query(Innings).filter(
+        Innings.match_id == match_id).order_by(Innings.id).with_for_update().all()
+    if not all(innings.is_complete for innings in innings_list):
+        db.rollback()
+        return 0
+
+    archived = 0
+    for innings in innings_list:
+        if innings.is_archived:
+            continue
+        balls = load_innings_balls(db, innings)
+        log = PackedBallLog.from_ball_events(innings.id, balls, NameTable())
+        db.add(InningsArchive(
+            innings_id=innings.id,
+            ball_count=len(log),
+            data=zlib.compress(log.to_bytes(), 9),
+        ))
+        db.query(BallEvent).filter(
+            BallEvent.innings_id == innings.id).delete(synchronize_session=False)
+        innings.is_archived = True
+        archived += len(log)
+
+    db.commit()
+    return archived
+
+
+def archive_completed_matches(db: Session, older_than_days: int, batch_size: int = 100) -> dict:
+    """
+    Archive every match that is complete, statistics-applied and idle.
+
+    A match qualifies when it has innings, all of them are complete and
+    folded into career statistics, at least one is not yet archived, and the
+    match has not been updated for `older_than_days`.
+
+    Args:
+        db: Database session
+        older_than_days: Days since the match was last updated
+        batch_size: Matches selected per query
+
+    Returns:
+        dict: Counts of matches and balls archived
+    """
+    cutoff = datetime.utcnow() - timedelta(days=older_than_days)
+    unfinished = exists().where(
+        Innings.match_id == Match.id,
+        Innings.is_complete.isnot(True) | Innings.stats_applied.isnot(True)
+    )
+    unarchived = exists().where(
+        Innings.match_id == Match.id,
+        Innings.is_archived == False  # noqa: E712
+    )
+
+    matches = balls = 0
+    last_id = None
+    while True:
+        query = db.query(Match.id).filter(
+            Match.updated_at < cutoff, ~unfinished, unarchived)
+        if last_id is not None:
+            query = query.filter(Match.id > last_id)
+        batch = [row[0] for row in query.order_by(Match.id).limit(batch_size).all()]
+        db.rollback()
+        if not batch:
+            return {"matches": matches, "balls": balls}
+
+        for match_id in batch:
+            archived = archive_match(db, match_id)
+            if archived:
+                matches += 1
+                balls += archived
+        last_id = batch[-1]
+
+
+def restore_innings(db: Session, innings_id: UUID) -> int:
+    """
+    Move an archived innings' balls back into ball_events.
+
+    Args:
+        db: Database session
+        innings_id: Innings identifier
+
+    Returns:
+        int: Number of balls restored
+    """
+    archive = db.query(InningsArchive).filter(
+        InningsArchive.innings_id == innings_id).with_for_update().first()
+    if archive is None:
+        db.rollback()
+        return 0
+
+    balls = unpack_archive(archive).to_ball_events()
+    if balls:
+        db.execute(insert(BallEvent), [
+            {column: getattr(ball, column) for column in BALL_EVENT_COLUMNS}
+            for ball in balls
+        ])
+    db.query(Innings).filter(Innings.id == innings_id).update(
+        {Innings.is_archived: False}, synchronize_session=False)
+    db.delete(archive)
+    db.commit()
+    return len(balls)
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.config.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Ball event partitions and archive")
+    parser.add_argument("command", choices=["partitions", "archive", "restore"])
+    parser.add_argument("--older-than-days", type=int, default=settings.BALL_ARCHIVE_AFTER_DAYS)
+    parser.add_argument("--months-ahead", type=int, default=settings.BALL_PARTITION_MONTHS_AHEAD)
+    parser.add_argument("--innings-id", type=UUID)
+    parser.add_argument("--all", action="store_true", help="Restore every archived innings")
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        if args.command == "partitions":
+            print({
+                "created": ensure_partitions(session, args.months_ahead),
+                "dropped": drop_empty_partitions(session, date.today().replace(day=1)),
+            })
+        elif args.command == "archive":
+            print(archive_completed_matches(session, args.older_than_days))
+        else:
+            if args.all:
+                innings_ids = [row[0] for row in session.query(InningsArchive.innings_id).all()]
+            elif args.innings_id:
+                innings_ids = [args.innings_id]
+            else:
+                parser.error("restore needs --innings-id or --all")
+            print({"restored": sum(restore_innings(session, i) for i in innings_ids)})
+    finally:
+        session.close()
@@ -0,0 +1,158 @@
+"""
+Authentication Service
+
+Guest session support. Guests get a signed, stateless token and no database
+row; a row is only created, in a single transaction, the first time a guest
+writes data. Abandoned guest rows are removed in bulk by a periodic reaper.
+
+Usage:
+    python -m app.services.auth_service reap-guests
+"""
+
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import delete, exists, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.match import Match
+from app.models.player import PlayerProfile
+from app.models.tournament import Tournament
+from app.models.user import User, UserProfile
+
+GUEST_NAME = "Guest User"
+
+# Stored in place of a bcrypt hash for accounts that can never log in
+UNUSABLE_PASSWORD = "!"
+
+
+def guest_email(guest_id: uuid.UUID) -> str:
+    """Placeholder email for a guest id."""
+    return f"guest_{guest_id.hex}@cricket.app"
+
+
+def new_guest_id() -> uuid.UUID:
+    """Allocate an id for a new guest session."""
+    return uuid.uuid4()
+
+
+def build_guest_principal(guest_id: uuid.UUID, issued_at: Optional[datetime] = None) -> User:
+    """
+    Build an unsaved User representing a guest from its token.
+
+    Args:
+        guest_id: Guest identifier from the token subject
+        issued_at: When the guest token was issued
+
+    Returns:
+        User: Transient user instance (not attached to any session)
+    """
+    return User(
+        id=guest_id,
+        email=guest_email(guest_id),
+        password_hash=UNUSABLE_PASSWORD,
+        name=GUEST_NAME,
+        is_guest=True,
+        is_active=True,
+        created_at=issued_at or datetime.utcnow()
+    )
+
+
+def ensure_guest_user(db: Session, principal: User) -> User:
+    """
+    Get or lazily create the database row for a guest principal.
+
+    The user and its profile are inserted in one transaction.
+
+    Args:
+        db: Database session
+        principal: Guest principal from `build_guest_principal`
+
+    Returns:
+        User: Persisted guest user
+    """
+    user = db.query(User).filter(User.id == principal.id).first()
+    if user is not None:
+        return user
+
+    user = User(
+        id=principal.id,
+        email=principal.email,
+        password_hash=UNUSABLE_PASSWORD,
+        name=principal.name,
+        is_guest=True,
+        is_active=True,
+        created_at=principal.created_at
+    )
+    user.profile = UserProfile()
+    db.add(user)
+    try:
+        db.commit()
+    except IntegrityError:
+        # A concurrent request for the same guest created it first
+        db.rollback()
+        user = db.query(User).filter(User.id == principal.id).one()
+    return user
+
+
+def reap_abandoned_guests(db: Session, retention_days: int, batch_size: int = 1000) -> int:
+    """
+    Delete guest users inactive for longer than the retention period.
+
+    Guests that still own matches, tournaments or player profiles are kept.
+    Rows are deleted in batches so each statement stays short, and each
+    deleted user is dropped from the principal cache, since the bulk delete
+    bypasses the ORM hooks that would otherwise do it.
+
+    Args:
+        db: Database session
+        retention_days: Days since last update after which a guest is abandoned
+        batch_size: Rows deleted per statement
+
+    Returns:
+        int: Number of guest users deleted
+    """
+    # app.utils.auth imports this module, so import it when first needed
+    from app.utils.auth import invalidate_user
+
+    cutoff = datetime.utcnow() - timedelta(days=retention_days)
+    candidates = select(User.id).where(
+        User.is_guest == True,  # noqa: E712
+        User.updated_at < cutoff,
+        ~exists().where(Match.created_by == User.id),
+        ~exists().where(Tournament.created_by == User.id),
+        ~exists().where(PlayerProfile.created_by == User.id)
+    ).limit(batch_size)
+
+    deleted = 0
+    while True:
+        user_ids = db.execute(
+            delete(User).where(User.id.in_(candidates.scalar_subquery())).returning(User.id),
+            execution_options={"synchronize_session": False}
+        ).scalars().all()
+        db.commit()
+        for user_id in user_ids:
+            invalidate_user(user_id)
+        deleted += len(user_ids)
+        if len(user_ids) < batch_size:
+            return deleted
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.config.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Authentication maintenance")
+    parser.add_argument("command", choices=["reap-guests"])
+    parser.add_argument("--retention-days", type=int, default=settings.GUEST_RETENTION_DAYS)
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        print({"deleted": reap_abandoned_guests(session, args.retention_days)})
+    finally:
+        session.close()
@@ -0,0 +1,339 @@
+"""
+Export Service
+
+Exports ball events, joined with their innings and match, to columnar files
+for analytics. Rows are streamed through a server-side cursor in partition
+order and written as Arrow record batches, so memory stays constant however
+many balls are exported. Output is Hive-partitioned by tournament and match
+date:
+
+    <out>/tournament_id=<id|none>/match_date=<YYYY-MM-DD>/part-<run>.parquet
+
+A watermark on `ball_events.created_at` is kept in `<out>/_watermark.json`;
+incremental runs only export balls recorded after it. `created_at` is taken
+when the ball is flushed, not when its transaction commits, so each run
+stops EXPORT_SAFETY_LAG_SECONDS in the past and records that cutoff as the
+new watermark: a transaction still open at export time commits balls newer
+than the cutoff, which the next run picks up.
+
+Balls of archived innings are read from their InningsArchive rows in a
+second pass, into `part-<run>-archived` files, so full exports include
+them. Archived balls keep their created_at and are filtered by the same
+cutoff and watermark as live ones; incremental runs only open archives
+made since the watermark.
+
+Usage:
+    python -m app.services.export_service ball-events --out ./exports
+    python -m app.services.export_service ball-events --full --format arrow
+"""
+
+import json
+import os
+import uuid
+from datetime import datetime, timedelta
+from typing import Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.match import Match, Innings, BallEvent, InningsArchive
+from app.models.tournament import TournamentMatch
+from app.services import archive_service
+from app.utils.ball_log import NameTable
+
+WATERMARK_FILE = "_watermark.json"
+EXPORT_FORMATS = ("parquet", "arrow")
+NO_TOURNAMENT = "none"
+NO_DATE = "unknown"
+
+EXPORT_SCHEMA = pa.schema([
+    ("ball_id", pa.string()),
+    ("match_id", pa.string()),
+    ("innings_id", pa.string()),
+    ("innings_number", pa.int16()),
+    ("batting_team", pa.string()),
+    ("bowling_team", pa.string()),
+    ("over_number", pa.int16()),
+    ("ball_number", pa.int16()),
+    ("batsman_name", pa.string()),
+    ("bowler_name", pa.string()),
+    ("runs", pa.int16()),
+    ("is_wicket", pa.bool_()),
+    ("wicket_type", pa.string()),
+    ("is_wide", pa.bool_()),
+    ("is_no_ball", pa.bool_()),
+    ("is_bye", pa.bool_()),
+    ("is_leg_bye", pa.bool_()),
+    ("created_at", pa.timestamp("us")),
+])
+
+# Columns selected after the two partition keys, in EXPORT_SCHEMA order
+EXPORT_COLUMNS = (
+    BallEvent.id,
+    Match.id,
+    Innings.id,
+    Innings.innings_number,
+    Innings.batting_team,
+    Innings.bowling_team,
+    BallEvent.over_number,
+    BallEvent.ball_number,
+    BallEvent.batsman_name,
+    BallEvent.bowler_name,
+    BallEvent.runs,
+    BallEvent.is_wicket,
+    BallEvent.wicket_type,
+    BallEvent.is_wide,
+    BallEvent.is_no_ball,
+    BallEvent.is_bye,
+    BallEvent.is_leg_bye,
+    BallEvent.created_at,
+)
+
+# Innings columns of an archived ball's row, in EXPORT_SCHEMA order
+ARCHIVE_INNINGS_COLUMNS = (
+    Match.id,
+    Innings.id,
+    Innings.innings_number,
+    Innings.batting_team,
+    Innings.bowling_team,
+)
+
+# BallEvent attributes following the innings columns, in EXPORT_SCHEMA order
+ARCHIVE_BALL_ATTRIBUTES = [column.key for column in EXPORT_COLUMNS[6:]]
+
+UUID_FIELDS = {"ball_id", "match_id", "innings_id"}
+
+
+def read_watermark(out_dir: str) -> Optional[datetime]:
+    """
+    Read the created_at watermark of the last successful export.
+
+    Args:
+        out_dir: Export root directory
+
+    Returns:
+        Optional[datetime]: Watermark, or None if nothing was exported yet
+    """
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        return datetime.fromisoformat(json.load(f)["created_at"])
+
+
+def write_watermark(out_dir: str, watermark: datetime) -> None:
+    """Atomically replace the export watermark."""
+    path = os.path.join(out_dir, WATERMARK_FILE)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"created_at": watermark.isoformat()}, f)
+    os.replace(tmp_path, path)
+
+
+class _PartitionWriter:
+    """
+    Writes record batches to one file per partition.
+
+    Rows arrive sorted by partition, so only one file is open at a time.
+    """
+
+    def __init__(self, out_dir: str, run_id: str, file_format: str):
+        self.out_dir = out_dir
+        self.run_id = run_id
+        self.file_format = file_format
+        self.partition = None
+        self.files = []
+        self._writer = None
+
+    def _open(self, partition: tuple):
+        tournament_id, match_date = partition
+        directory = os.path.join(
+            self.out_dir, f"tournament_id={tournament_id}", f"match_date={match_date}")
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(directory, f"part-{self.run_id}.{self.file_format}")
+
+        if self.file_format == "parquet":
+            self._writer = pq.ParquetWriter(path, EXPORT_SCHEMA, compression="zstd")
+        else:
+            self._writer = pa.ipc.new_file(path, EXPORT_SCHEMA)
+        self.partition = partition
+        self.files.append(path)
+
+    def write(self, partition: tuple, columns: dict) -> None:
+        if partition != self.partition:
+            self.close()
+            self._open(partition)
+        batch = pa.RecordBatch.from_pydict(columns, schema=EXPORT_SCHEMA)
+        if self.file_format == "parquet":
+            self._writer.write_batch(batch)
+        else:
+            self._writer.write(batch)
+
+    def close(self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def _archived_rows(db: Session, tournament_id, match_date, since: Optional[datetime], cutoff: datetime):
+    """
+    Rows of archived balls in the live query's layout and order.
+
+    An innings is archived after its last ball, so archives made before
+    `since` cannot hold new balls and are skipped in SQL. Only one archive
+    is decompressed at a time.
+    """
+    query = db.query(tournament_id, match_date, *ARCHIVE_INNINGS_COLUMNS, InningsArchive).join(
+        Innings, Innings.match_id == Match.id
+    ).join(
+        InningsArchive, InningsArchive.innings_id == Innings.id
+    ).order_by(tournament_id, match_date, Match.id, Innings.innings_number)
+    if since is not None:
+        query = query.filter(InningsArchive.archived_at > since)
+
+    names = NameTable()
+    for row in query.yield_per(100):
+        partition, innings_columns = (row[0], row[1]), row[2:-1]
+        for ball in archive_service.unpack_archive(row[-1], names):
+            if ball.created_at is None or ball.created_at > cutoff:
+                continue
+            if since is not None and ball.created_at <= since:
+                continue
+            yield (*partition, ball.id, *innings_columns,
+                   *(getattr(ball, name) for name in ARCHIVE_BALL_ATTRIBUTES))
+
+
+def _write_rows(writer: _PartitionWriter, rows, batch_size: int) -> int:
+    """Write partition-ordered rows as record batches; returns the row count."""
+    names = EXPORT_SCHEMA.names
+    columns = {name: [] for name in names}
+    pending = 0
+    partition = None
+    count = 0
+
+    def flush():
+        nonlocal columns, pending
+        if pending:
+            writer.write(partition, columns)
+            columns = {name: [] for name in names}
+            pending = 0
+
+    try:
+        for row in rows:
+            row_partition = (
+                str(row[0]) if row[0] is not None else NO_TOURNAMENT,
+                row[1].isoformat() if row[1] is not None else NO_DATE,
+            )
+            if row_partition != partition:
+                flush()
+                partition = row_partition
+
+            for name, value in zip(names, row[2:]):
+                columns[name].append(str(value) if name in UUID_FIELDS else value)
+            pending += 1
+            count += 1
+
+            if pending >= batch_size:
+                flush()
+        flush()
+    finally:
+        writer.close()
+    return count
+
+
+def export_ball_events(
+    db: Session,
+    out_dir: str,
+    since: Optional[datetime] = None,
+    file_format: str = "parquet",
+    batch_size: int = 50000,
+    safety_lag_seconds: Optional[int] = None
+) -> dict:
+    """
+    Export ball events recorded after `since` to partitioned columnar files.
+
+    Only balls older than the safety lag are exported; the cutoff becomes
+    the new watermark.
+
+    Args:
+        db: Database session
+        out_dir: Export root directory
+        since: Only export balls with created_at after this; None exports all
+        file_format: "parquet" or "arrow" (Arrow IPC file)
+        batch_size: Rows per record batch and per cursor round trip
+        safety_lag_seconds: Seconds to stay behind now; EXPORT_SAFETY_LAG_SECONDS by default
+
+    Returns:
+        dict: Rows and files written, and the new watermark
+    """
+    # A match belongs to at most one fixture; pick one deterministically
+    tournament_id = select(TournamentMatch.tournament_id).where(
+        TournamentMatch.match_id == Match.id
+    ).order_by(TournamentMatch.tournament_id).limit(1).correlate(Match).scalar_subquery()
+    match_date = func.date(Match.match_date)
+
+    stmt = select(
+        tournament_id, match_date, *EXPORT_COLUMNS
+    ).join(
+        Innings, Innings.match_id == Match.id
+    ).join(
+        BallEvent, BallEvent.innings_id == Innings.id
+    ).order_by(
+        tournament_id, match_date, Match.id, Innings.innings_number,
+        BallEvent.over_number, BallEvent.ball_number
+    )
+    if safety_lag_seconds is None:
+        safety_lag_seconds = settings.EXPORT_SAFETY_LAG_SECONDS
+    now = datetime.utcnow()
+    cutoff = now - timedelta(seconds=safety_lag_seconds)
+    stmt = stmt.where(BallEvent.created_at <= cutoff)
+    if since is not None:
+        stmt = stmt.where(BallEvent.created_at > since)
+
+    result = db.execute(stmt.execution_options(stream_results=True, yield_per=batch_size))
+
+    # Unique per run, so runs started in the same second never share file names
+    run_id = f"{now:%Y%m%dT%H%M%S%f}-{uuid.uuid4().hex[:8]}"
+    writer = _PartitionWriter(out_dir, run_id, file_format)
+    rows = _write_rows(writer, result, batch_size)
+
+    # Archived partitions may repeat live ones, so they get their own files
+    archived_writer = _PartitionWriter(out_dir, f"{run_id}-archived", file_format)
+    rows += _write_rows(
+        archived_writer, _archived_rows(db, tournament_id, match_date, since, cutoff), batch_size)
+
+    # Only advance the watermark once every file is complete
+    if since is None or cutoff > since:
+        write_watermark(out_dir, cutoff)
+
+    return {
+        "rows": rows,
+        "files": len(writer.files) + len(archived_writer.files),
+        "watermark": max(cutoff, since).isoformat() if since else cutoff.isoformat(),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.config.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Analytics export")
+    parser.add_argument("command", choices=["ball-events"])
+    parser.add_argument("--out", default=settings.EXPORT_DIR)
+    parser.add_argument("--format", choices=EXPORT_FORMATS, default="parquet")
+    parser.add_argument("--full", action="store_true", help="Ignore the watermark")
+    parser.add_argument("--batch-size", type=int, default=50000)
+    args = parser.parse_args()
+
+    os.makedirs(args.out, exist_ok=True)
+    since = None if args.full else read_watermark(args.out)
+
+    session = SessionLocal()
+    try:
+        print(export_ball_events(session, args.out, since, args.format, args.batch_size))
+    finally:
+        session.close()
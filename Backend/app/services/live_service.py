@@ -0,0 +1,170 @@
+"""
+Live Score Service
+
+In-process publish/subscribe hub for pushing score updates to spectators.
+Each update is serialized once per publish and fanned out to every
+subscriber of the match. Subscribers have bounded queues; a subscriber
+that falls behind is dropped instead of slowing down the scorer.
+"""
+
+import asyncio
+import json
+from collections import defaultdict
+from typing import Dict, Optional, Set
+
+from app.config.settings import settings
+
+
+class Subscription:
+    """
+    A single spectator's view of a match feed.
+
+    Attributes:
+        match_id: Match being followed
+        queue: Bounded queue of serialized messages
+        dropped: Set when the subscriber fell behind and was disconnected
+    """
+    __slots__ = ("match_id", "queue", "dropped")
+
+    def __init__(self, match_id: str, max_queue: int):
+        self.match_id = match_id
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=max_queue)
+        self.dropped = False
+
+    def offer(self, message: str) -> bool:
+        """
+        Enqueue a message without blocking.
+
+        Returns:
+            bool: False if the queue was full and the subscriber was dropped
+        """
+        try:
+            self.queue.put_nowait(message)
+            return True
+        except asyncio.QueueFull:
+            self.drop()
+            return False
+
+    def drop(self) -> None:
+        """Discard pending messages and wake the consumer with a None sentinel."""
+        self.dropped = True
+        while not self.queue.empty():
+            self.queue.get_nowait()
+        self.queue.put_nowait(None)
+
+    async def get(self, timeout: Optional[float] = None) -> Optional[str]:
+        """
+        Wait for the next message.
+
+        Returns:
+            Optional[str]: Serialized message, or None if the subscriber was dropped
+
+        Raises:
+            asyncio.TimeoutError: If no message arrives within timeout
+        """
+        if timeout is None:
+            return await self.queue.get()
+        return await asyncio.wait_for(self.queue.get(), timeout)
+
+
+class LiveScoreHub:
+    """
+    Per-match fan-out of score updates to subscribed spectators.
+
+    Must be used from the event loop thread; publish never awaits, so the
+    scoring request path is never stalled by slow readers.
+    """
+
+    def __init__(self, max_queue: int = 64):
+        self.max_queue = max_queue
+        self._subscribers: Dict[str, Set[Subscription]] = defaultdict(set)
+        self.published = 0
+        self.dropped = 0
+
+    def subscribe(self, match_id: str) -> Subscription:
+        subscription = Subscription(str(match_id), self.max_queue)
+        self._subscribers[subscription.match_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        subscribers = self._subscribers.get(subscription.match_id)
+        if subscribers is None:
+            return
+        subscribers.discard(subscription)
+        if not subscribers:
+            del self._subscribers[subscription.match_id]
+
+    def subscriber_count(self, match_id: str) -> int:
+        return len(self._subscribers.get(str(match_id), ()))
+
+    def publish(self, match_id: str, payload: dict) -> int:
+        """
+        Serialize a payload once and deliver it to all subscribers of a match.
+
+        Args:
+            match_id: Match identifier
+            payload: JSON-serializable update
+
+        Returns:
+            int: Number of subscribers the message was delivered to
+        """
+        subscribers = self._subscribers.get(str(match_id))
+        if not subscribers:
+            return 0
+
+        message = json.dumps(payload, separators=(",", ":"), default=str)
+        delivered = 0
+        for subscription in list(subscribers):
+            if subscription.offer(message):
+                delivered += 1
+            else:
+                subscribers.discard(subscription)
+                self.dropped += 1
+        if not subscribers:
+            del self._subscribers[str(match_id)]
+
+        self.published += 1
+        return delivered
+
+
+def innings_score(innings) -> dict:
+    """Compact innings totals for a live update."""
+    return {
+        "innings_id": str(innings.id),
+        "innings_number": innings.innings_number,
+        "runs": innings.total_runs or 0,
+        "wickets": innings.wickets or 0,
+        "overs": innings.overs_completed or 0.0,
+        "extras": innings.extras or 0,
+    }
+
+
+def ball_update(innings, ball) -> dict:
+    """Build the live update published after a single ball."""
+    return {
+        "type": "ball",
+        "score": innings_score(innings),
+        "ball": {
+            "over": ball.over_number,
+            "ball": ball.ball_number,
+            "runs": ball.runs or 0,
+            "wicket": bool(ball.is_wicket),
+            "wide": bool(ball.is_wide),
+            "no_ball": bool(ball.is_no_ball),
+            "bye": bool(ball.is_bye),
+            "leg_bye": bool(ball.is_leg_bye),
+        },
+    }
+
+
+def batch_update(innings, balls_added: int) -> dict:
+    """Build the live update published after a batch of balls."""
+    return {
+        "type": "batch",
+        "score": innings_score(innings),
+        "balls_added": balls_added,
+    }
+
+
+# Global hub instance
+hub = LiveScoreHub(max_queue=settings.LIVE_SUBSCRIBER_QUEUE_SIZE)
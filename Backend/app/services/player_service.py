@@ -0,0 +1,242 @@
+"""
+Player Service
+
+Resolves the free-text batsman and bowler names on ball events to Player
+identities and keeps each match's roster. Identities are keyed by scorer and
+normalized name; a ball write costs one indexed roster lookup once every
+player in it has appeared in the match.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import and_, case, func
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.match import Match, Innings, BallEvent
+from app.models.player import Player, MatchPlayer, PlayerProfile
+from app.services import archive_service
+from app.services.statistics_service import (
+    NON_BOWLER_DISMISSALS,
+    InningsPerformance,
+    accumulate_ball,
+)
+from app.utils.exceptions import ResourceNotFoundError
+
+
+def normalize_player_name(name: str) -> str:
+    """
+    Normalize a player name for identity matching.
+
+    Keep in step with the SQL expression in migration 006.
+
+    Args:
+        name: Name as entered by the scorer
+
+    Returns:
+        str: Lower-cased name with surrounding and repeated whitespace removed
+    """
+    return " ".join(name.split()).lower()
+
+
+def resolve_match_players(db: Session, innings: Innings, appearances: Iterable[Tuple[str, str]]) -> Dict[str, UUID]:
+    """
+    Map player names to identities, creating identities and roster rows as needed.
+
+    Args:
+        db: Database session
+        innings: Innings the names appear in
+        appearances: (name, team) pairs
+
+    Returns:
+        Dict[str, UUID]: Normalized name to player id
+    """
+    wanted: Dict[str, Tuple[str, str]] = {}
+    for name, team in appearances:
+        if name and name.strip():
+            wanted.setdefault(normalize_player_name(name), (name.strip(), team))
+    if not wanted:
+        return {}
+
+    # Hot path: everyone is already on this match's roster
+    resolved = dict(db.query(Player.normalized_name, Player.id).join(
+        MatchPlayer, MatchPlayer.player_id == Player.id
+    ).filter(
+        MatchPlayer.match_id == innings.match_id,
+        Player.normalized_name.in_(list(wanted))
+    ).all())
+    missing = [key for key in wanted if key not in resolved]
+    if not missing:
+        return resolved
+
+    created_by = db.query(Match.created_by).filter(Match.id == innings.match_id).scalar()
+    if created_by is None:
+        # Identities are per scorer; balls of unowned matches keep names only
+        return resolved
+    profiles = {
+        normalize_player_name(name): profile_id
+        for profile_id, name in db.query(PlayerProfile.id, PlayerProfile.name).filter(
+            PlayerProfile.created_by == created_by)
+    }
+    # Identities from earlier matches pick up a profile created since then
+    insert = pg_insert(Player).values([
+        {
+            "created_by": created_by,
+            "name": wanted[key][0],
+            "normalized_name": key,
+            "player_profile_id": profiles.get(key),
+        }
+        for key in missing
+    ])
+    db.execute(
+        insert.on_conflict_do_update(
+            constraint="uq_players_created_by_name",
+            set_={"player_profile_id": func.coalesce(
+                Player.player_profile_id, insert.excluded.player_profile_id)},
+        )
+    )
+    players = dict(db.query(Player.normalized_name, Player.id).filter(
+        Player.created_by == created_by,
+        Player.normalized_name.in_(missing)
+    ).all())
+
+    db.execute(
+        pg_insert(MatchPlayer).values([
+            {"match_id": innings.match_id, "player_id": player_id, "team": wanted[key][1]}
+            for key, player_id in players.items()
+        ]).on_conflict_do_nothing(constraint="uq_match_players_player")
+    )
+
+    resolved.update(players)
+    return resolved
+
+
+def ball_rows_with_players(db: Session, innings: Innings, balls: List) -> List[dict]:
+    """
+    Build BallEvent column values with batsman and bowler identities filled in.
+
+    Args:
+        db: Database session
+        innings: Innings the balls belong to
+        balls: BallEventCreate schemas
+
+    Returns:
+        List[dict]: Column values, one per ball
+    """
+    appearances = []
+    for ball in balls:
+        appearances.append((ball.batsman_name, innings.batting_team))
+        appearances.append((ball.bowler_name, innings.bowling_team))
+    player_ids = resolve_match_players(db, innings, appearances)
+
+    def player_id(name: Optional[str]) -> Optional[UUID]:
+        return player_ids.get(normalize_player_name(name)) if name else None
+
+    return [
+        {
+            "innings_id": innings.id,
+            **ball.model_dump(),
+            "batsman_id": player_id(ball.batsman_name),
+            "bowler_id": player_id(ball.bowler_name),
+        }
+        for ball in balls
+    ]
+
+
+def _add_archived_totals(db: Session, player_id: UUID, batting: List[int], bowling: List[int]) -> None:
+    """Add a player's balls in archived innings to the SQL totals, in place."""
+    archived = db.query(Innings).join(
+        MatchPlayer, MatchPlayer.match_id == Innings.match_id
+    ).filter(
+        MatchPlayer.player_id == player_id,
+        Innings.is_archived == True  # noqa: E712
+    ).all()
+
+    for innings in archived:
+        performances: Dict[UUID, InningsPerformance] = {}
+        for ball in archive_service.load_innings_balls(db, innings):
+            accumulate_ball(performances, ball)
+        figures = performances.get(player_id)
+        if figures is None:
+            continue
+        batting[0] += figures.runs
+        batting[1] += figures.balls_faced
+        batting[2] += figures.dismissed
+        batting[3] += figures.batted
+        bowling[0] += figures.runs_conceded
+        bowling[1] += figures.balls_bowled
+        bowling[2] += figures.bowled
+        bowling[3] += figures.wickets
+
+
+def get_player_totals(db: Session, player_id: UUID) -> dict:
+    """
+    Aggregate a player's batting and bowling from the ball log by identity.
+
+    Attribution matches `statistics_service.accumulate_ball`. Uses the
+    batsman_id and bowler_id indexes instead of scanning names; archived
+    innings of the player's matches are unpacked and added.
+
+    Args:
+        db: Database session
+        player_id: Player identifier
+
+    Returns:
+        dict: Player details with batting and bowling totals
+
+    Raises:
+        ResourceNotFoundError: If the player does not exist
+    """
+    player = db.query(Player).filter(Player.id == player_id).first()
+    if player is None:
+        raise ResourceNotFoundError("Player")
+
+    runs = func.coalesce(BallEvent.runs, 0)
+    off_bat = ~func.coalesce(BallEvent.is_wide | BallEvent.is_bye | BallEvent.is_leg_bye, False)
+    not_wide = ~func.coalesce(BallEvent.is_wide, False)
+    batting = db.query(
+        func.coalesce(func.sum(case((off_bat, runs), else_=0)), 0),
+        func.coalesce(func.sum(case((not_wide, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((BallEvent.is_wicket, 1), else_=0)), 0),
+        func.count(func.distinct(BallEvent.innings_id)),
+    ).filter(BallEvent.batsman_id == player_id).one()
+
+    extra_delivery = func.coalesce(BallEvent.is_wide | BallEvent.is_no_ball, False)
+    byes = func.coalesce(BallEvent.is_bye | BallEvent.is_leg_bye, False)
+    bowler_wicket = and_(
+        func.coalesce(BallEvent.is_wicket, False),
+        func.coalesce(BallEvent.wicket_type, "").notin_(NON_BOWLER_DISMISSALS))
+    bowling = db.query(
+        func.coalesce(func.sum(
+            case((extra_delivery, 1), else_=0) + case((byes, 0), else_=runs)), 0),
+        func.coalesce(func.sum(case((extra_delivery, 0), else_=1)), 0),
+        func.count(func.distinct(BallEvent.innings_id)),
+        func.coalesce(func.sum(case((bowler_wicket, 1), else_=0)), 0),
+    ).filter(BallEvent.bowler_id == player_id).one()
+
+    matches = db.query(func.count(MatchPlayer.id)).filter(
+        MatchPlayer.player_id == player_id).scalar()
+
+    batting_totals = [int(value) for value in batting]
+    bowling_totals = [int(value) for value in bowling]
+    _add_archived_totals(db, player_id, batting_totals, bowling_totals)
+
+    return {
+        "player_id": str(player.id),
+        "name": player.name,
+        "player_profile_id": str(player.player_profile_id) if player.player_profile_id else None,
+        "matches": matches or 0,
+        "batting": {
+            "innings": batting_totals[3],
+            "runs": batting_totals[0],
+            "balls_faced": batting_totals[1],
+            "dismissals": batting_totals[2],
+        },
+        "bowling": {
+            "innings": bowling_totals[2],
+            "runs_conceded": bowling_totals[0],
+            "balls_bowled": bowling_totals[1],
+            "wickets": bowling_totals[3],
+        },
+    }
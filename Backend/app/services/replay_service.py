@@ -0,0 +1,101 @@
+"""
+Replay Service
+
+Reconstructs an innings scoreboard as of any over.ball. Reconstruction starts
+from the latest per-over InningsSnapshot before the requested over and
+replays only the balls after it, so at most one over of events is read no
+matter how long the innings is.
+"""
+
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+from app.models.match import Innings, BallEvent, InningsSnapshot
+from app.services import archive_service
+from app.services.scoring_service import InningsDelta, compute_ball_delta, balls_to_overs
+from app.services.scoreboard_service import serialize_ball
+from app.utils.exceptions import ResourceNotFoundError
+
+
+def get_scoreboard_at(
+    db: Session,
+    match_id: UUID,
+    innings_id: UUID,
+    over_number: int,
+    ball_number: int
+) -> dict:
+    """
+    Get an innings' totals as they stood after a given ball.
+
+    Args:
+        db: Database session
+        match_id: Match identifier
+        innings_id: Innings identifier
+        over_number: Over of the last ball to include
+        ball_number: Ball of the last ball to include
+
+    Returns:
+        dict: Totals, overs, balls of the requested over so far and the last ball
+
+    Raises:
+        ResourceNotFoundError: If the innings does not exist
+    """
+    innings = db.query(Innings).filter(
+        Innings.id == innings_id, Innings.match_id == match_id).first()
+    if innings is None:
+        raise ResourceNotFoundError("Innings")
+
+    snapshot = db.query(InningsSnapshot).filter(
+        InningsSnapshot.innings_id == innings_id,
+        InningsSnapshot.over_number < over_number
+    ).order_by(InningsSnapshot.over_number.desc()).first()
+
+    if snapshot is not None:
+        totals = InningsDelta(
+            runs=snapshot.total_runs or 0,
+            extras=snapshot.extras or 0,
+            wickets=snapshot.wickets or 0,
+            legal_balls=snapshot.legal_balls or 0,
+        )
+        replay_from = snapshot.over_number
+    else:
+        totals = InningsDelta()
+        replay_from = None
+
+    if innings.is_archived:
+        balls = [
+            ball for ball in archive_service.load_innings_balls(db, innings)
+            if (ball.over_number, ball.ball_number) <= (over_number, ball_number)
+            and (replay_from is None or ball.over_number > replay_from)
+        ]
+    else:
+        query = db.query(BallEvent).filter(
+            BallEvent.innings_id == innings_id,
+            tuple_(BallEvent.over_number, BallEvent.ball_number) <= (over_number, ball_number)
+        )
+        if replay_from is not None:
+            query = query.filter(BallEvent.over_number > replay_from)
+        balls = query.order_by(BallEvent.over_number, BallEvent.ball_number).all()
+
+    for ball in balls:
+        totals = totals + compute_ball_delta(ball)
+
+    return {
+        "innings_id": str(innings.id),
+        "innings_number": innings.innings_number,
+        "batting_team": innings.batting_team,
+        "bowling_team": innings.bowling_team,
+        "over_number": over_number,
+        "ball_number": ball_number,
+        "total_runs": totals.runs,
+        "wickets": totals.wickets,
+        "extras": totals.extras,
+        "overs_completed": balls_to_overs(totals.legal_balls),
+        "current_over": [
+            serialize_ball(ball) for ball in balls if ball.over_number == over_number
+        ],
+        "last_ball": serialize_ball(balls[-1]) if balls else None,
+        "replayed_balls": len(balls),
+    }
@@ -0,0 +1,227 @@
+"""
+Scoreboard Service
+
+Builds the match scoreboard view (both innings totals, current over and
+recent balls) and serves it through a read-through cache. Every ball write
+bumps a per-match version counter, so cached views are never served stale
+and old versions simply age out of the cache.
+"""
+
+from typing import List, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.config.settings import settings
+from app.models.match import Match, Innings, BallEvent
+from app.services import archive_service
+from app.utils.cache import create_cache_backend
+from app.utils.exceptions import ResourceNotFoundError
+
+RECENT_BALLS = 12
+
+# Global scoreboard cache
+scoreboard_cache = create_cache_backend(
+    settings.CACHE_BACKEND,
+    max_entries=settings.SCOREBOARD_CACHE_MAX_ENTRIES,
+    default_ttl=settings.SCOREBOARD_CACHE_TTL_SECONDS,
+)
+
+
+def _version_key(match_id) -> str:
+    return f"scoreboard:version:{match_id}"
+
+
+def _view_key(match_id, version: int) -> str:
+    return f"scoreboard:{match_id}:{version}"
+
+
+def get_match_version(match_id) -> int:
+    """Get the current scoreboard version of a match."""
+    return scoreboard_cache.get_counter(_version_key(match_id))
+
+
+def invalidate_scoreboard(match_id) -> int:
+    """
+    Bump the scoreboard version of a match after a write.
+
+    Args:
+        match_id: Match identifier
+
+    Returns:
+        int: New version number
+    """
+    version = scoreboard_cache.incr(_version_key(match_id))
+    scoreboard_cache.delete(_view_key(match_id, version - 1))
+    return version
+
+
+def serialize_ball(ball) -> dict:
+    return {
+        "over": ball.over_number,
+        "ball": ball.ball_number,
+        "batsman": ball.batsman_name,
+        "bowler": ball.bowler_name,
+        "runs": ball.runs or 0,
+        "wicket": bool(ball.is_wicket),
+        "wicket_type": ball.wicket_type,
+        "wide": bool(ball.is_wide),
+        "no_ball": bool(ball.is_no_ball),
+        "bye": bool(ball.is_bye),
+        "leg_bye": bool(ball.is_leg_bye),
+    }
+
+
+def current_innings(db: Session, innings_list: List[Innings]) -> Optional[Innings]:
+    """
+    Pick the innings the live view follows.
+
+    That is the latest innings with balls, or the innings after it once it
+    is complete, so an innings created ahead of time does not hide the one
+    still in progress.
+
+    Args:
+        db: Database session
+        innings_list: A match's innings in innings_number order
+
+    Returns:
+        Optional[Innings]: Current innings, or None if the match has none
+    """
+    if not innings_list:
+        return None
+
+    with_balls = {innings.id for innings in innings_list if innings.is_archived}
+    with_balls.update(row[0] for row in db.query(BallEvent.innings_id).filter(
+        BallEvent.innings_id.in_([innings.id for innings in innings_list])
+    ).distinct())
+
+    started = [index for index, innings in enumerate(innings_list) if innings.id in with_balls]
+    if not started:
+        return innings_list[0]
+    latest = started[-1]
+    if innings_list[latest].is_complete and latest + 1 < len(innings_list):
+        return innings_list[latest + 1]
+    return innings_list[latest]
+
+
+def build_scoreboard(db: Session, match_id: UUID) -> dict:
+    """
+    Build the scoreboard view of a match from the database.
+
+    Args:
+        db: Database session
+        match_id: Match identifier
+
+    Returns:
+        dict: Match details, innings totals, current over and recent balls
+
+    Raises:
+        ResourceNotFoundError: If the match does not exist
+    """
+    match = db.query(Match).filter(Match.id == match_id).first()
+    if match is None:
+        raise ResourceNotFoundError("Match")
+
+    innings_list = db.query(Innings).filter(
+        Innings.match_id == match_id).order_by(Innings.innings_number).all()
+
+    recent_balls = []
+    current_over = []
+    current = current_innings(db, innings_list)
+    if current is not None:
+        if current.is_archived:
+            rows = archive_service.load_innings_balls(db, current)[-RECENT_BALLS:]
+        else:
+            rows = db.query(BallEvent).filter(
+                BallEvent.innings_id == current.id
+            ).order_by(
+                BallEvent.over_number.desc(), BallEvent.ball_number.desc()
+            ).limit(RECENT_BALLS).all()
+            rows.reverse()
+        recent_balls = [serialize_ball(ball) for ball in rows]
+        if recent_balls:
+            last_over = recent_balls[-1]["over"]
+            current_over = [b for b in recent_balls if b["over"] == last_over]
+
+    return {
+        "match_id": str(match.id),
+        "team1": match.team1,
+        "team2": match.team2,
+        "overs_per_innings": match.overs_per_innings,
+        "status": match.status,
+        "winner": match.winner,
+        "result": match.result,
+        "innings": [
+            {
+                "innings_id": str(innings.id),
+                "innings_number": innings.innings_number,
+                "batting_team": innings.batting_team,
+                "bowling_team": innings.bowling_team,
+                "total_runs": innings.total_runs or 0,
+                "wickets": innings.wickets or 0,
+                "overs_completed": innings.overs_completed or 0.0,
+                "extras": innings.extras or 0,
+                "is_complete": bool(innings.is_complete),
+            }
+            for innings in innings_list
+        ],
+        "current_over": current_over,
+        "recent_balls": recent_balls,
+    }
+
+
+def get_cached_scoreboard(match_id) -> Optional[dict]:
+    """
+    Get the cached scoreboard view of a match at its current version.
+
+    Args:
+        match_id: Match identifier
+
+    Returns:
+        Optional[dict]: Scoreboard view, or None on cache miss
+    """
+    return scoreboard_cache.get(_view_key(match_id, get_match_version(match_id)))
+
+
+def load_scoreboard(db: Session, match_id: UUID) -> dict:
+    """
+    Build the scoreboard view of a match and store it in the cache.
+
+    Args:
+        db: Database session
+        match_id: Match identifier
+
+    Returns:
+        dict: Scoreboard view including its version number
+    """
+    version = get_match_version(match_id)
+    scoreboard = build_scoreboard(db, match_id)
+    scoreboard["version"] = version
+    scoreboard_cache.set(_view_key(match_id, version), scoreboard)
+    return scoreboard
+
+
+def get_scoreboard(db: Session, match_id: UUID) -> dict:
+    """
+    Get the scoreboard view of a match, building it on cache miss.
+
+    Args:
+        db: Database session
+        match_id: Match identifier
+
+    Returns:
+        dict: Scoreboard view including its version number
+    """
+    scoreboard = get_cached_scoreboard(match_id)
+    if scoreboard is None:
+        scoreboard = load_scoreboard(db, match_id)
+    return scoreboard
+
+
+def get_cache_stats() -> dict:
+    """Get scoreboard cache counters for sizing."""
+    return {
+        "backend": settings.CACHE_BACKEND,
+        "entries": scoreboard_cache.size(),
+        **scoreboard_cache.stats.to_dict(),
+    }
@@ -0,0 +1,348 @@
+"""
+Scorecard Service
+
+Builds full match scorecards (batting and bowling cards, extras and fall of
+wickets for every innings) in a fixed number of queries, whatever the
+number of matches or balls:
+
+1. the matches
+2. their innings
+3. the balls of live innings, in (innings, over, ball) order
+4. the archives of archived innings, only if there are any
+
+Every query selects plain column tuples rather than ORM instances, so no
+lazy relationship can fire while serializing. A tournament page adds one
+query for its fixtures. `query_budget` enforces these counts.
+
+Usage:
+    python -m app.services.scorecard_service check --match-id <uuid>
+    python -m app.services.scorecard_service check --tournament-id <uuid>
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, List, Sequence
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.match import Match, Innings, BallEvent, InningsArchive
+from app.models.tournament import Tournament, TournamentMatch
+from app.services import archive_service
+from app.services.scoring_service import compute_ball_delta
+from app.services.statistics_service import NON_BOWLER_DISMISSALS
+from app.utils.ball_log import NameTable
+from app.utils.exceptions import ResourceNotFoundError
+from app.utils.query_budget import query_budget
+
+# Queries to load the scorecards of any number of matches
+SCORECARD_QUERY_BUDGET = 4
+
+# Queries for a tournament page: the tournament, its fixtures, then scorecards
+TOURNAMENT_QUERY_BUDGET = 2 + SCORECARD_QUERY_BUDGET
+
+MATCH_COLUMNS = (
+    Match.id, Match.team1, Match.team2, Match.overs_per_innings, Match.total_players,
+    Match.toss_winner, Match.toss_decision, Match.status, Match.winner, Match.result,
+    Match.match_date,
+)
+
+INNINGS_COLUMNS = (
+    Innings.id, Innings.match_id, Innings.innings_number, Innings.batting_team,
+    Innings.bowling_team, Innings.total_runs, Innings.wickets, Innings.overs_completed,
+    Innings.extras, Innings.is_complete, Innings.is_archived,
+)
+
+SCORECARD_BALL_COLUMNS = (
+    BallEvent.innings_id, BallEvent.over_number, BallEvent.ball_number,
+    BallEvent.batsman_name, BallEvent.bowler_name, BallEvent.runs, BallEvent.is_wicket,
+    BallEvent.wicket_type, BallEvent.is_wide, BallEvent.is_no_ball, BallEvent.is_bye,
+    BallEvent.is_leg_bye,
+)
+
+
+def _overs(legal_balls: int) -> str:
+    return f"{legal_balls // 6}.{legal_balls % 6}"
+
+
+def build_innings_card(balls: Iterable) -> dict:
+    """
+    Build the batting and bowling cards of one innings from its balls.
+
+    Attribution matches `statistics_service.accumulate_ball`; the batsman on
+    strike is the one dismissed on a wicket ball.
+
+    Args:
+        balls: Balls in (over, ball) order; rows or BallEvent instances
+
+    Returns:
+        dict: batting, bowling, extras and fall_of_wickets
+    """
+    batting: Dict[str, dict] = {}
+    bowling: Dict[str, dict] = {}
+    over_runs: Dict[tuple, List[int]] = {}
+    extras = {"wides": 0, "no_balls": 0, "byes": 0, "leg_byes": 0}
+    fall_of_wickets = []
+    score = wickets = legal_balls = 0
+
+    for ball in balls:
+        delta = compute_ball_delta(ball)
+        score += delta.runs
+        legal_balls += delta.legal_balls
+        runs = ball.runs or 0
+        byes = bool(ball.is_bye or ball.is_leg_bye)
+
+        if ball.is_wide:
+            extras["wides"] += 1 + runs
+        else:
+            if ball.is_no_ball:
+                extras["no_balls"] += 1
+            if ball.is_bye:
+                extras["byes"] += runs
+            elif ball.is_leg_bye:
+                extras["leg_byes"] += runs
+
+        bowler_wicket = bool(ball.is_wicket) and (ball.wicket_type or "") not in NON_BOWLER_DISMISSALS
+
+        if ball.batsman_name:
+            batsman = batting.get(ball.batsman_name)
+            if batsman is None:
+                batsman = batting[ball.batsman_name] = {
+                    "name": ball.batsman_name, "runs": 0, "balls": 0,
+                    "fours": 0, "sixes": 0, "dismissal": None,
+                }
+            if not ball.is_wide:
+                batsman["balls"] += 1
+                if not byes:
+                    batsman["runs"] += runs
+                    batsman["fours"] += runs == 4
+                    batsman["sixes"] += runs == 6
+            if ball.is_wicket:
+                batsman["dismissal"] = {
+                    "how": ball.wicket_type,
+                    "bowler": ball.bowler_name if bowler_wicket else None,
+                }
+
+        if ball.bowler_name:
+            bowler = bowling.get(ball.bowler_name)
+            if bowler is None:
+                bowler = bowling[ball.bowler_name] = {
+                    "name": ball.bowler_name, "legal_balls": 0, "maidens": 0,
+                    "runs": 0, "wickets": 0, "wides": 0, "no_balls": 0,
+                }
+            conceded = delta.runs - (runs if byes else 0)
+            bowler["runs"] += conceded
+            bowler["legal_balls"] += delta.legal_balls
+            bowler["wickets"] += bowler_wicket
+            bowler["wides"] += bool(ball.is_wide)
+            bowler["no_balls"] += bool(ball.is_no_ball)
+            over = over_runs.setdefault((ball.bowler_name, ball.over_number), [0, 0])
+            over[0] += conceded
+            over[1] += delta.legal_balls
+
+        if ball.is_wicket:
+            wickets += 1
+            fall_of_wickets.append({
+                "wicket": wickets,
+                "score": score,
+                "over": _overs(legal_balls),
+                "batsman": ball.batsman_name,
+            })
+
+    for (name, _), (conceded, legal) in over_runs.items():
+        if conceded == 0 and legal == 6:
+            bowling[name]["maidens"] += 1
+
+    for batsman in batting.values():
+        batsman["strike_rate"] = round(batsman["runs"] * 100 / batsman["balls"], 2) if batsman["balls"] else 0.0
+    for bowler in bowling.values():
+        legal = bowler.pop("legal_balls")
+        bowler["overs"] = _overs(legal)
+        bowler["economy"] = round(bowler["runs"] * 6 / legal, 2) if legal else 0.0
+
+    extras["total"] = sum(extras.values())
+    return {
+        "batting": list(batting.values()),
+        "bowling": list(bowling.values()),
+        "extras": extras,
+        "fall_of_wickets": fall_of_wickets,
+    }
+
+
+def _load_balls(db: Session, innings_rows: Sequence) -> Dict[UUID, list]:
+    """Load the balls of many innings in at most two queries."""
+    balls: Dict[UUID, list] = defaultdict(list)
+
+    live_ids = [row.id for row in innings_rows if not row.is_archived]
+    if live_ids:
+        for ball in db.query(*SCORECARD_BALL_COLUMNS).filter(
+            BallEvent.innings_id.in_(live_ids)
+        ).order_by(BallEvent.innings_id, BallEvent.over_number, BallEvent.ball_number):
+            balls[ball.innings_id].append(ball)
+
+    archived_ids = [row.id for row in innings_rows if row.is_archived]
+    if archived_ids:
+        names = NameTable()
+        for archive in db.query(InningsArchive.innings_id, InningsArchive.data).filter(
+                InningsArchive.innings_id.in_(archived_ids)):
+            balls[archive.innings_id] = list(archive_service.unpack_archive(archive, names))
+
+    return balls
+
+
+def load_match_scorecards(db: Session, match_ids: Sequence[UUID]) -> Dict[UUID, dict]:
+    """
+    Build the scorecards of several matches in SCORECARD_QUERY_BUDGET queries.
+
+    Args:
+        db: Database session
+        match_ids: Match identifiers
+
+    Returns:
+        Dict[UUID, dict]: Scorecard per match id; unknown ids are omitted
+    """
+    if not match_ids:
+        return {}
+
+    with query_budget(db, SCORECARD_QUERY_BUDGET, "Scorecards"):
+        matches = db.query(*MATCH_COLUMNS).filter(Match.id.in_(list(match_ids))).all()
+        if not matches:
+            return {}
+        innings_rows = db.query(*INNINGS_COLUMNS).filter(
+            Innings.match_id.in_([match.id for match in matches])
+        ).order_by(Innings.match_id, Innings.innings_number).all()
+        balls = _load_balls(db, innings_rows)
+
+    innings_by_match: Dict[UUID, list] = defaultdict(list)
+    for row in innings_rows:
+        innings_by_match[row.match_id].append({
+            "innings_id": str(row.id),
+            "innings_number": row.innings_number,
+            "batting_team": row.batting_team,
+            "bowling_team": row.bowling_team,
+            "total_runs": row.total_runs or 0,
+            "wickets": row.wickets or 0,
+            "overs_completed": row.overs_completed or 0.0,
+            "is_complete": bool(row.is_complete),
+            **build_innings_card(balls.get(row.id, ())),
+        })
+
+    return {
+        match.id: {
+            "match_id": str(match.id),
+            "team1": match.team1,
+            "team2": match.team2,
+            "overs_per_innings": match.overs_per_innings,
+            "total_players": match.total_players,
+            "toss_winner": match.toss_winner,
+            "toss_decision": match.toss_decision,
+            "status": match.status,
+            "winner": match.winner,
+            "result": match.result,
+            "match_date": match.match_date.isoformat() if match.match_date else None,
+            "innings": innings_by_match.get(match.id, []),
+        }
+        for match in matches
+    }
+
+
+def get_match_scorecard(db: Session, match_id: UUID) -> dict:
+    """
+    Build the full scorecard of a match.
+
+    Args:
+        db: Database session
+        match_id: Match identifier
+
+    Returns:
+        dict: Match details and a card per innings
+
+    Raises:
+        ResourceNotFoundError: If the match does not exist
+    """
+    scorecard = load_match_scorecards(db, [match_id]).get(match_id)
+    if scorecard is None:
+        raise ResourceNotFoundError("Match")
+    return scorecard
+
+
+def get_tournament_scorecards(db: Session, tournament_id: UUID) -> dict:
+    """
+    Build a tournament's fixtures with the scorecards of their matches.
+
+    Uses TOURNAMENT_QUERY_BUDGET queries however many fixtures there are.
+
+    Args:
+        db: Database session
+        tournament_id: Tournament identifier
+
+    Returns:
+        dict: Tournament id and fixtures in schedule order
+
+    Raises:
+        ResourceNotFoundError: If the tournament does not exist
+    """
+    with query_budget(db, TOURNAMENT_QUERY_BUDGET, "Tournament scorecards"):
+        if db.query(Tournament.id).filter(Tournament.id == tournament_id).first() is None:
+            raise ResourceNotFoundError("Tournament")
+
+        fixtures = db.query(
+            TournamentMatch.id, TournamentMatch.match_id, TournamentMatch.team1,
+            TournamentMatch.team2, TournamentMatch.scheduled_date,
+            TournamentMatch.is_complete, TournamentMatch.winner,
+        ).filter(
+            TournamentMatch.tournament_id == tournament_id
+        ).order_by(TournamentMatch.scheduled_date, TournamentMatch.id).all()
+
+        scorecards = load_match_scorecards(
+            db, [fixture.match_id for fixture in fixtures if fixture.match_id])
+
+    return {
+        "tournament_id": str(tournament_id),
+        "fixtures": [
+            {
+                "fixture_id": str(fixture.id),
+                "team1": fixture.team1,
+                "team2": fixture.team2,
+                "scheduled_date": fixture.scheduled_date.isoformat() if fixture.scheduled_date else None,
+                "is_complete": bool(fixture.is_complete),
+                "winner": fixture.winner,
+                "scorecard": scorecards.get(fixture.match_id),
+            }
+            for fixture in fixtures
+        ],
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+    import sys
+
+    from app.config.database import SessionLocal
+    from app.utils.query_budget import QueryBudgetExceeded
+
+    parser = argparse.ArgumentParser(description="Scorecard query budget check")
+    parser.add_argument("command", choices=["check"])
+    parser.add_argument("--match-id", type=UUID)
+    parser.add_argument("--tournament-id", type=UUID)
+    args = parser.parse_args()
+    if not (args.match_id or args.tournament_id):
+        parser.error("check needs --match-id or --tournament-id")
+
+    checks = []
+    if args.match_id:
+        checks.append(("Match scorecard", SCORECARD_QUERY_BUDGET, get_match_scorecard, args.match_id))
+    if args.tournament_id:
+        checks.append(("Tournament scorecards", TOURNAMENT_QUERY_BUDGET,
+                       get_tournament_scorecards, args.tournament_id))
+
+    session = SessionLocal()
+    try:
+        for label, budget, load, key in checks:
+            with query_budget(session, budget, label, strict=True) as counter:
+                load(session, key)
+            print({"check": label, "queries": counter.count, "budget": budget})
+    except QueryBudgetExceeded as e:
+        print(e)
+        sys.exit(1)
+    finally:
+        session.close()
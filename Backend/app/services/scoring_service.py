@@ -0,0 +1,525 @@
+"""
+Scoring Service
+
+Keeps Innings aggregates (total_runs, wickets, overs_completed, extras) in
+step with the BallEvent log. Each recorded ball is applied as a constant-time
+delta in the same transaction as its insert; the ball log remains the source
+of truth and can be replayed to verify or rebuild the aggregates.
+
+When the first ball of a new over is recorded, the totals at the end of the
+previous over are stored as an InningsSnapshot for scoreboard replay.
+"""
+
+from dataclasses import dataclass
+from typing import Iterable, List, Optional
+from uuid import UUID
+
+from sqlalchemy import func, case, and_, or_, insert
+from sqlalchemy.orm import Session
+
+from app.models.match import Innings, BallEvent, InningsSnapshot
+from app.services import archive_service, player_service
+from app.utils.exceptions import ResourceNotFoundError, ValidationError
+
+BALLS_PER_OVER = 6
+
+
+@dataclass
+class InningsDelta:
+    """
+    Change to an innings' aggregates caused by one or more balls.
+
+    Attributes:
+        runs: Runs added to the innings total (including extras)
+        extras: Runs credited as extras
+        wickets: Wickets fallen
+        legal_balls: Balls counting towards the over (not wides/no-balls)
+    """
+    runs: int = 0
+    extras: int = 0
+    wickets: int = 0
+    legal_balls: int = 0
+
+    def __add__(self, other: "InningsDelta") -> "InningsDelta":
+        return InningsDelta(
+            runs=self.runs + other.runs,
+            extras=self.extras + other.extras,
+            wickets=self.wickets + other.wickets,
+            legal_balls=self.legal_balls + other.legal_balls,
+        )
+
+
+def overs_to_balls(overs: Optional[float]) -> int:
+    """
+    Convert cricket overs notation (e.g. 19.4) to legal balls bowled.
+
+    Args:
+        overs: Overs in "completed.balls" notation
+
+    Returns:
+        int: Number of legal balls
+    """
+    if not overs:
+        return 0
+    completed = int(overs)
+    return completed * BALLS_PER_OVER + int(round((overs - completed) * 10))
+
+
+def balls_to_overs(balls: int) -> float:
+    """
+    Convert legal balls bowled to cricket overs notation.
+
+    Args:
+        balls: Number of legal balls
+
+    Returns:
+        float: Overs in "completed.balls" notation (e.g. 19.4)
+    """
+    completed, remainder = divmod(balls, BALLS_PER_OVER)
+    return completed + remainder / 10
+
+
+def compute_ball_delta(ball) -> InningsDelta:
+    """
+    Compute the aggregate change caused by a single ball.
+
+    A wide or no-ball carries a one-run penalty and does not count towards
+    the over. Runs off a wide, and byes/leg-byes off any delivery, are
+    extras; runs off the bat on a no-ball are credited to the batsman.
+
+    Args:
+        ball: BallEvent instance or BallEventCreate schema
+
+    Returns:
+        InningsDelta: Change to apply to the innings
+    """
+    runs = ball.runs or 0
+    penalty = 1 if (ball.is_wide or ball.is_no_ball) else 0
+
+    if ball.is_wide or ball.is_bye or ball.is_leg_bye:
+        extras = penalty + runs
+    else:
+        extras = penalty
+
+    return InningsDelta(
+        runs=runs + penalty,
+        extras=extras,
+        wickets=1 if ball.is_wicket else 0,
+        legal_balls=0 if (ball.is_wide or ball.is_no_ball) else 1,
+    )
+
+
+def sum_deltas(balls: Iterable) -> InningsDelta:
+    """
+    Combine the deltas of several balls into one.
+
+    Args:
+        balls: Iterable of BallEvent instances or BallEventCreate schemas
+
+    Returns:
+        InningsDelta: Combined change
+    """
+    total = InningsDelta()
+    for ball in balls:
+        total = total + compute_ball_delta(ball)
+    return total
+
+
+def apply_delta(innings: Innings, delta: InningsDelta) -> Innings:
+    """
+    Apply a delta to an innings' aggregate columns in place.
+
+    Args:
+        innings: Innings to update (should be locked by the caller)
+        delta: Change to apply
+
+    Returns:
+        Innings: The updated innings
+    """
+    innings.total_runs = (innings.total_runs or 0) + delta.runs
+    innings.extras = (innings.extras or 0) + delta.extras
+    innings.wickets = (innings.wickets or 0) + delta.wickets
+    innings.overs_completed = balls_to_overs(
+        overs_to_balls(innings.overs_completed) + delta.legal_balls)
+    return innings
+
+
+def get_innings_for_update(db: Session, innings_id: UUID, for_scoring: bool = False) -> Innings:
+    """
+    Load an innings with a row lock so concurrent balls serialize on it.
+
+    Args:
+        db: Database session
+        innings_id: Innings identifier
+        for_scoring: Reject innings that no longer accept balls
+
+    Returns:
+        Innings: Locked innings row
+
+    Raises:
+        ResourceNotFoundError: If the innings does not exist
+        ValidationError: If scoring an archived or complete innings
+    """
+    innings = db.query(Innings).filter(
+        Innings.id == innings_id).with_for_update().first()
+    if innings is None:
+        raise ResourceNotFoundError("Innings")
+    if for_scoring and (innings.is_archived or innings.is_complete):
+        db.rollback()
+        raise ValidationError(
+            "Innings is archived" if innings.is_archived else "Innings is already complete")
+    return innings
+
+
+def record_ball_event(db: Session, innings_id: UUID, ball_data) -> BallEvent:
+    """
+    Insert a ball and apply its delta to the innings in one transaction.
+
+    Args:
+        db: Database session
+        innings_id: Innings the ball belongs to
+        ball_data: BallEventCreate schema
+
+    Returns:
+        BallEvent: The persisted ball event
+
+    Raises:
+        ValidationError: If the ball does not follow the last recorded ball, or
+            the innings is archived or complete
+    """
+    innings = get_innings_for_update(db, innings_id, for_scoring=True)
+
+    last_position = get_last_ball_position(db, innings.id)
+    check_ball_follows(db, ball_data, last_position)
+    if last_position is not None and ball_data.over_number > last_position[0]:
+        db.execute(insert(InningsSnapshot),
+                   [snapshot_values(innings, last_position[0], InningsDelta())])
+
+    ball = BallEvent(**player_service.ball_rows_with_players(db, innings, [ball_data])[0])
+    db.add(ball)
+    apply_delta(innings, compute_ball_delta(ball_data))
+
+    db.commit()
+    db.refresh(ball)
+    return ball
+
+
+def snapshot_values(innings: Innings, over_number: int, pending: InningsDelta) -> dict:
+    """
+    Column values for a snapshot of the innings totals plus a pending delta.
+
+    Args:
+        innings: Innings whose stored totals are the base
+        over_number: Last over included in the snapshot
+        pending: Change not yet applied to the innings
+
+    Returns:
+        dict: InningsSnapshot column values
+    """
+    return {
+        "innings_id": innings.id,
+        "over_number": over_number,
+        "total_runs": (innings.total_runs or 0) + pending.runs,
+        "wickets": (innings.wickets or 0) + pending.wickets,
+        "extras": (innings.extras or 0) + pending.extras,
+        "legal_balls": overs_to_balls(innings.overs_completed) + pending.legal_balls,
+    }
+
+
+def get_last_ball_position(db: Session, innings_id: UUID) -> Optional[tuple]:
+    """
+    Get the (over_number, ball_number) of the latest recorded ball.
+
+    Args:
+        db: Database session
+        innings_id: Innings identifier
+
+    Returns:
+        Optional[tuple]: Position of the last ball, or None if no balls exist
+    """
+    row = db.query(BallEvent.over_number, BallEvent.ball_number).filter(
+        BallEvent.innings_id == innings_id
+    ).order_by(
+        BallEvent.over_number.desc(), BallEvent.ball_number.desc()
+    ).first()
+    return (row[0], row[1]) if row else None
+
+
+def check_ball_follows(db: Session, ball, last_position: Optional[tuple]) -> None:
+    """
+    Reject a ball recorded at or before the last ball of the innings.
+
+    Rolls back so the innings lock is released before the error propagates.
+
+    Args:
+        db: Database session
+        ball: BallEventCreate schema
+        last_position: (over_number, ball_number) of the last ball, or None
+
+    Raises:
+        ValidationError: If the ball does not follow the last recorded ball
+    """
+    if last_position is not None and (ball.over_number, ball.ball_number) <= last_position:
+        db.rollback()
+        raise ValidationError(
+            f"Ball {ball.over_number}.{ball.ball_number} does not follow "
+            f"last recorded ball {last_position[0]}.{last_position[1]}")
+
+
+def record_ball_events_batch(db: Session, innings_id: UUID, balls: List) -> Innings:
+    """
+    Insert a batch of balls with one multi-row INSERT and a single commit.
+
+    The innings aggregates are updated once with the combined delta of the
+    whole batch. Balls must already be in increasing (over, ball) order and
+    must follow the last ball stored for the innings.
+
+    Args:
+        db: Database session
+        innings_id: Innings the balls belong to
+        balls: List of BallEventCreate schemas in delivery order
+
+    Returns:
+        Innings: The updated innings
+
+    Raises:
+        ValidationError: If the batch overlaps balls already recorded, or the
+            innings is archived or complete
+    """
+    innings = get_innings_for_update(db, innings_id, for_scoring=True)
+
+    last_position = get_last_ball_position(db, innings.id)
+    check_ball_follows(db, balls[0], last_position)
+
+    # Accumulate the batch delta, snapshotting totals at each over boundary
+    total = InningsDelta()
+    snapshots = []
+    previous_over = last_position[0] if last_position is not None else None
+    for ball in balls:
+        if previous_over is not None and ball.over_number > previous_over:
+            snapshots.append(snapshot_values(innings, previous_over, total))
+        total = total + compute_ball_delta(ball)
+        previous_over = ball.over_number
+
+    db.execute(
+        insert(BallEvent),
+        player_service.ball_rows_with_players(db, innings, balls)
+    )
+    if snapshots:
+        db.execute(insert(InningsSnapshot), snapshots)
+    apply_delta(innings, total)
+
+    db.commit()
+    db.refresh(innings)
+    return innings
+
+
+def _aggregate_columns() -> tuple:
+    """SQL sums of runs, extras, wickets and legal balls over ball_events."""
+    penalty = case(
+        (or_(BallEvent.is_wide, BallEvent.is_no_ball), 1), else_=0)
+    runs = func.coalesce(BallEvent.runs, 0)
+    extra_runs = case(
+        (or_(BallEvent.is_wide, BallEvent.is_bye, BallEvent.is_leg_bye), runs),
+        else_=0)
+    legal = case(
+        (and_(func.coalesce(BallEvent.is_wide, False) == False,  # noqa: E712
+              func.coalesce(BallEvent.is_no_ball, False) == False), 1),  # noqa: E712
+        else_=0)
+
+    return (
+        func.coalesce(func.sum(runs + penalty), 0),
+        func.coalesce(func.sum(penalty + extra_runs), 0),
+        func.coalesce(func.sum(case((BallEvent.is_wicket, 1), else_=0)), 0),
+        func.coalesce(func.sum(legal), 0),
+    )
+
+
+def compute_aggregates_from_log(db: Session, innings_id: UUID) -> dict:
+    """
+    Recompute innings aggregates from the ball log with a single SQL query.
+
+    Args:
+        db: Database session
+        innings_id: Innings identifier
+
+    Returns:
+        dict: total_runs, wickets, overs_completed and extras
+    """
+    row = db.query(*_aggregate_columns()).filter(
+        BallEvent.innings_id == innings_id).one()
+
+    return {
+        "total_runs": int(row[0]),
+        "extras": int(row[1]),
+        "wickets": int(row[2]),
+        "overs_completed": balls_to_overs(int(row[3])),
+    }
+
+
+def compute_aggregates_from_balls(balls: Iterable) -> dict:
+    """
+    Compute innings aggregates from balls already in memory.
+
+    Args:
+        balls: BallEvent instances
+
+    Returns:
+        dict: total_runs, wickets, overs_completed and extras
+    """
+    total = sum_deltas(balls)
+    return {
+        "total_runs": total.runs,
+        "extras": total.extras,
+        "wickets": total.wickets,
+        "overs_completed": balls_to_overs(total.legal_balls),
+    }
+
+
+def compute_snapshots(db: Session, innings: Innings) -> List[dict]:
+    """
+    Compute the per-over snapshots an innings' balls imply.
+
+    The over in progress is not snapshotted, matching the write path.
+    Archived innings are computed from their archived balls.
+
+    Args:
+        db: Database session
+        innings: Innings to compute
+
+    Returns:
+        List[dict]: InningsSnapshot column values in over order
+    """
+    if innings.is_archived:
+        per_over = {}
+        for ball in archive_service.load_innings_balls(db, innings):
+            per_over[ball.over_number] = (
+                per_over.get(ball.over_number, InningsDelta()) + compute_ball_delta(ball))
+        rows = [(over, delta.runs, delta.extras, delta.wickets, delta.legal_balls)
+                for over, delta in sorted(per_over.items())]
+    else:
+        rows = db.query(BallEvent.over_number, *_aggregate_columns()).filter(
+            BallEvent.innings_id == innings.id
+        ).group_by(BallEvent.over_number).order_by(BallEvent.over_number).all()
+
+    snapshots = []
+    runs = extras = wickets = legal_balls = 0
+    for over_number, over_runs, over_extras, over_wickets, over_legal in rows[:-1]:
+        runs += int(over_runs)
+        extras += int(over_extras)
+        wickets += int(over_wickets)
+        legal_balls += int(over_legal)
+        snapshots.append({
+            "innings_id": innings.id,
+            "over_number": over_number,
+            "total_runs": runs,
+            "wickets": wickets,
+            "extras": extras,
+            "legal_balls": legal_balls,
+        })
+    return snapshots
+
+
+def get_stored_snapshots(db: Session, innings_id: UUID) -> List[dict]:
+    """
+    Load an innings' stored per-over snapshots.
+
+    Args:
+        db: Database session
+        innings_id: Innings identifier
+
+    Returns:
+        List[dict]: InningsSnapshot column values in over order
+    """
+    rows = db.query(
+        InningsSnapshot.over_number, InningsSnapshot.total_runs, InningsSnapshot.wickets,
+        InningsSnapshot.extras, InningsSnapshot.legal_balls
+    ).filter(
+        InningsSnapshot.innings_id == innings_id
+    ).order_by(InningsSnapshot.over_number).all()
+    return [
+        {
+            "innings_id": innings_id,
+            "over_number": row.over_number,
+            "total_runs": row.total_runs or 0,
+            "wickets": row.wickets or 0,
+            "extras": row.extras or 0,
+            "legal_balls": row.legal_balls or 0,
+        }
+        for row in rows
+    ]
+
+
+def rebuild_snapshots(db: Session, innings_id: UUID, snapshots: List[dict]) -> int:
+    """
+    Replace an innings' per-over snapshots. The caller commits.
+
+    Args:
+        db: Database session
+        innings_id: Innings identifier
+        snapshots: Snapshots from `compute_snapshots`
+
+    Returns:
+        int: Number of snapshots written
+    """
+    db.query(InningsSnapshot).filter(
+        InningsSnapshot.innings_id == innings_id).delete(synchronize_session=False)
+    if snapshots:
+        db.execute(insert(InningsSnapshot), snapshots)
+    return len(snapshots)
+
+
+def verify_innings(db: Session, innings_id: UUID, rebuild: bool = False) -> dict:
+    """
+    Compare stored innings aggregates with the ball log, optionally fixing them.
+
+    The per-over snapshots that scoreboard replay starts from are checked
+    too, and regenerated on rebuild when they differ from the ball log.
+    Archived innings are checked against their archived balls.
+
+    Args:
+        db: Database session
+        innings_id: Innings identifier
+        rebuild: Overwrite stored aggregates with the recomputed values
+
+    Returns:
+        dict: innings_id, consistent, snapshots_consistent, rebuilt, stored
+            and computed values
+    """
+    innings = get_innings_for_update(db, innings_id)
+    if innings.is_archived:
+        computed = compute_aggregates_from_balls(
+            archive_service.load_innings_balls(db, innings))
+    else:
+        computed = compute_aggregates_from_log(db, innings.id)
+    stored = {
+        "total_runs": innings.total_runs or 0,
+        "extras": innings.extras or 0,
+        "wickets": innings.wickets or 0,
+        "overs_completed": balls_to_overs(overs_to_balls(innings.overs_completed)),
+    }
+    consistent = stored == computed
+    snapshots = compute_snapshots(db, innings)
+    snapshots_consistent = get_stored_snapshots(db, innings.id) == snapshots
+
+    rebuilt = False
+    if rebuild:
+        if not consistent:
+            for column, value in computed.items():
+                setattr(innings, column, value)
+            rebuilt = True
+        if not snapshots_consistent:
+            rebuild_snapshots(db, innings.id, snapshots)
+            rebuilt = True
+        db.commit()
+    else:
+        db.rollback()
+
+    return {
+        "innings_id": str(innings_id),
+        "consistent": consistent,
+        "snapshots_consistent": snapshots_consistent,
+        "rebuilt": rebuilt,
+        "stored": stored,
+        "computed": computed,
+    }
@@ -0,0 +1,454 @@
+"""
+Statistics Service
+
+Maintains career statistics on PlayerProfile and UserProfile from the ball
+log. Each innings is folded into the profiles once, when it completes, so
+profile pages read precomputed numbers. A full rebuild streams ball_events
+through a server-side cursor in constant memory (relative to the number of
+balls) and rewrites every profile.
+
+Figures are keyed by the Player identities on ball events. A player
+receives statistics through the PlayerProfile their identity links to, and
+the scorer's own user profile receives the figures of the identity
+matching their account name.
+
+Usage:
+    python -m app.services.statistics_service rebuild
+"""
+
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set
+from uuid import UUID
+
+from sqlalchemy import and_, func, select, update
+from sqlalchemy.orm import Session
+
+from app.models.match import Match, Innings, BallEvent
+from app.models.player import Player, PlayerProfile
+from app.models.user import User, UserProfile
+from app.services import archive_service
+from app.utils.exceptions import ResourceNotFoundError
+
+NON_BOWLER_DISMISSALS = {"run_out", "retired_hurt", "obstructing_the_field"}
+
+# Columns needed to attribute a ball to its batsman and bowler
+BALL_COLUMNS = (
+    BallEvent.batsman_id,
+    BallEvent.bowler_id,
+    BallEvent.runs,
+    BallEvent.is_wicket,
+    BallEvent.wicket_type,
+    BallEvent.is_wide,
+    BallEvent.is_no_ball,
+    BallEvent.is_bye,
+    BallEvent.is_leg_bye,
+)
+
+
+class InningsPerformance:
+    """A single player's batting and bowling figures in one innings."""
+    __slots__ = ("runs", "balls_faced", "dismissed", "batted",
+                 "runs_conceded", "balls_bowled", "wickets", "bowled")
+
+    def __init__(self):
+        self.runs = 0
+        self.balls_faced = 0
+        self.dismissed = False
+        self.batted = False
+        self.runs_conceded = 0
+        self.balls_bowled = 0
+        self.wickets = 0
+        self.bowled = False
+
+
+def accumulate_ball(performances: Dict[UUID, InningsPerformance], ball) -> None:
+    """
+    Attribute one ball to its batsman and bowler.
+
+    Runs off the bat exclude wides, byes and leg-byes. The bowler concedes
+    the wide/no-ball penalty and everything except byes and leg-byes, and is
+    credited with every wicket except run-outs and similar.
+
+    Args:
+        performances: Per-player figures for the innings, updated in place
+        ball: Row or object with the BALL_COLUMNS attributes
+    """
+    runs = ball.runs or 0
+    extra_delivery = bool(ball.is_wide or ball.is_no_ball)
+    byes = bool(ball.is_bye or ball.is_leg_bye)
+
+    if ball.batsman_id:
+        batsman = performances.get(ball.batsman_id)
+        if batsman is None:
+            batsman = performances[ball.batsman_id] = InningsPerformance()
+        batsman.batted = True
+        if not ball.is_wide:
+            batsman.balls_faced += 1
+            if not byes:
+                batsman.runs += runs
+        if ball.is_wicket:
+            batsman.dismissed = True
+
+    if ball.bowler_id:
+        bowler = performances.get(ball.bowler_id)
+        if bowler is None:
+            bowler = performances[ball.bowler_id] = InningsPerformance()
+        bowler.bowled = True
+        bowler.runs_conceded += (1 if extra_delivery else 0) + (0 if byes else runs)
+        if not extra_delivery:
+            bowler.balls_bowled += 1
+        if ball.is_wicket and (ball.wicket_type or "") not in NON_BOWLER_DISMISSALS:
+            bowler.wickets += 1
+
+
+class CareerTotals:
+    """
+    Running career totals, shared by incremental updates and full rebuilds.
+    """
+    COUNTERS = (
+        "matches_played", "total_runs", "total_wickets", "centuries",
+        "half_centuries", "five_wicket_hauls", "highest_score", "dismissals",
+        "balls_faced", "runs_conceded", "balls_bowled",
+        "best_bowling_wickets", "best_bowling_runs",
+    )
+    __slots__ = COUNTERS
+
+    def __init__(self):
+        for name in self.COUNTERS:
+            setattr(self, name, 0)
+
+    @classmethod
+    def from_profile(cls, profile) -> "CareerTotals":
+        totals = cls()
+        for name in cls.COUNTERS:
+            setattr(totals, name, getattr(profile, name) or 0)
+        return totals
+
+    def add_innings(self, performance: InningsPerformance, new_match: bool) -> None:
+        """Fold one innings' figures into the career totals."""
+        if new_match:
+            self.matches_played += 1
+
+        if performance.batted:
+            self.total_runs += performance.runs
+            self.balls_faced += performance.balls_faced
+            self.dismissals += 1 if performance.dismissed else 0
+            self.highest_score = max(self.highest_score, performance.runs)
+            if performance.runs >= 100:
+                self.centuries += 1
+            elif performance.runs >= 50:
+                self.half_centuries += 1
+
+        if performance.bowled:
+            self.total_wickets += performance.wickets
+            self.runs_conceded += performance.runs_conceded
+            self.balls_bowled += performance.balls_bowled
+            if performance.wickets >= 5:
+                self.five_wicket_hauls += 1
+            if self._is_better_bowling(performance.wickets, performance.runs_conceded):
+                self.best_bowling_wickets = performance.wickets
+                self.best_bowling_runs = performance.runs_conceded
+
+    def _is_better_bowling(self, wickets: int, runs: int) -> bool:
+        if self.best_bowling_wickets == 0 and self.best_bowling_runs == 0:
+            return True
+        if wickets != self.best_bowling_wickets:
+            return wickets > self.best_bowling_wickets
+        return runs < self.best_bowling_runs
+
+    def write_to(self, profile) -> None:
+        """Store totals and derived averages on a PlayerProfile or UserProfile."""
+        for name in self.COUNTERS:
+            setattr(profile, name, getattr(self, name))
+
+        profile.batting_average = round(
+            self.total_runs / self.dismissals if self.dismissals else float(self.total_runs), 2)
+        profile.bowling_average = round(
+            self.runs_conceded / self.total_wickets if self.total_wickets else 0.0, 2)
+        if self.balls_bowled or self.best_bowling_wickets:
+            profile.best_bowling = f"{self.best_bowling_wickets}/{self.best_bowling_runs}"
+        else:
+            profile.best_bowling = None
+
+
+def compute_innings_performances(db: Session, innings_id: UUID) -> Dict[UUID, InningsPerformance]:
+    """
+    Compute every player's figures for one innings.
+
+    Args:
+        db: Database session
+        innings_id: Innings identifier
+
+    Returns:
+        dict: Player id to InningsPerformance
+    """
+    performances: Dict[UUID, InningsPerformance] = {}
+    innings = db.query(Innings).filter(Innings.id == innings_id).first()
+    if innings is not None and innings.is_archived:
+        rows = archive_service.load_innings_balls(db, innings)
+    else:
+        rows = db.execute(
+            select(*BALL_COLUMNS).where(BallEvent.innings_id == innings_id)
+        )
+    for ball in rows:
+        accumulate_ball(performances, ball)
+    return performances
+
+
+def normalized_name_sql(column):
+    """SQL twin of player_service.normalize_player_name, as in migration 006."""
+    return func.lower(func.regexp_replace(func.btrim(column), r"\s+", " ", "g"))
+
+
+def link_player_profiles(db: Session, created_by: Optional[UUID] = None) -> int:
+    """
+    Link unlinked player identities to the scorer's profile of the same name.
+
+    Profiles created after a player's first match are picked up here, before
+    statistics are attributed.
+
+    Args:
+        db: Database session
+        created_by: Limit to one scorer's identities; all scorers if None
+
+    Returns:
+        int: Number of identities linked
+    """
+    stmt = update(Player).where(
+        Player.player_profile_id.is_(None),
+        PlayerProfile.created_by == Player.created_by,
+        normalized_name_sql(PlayerProfile.name) == Player.normalized_name,
+    ).values(player_profile_id=PlayerProfile.id).execution_options(synchronize_session=False)
+    if created_by is not None:
+        stmt = stmt.where(Player.created_by == created_by)
+    return db.execute(stmt).rowcount
+
+
+def resolve_profiles(db: Session, created_by: Optional[UUID], player_ids: Iterable[UUID]) -> Dict[UUID, list]:
+    """
+    Map player identities to the profiles that should receive their statistics.
+
+    The profiles are locked in id order, player profiles before the user
+    profile, so innings completing together that share a player update the
+    totals one after the other instead of overwriting each other.
+
+    Args:
+        db: Database session
+        created_by: User who scored the match
+        player_ids: Player ids appearing in the ball log
+
+    Returns:
+        dict: Player id to list of PlayerProfile/UserProfile rows
+    """
+    player_ids = set(player_ids)
+    resolved: Dict[UUID, list] = defaultdict(list)
+    if created_by is None or not player_ids:
+        return resolved
+
+    linked = db.query(Player.id, PlayerProfile).join(
+        PlayerProfile, PlayerProfile.id == Player.player_profile_id
+    ).filter(
+        Player.id.in_(player_ids)
+    ).order_by(PlayerProfile.id).with_for_update(of=PlayerProfile).populate_existing().all()
+    for player_id, profile in linked:
+        resolved[player_id].append(profile)
+
+    own = db.query(Player.id, UserProfile).join(
+        User, User.id == Player.created_by
+    ).join(
+        UserProfile, UserProfile.user_id == User.id
+    ).filter(
+        Player.created_by == created_by,
+        Player.id.in_(player_ids),
+        Player.normalized_name == normalized_name_sql(User.name)
+    ).with_for_update(of=UserProfile).populate_existing().first()
+    if own is not None:
+        own_id, own_profile = own
+        resolved[own_id].append(own_profile)
+
+    return resolved
+
+
+def _players_in_applied_innings(db: Session, match_id: UUID, exclude_innings_id: UUID) -> Set[UUID]:
+    """Players that already appeared in innings of this match folded into careers."""
+    rows = db.query(BallEvent.batsman_id, BallEvent.bowler_id).join(
+        Innings, Innings.id == BallEvent.innings_id
+    ).filter(
+        Innings.match_id == match_id,
+        Innings.id != exclude_innings_id,
+        Innings.stats_applied == True  # noqa: E712
+    ).distinct().all()
+
+    players: Set[UUID] = set()
+    for batsman_id, bowler_id in rows:
+        players.update(player_id for player_id in (batsman_id, bowler_id) if player_id)
+    return players
+
+
+def apply_innings_statistics(db: Session, innings_id: UUID) -> int:
+    """
+    Fold a completed innings into career statistics exactly once.
+
+    Args:
+        db: Database session
+        innings_id: Innings identifier
+
+    Returns:
+        int: Number of profiles updated (0 if the innings was already applied)
+
+    Raises:
+        ResourceNotFoundError: If the innings does not exist
+    """
+    innings = db.query(Innings).filter(
+        Innings.id == innings_id).with_for_update().first()
+    if innings is None:
+        raise ResourceNotFoundError("Innings")
+    if innings.stats_applied:
+        db.rollback()
+        return 0
+
+    match = db.query(Match).filter(Match.id == innings.match_id).first()
+    performances = compute_innings_performances(db, innings.id)
+    already_counted = _players_in_applied_innings(db, innings.match_id, innings.id)
+    if match.created_by is not None:
+        link_player_profiles(db, match.created_by)
+    profiles = resolve_profiles(db, match.created_by, performances.keys())
+
+    updated = 0
+    for player_id, performance in performances.items():
+        for profile in profiles.get(player_id, ()):
+            totals = CareerTotals.from_profile(profile)
+            totals.add_innings(performance, new_match=player_id not in already_counted)
+            totals.write_to(profile)
+            updated += 1
+
+    innings.stats_applied = True
+    db.commit()
+    return updated
+
+
+def rebuild_all_statistics(db: Session, chunk_size: int = 5000) -> dict:
+    """
+    Recompute every profile's career statistics from the ball log.
+
+    Balls of completed innings are streamed through a server-side cursor in
+    match/innings order, followed by archived innings one at a time, so only
+    one innings of figures is held at a time plus one running total per
+    player identity.
+
+    Args:
+        db: Database session
+        chunk_size: Rows fetched per round trip
+
+    Returns:
+        dict: Counts of balls scanned and profiles written
+    """
+    careers: Dict[UUID, CareerTotals] = defaultdict(CareerTotals)
+
+    stmt = select(
+        Match.id, Match.created_by, Innings.id, *BALL_COLUMNS
+    ).join(
+        Innings, Innings.match_id == Match.id
+    ).join(
+        BallEvent, BallEvent.innings_id == Innings.id
+    ).where(
+        Innings.is_complete == True  # noqa: E712
+    ).order_by(Match.id, Innings.innings_number, BallEvent.over_number, BallEvent.ball_number)
+
+    result = db.execute(stmt.execution_options(stream_results=True, yield_per=chunk_size))
+
+    def all_balls():
+        for row in result:
+            yield row[0], row[1], row[2], row
+        # Archived matches are archived whole, so they never interleave with live rows
+        yield from archive_service.iter_archived_balls(db)
+
+    current_match = current_innings = None
+    match_players: Set[UUID] = set()
+    performances: Dict[UUID, InningsPerformance] = {}
+    balls = 0
+
+    def flush_innings():
+        for player_id, performance in performances.items():
+            careers[player_id].add_innings(performance, new_match=player_id not in match_players)
+        match_players.update(performances.keys())
+        performances.clear()
+
+    for match_id, created_by, innings_id, ball in all_balls():
+        if innings_id != current_innings:
+            flush_innings()
+            if match_id != current_match:
+                match_players.clear()
+                current_match = match_id
+            current_innings = innings_id
+        accumulate_ball(performances, ball)
+        balls += 1
+    flush_innings()
+
+    link_player_profiles(db)
+    written = _write_careers(db, careers)
+
+    db.query(Innings).filter(Innings.is_complete == True).update(  # noqa: E712
+        {Innings.stats_applied: True}, synchronize_session=False)
+    db.commit()
+
+    return {"balls_scanned": balls, "profiles_written": written}
+
+
+def _write_careers(db: Session, careers: Dict[UUID, CareerTotals]) -> int:
+    """Overwrite every profile's statistics with the rebuilt totals."""
+    written = 0
+    empty = CareerTotals()
+
+    profile_players = dict(db.query(Player.player_profile_id, Player.id).filter(
+        Player.player_profile_id.isnot(None)).all())
+    for profile in db.query(PlayerProfile).yield_per(500):
+        careers.get(profile_players.get(profile.id), empty).write_to(profile)
+        written += 1
+
+    user_profiles = db.query(UserProfile, Player.id).join(
+        User, User.id == UserProfile.user_id
+    ).outerjoin(
+        Player, and_(Player.created_by == User.id,
+                     Player.normalized_name == normalized_name_sql(User.name))
+    ).yield_per(500)
+    for profile, player_id in user_profiles:
+        careers.get(player_id, empty).write_to(profile)
+        written += 1
+
+    return written
+
+
+def get_profile_statistics(profile) -> dict:
+    """Read the precomputed career statistics of a profile."""
+    return {
+        "matches_played": profile.matches_played or 0,
+        "total_runs": profile.total_runs or 0,
+        "total_wickets": profile.total_wickets or 0,
+        "batting_average": profile.batting_average or 0.0,
+        "bowling_average": profile.bowling_average or 0.0,
+        "centuries": profile.centuries or 0,
+        "half_centuries": profile.half_centuries or 0,
+        "five_wicket_hauls": profile.five_wicket_hauls or 0,
+        "highest_score": profile.highest_score or 0,
+        "best_bowling": profile.best_bowling,
+        "balls_faced": profile.balls_faced or 0,
+        "balls_bowled": profile.balls_bowled or 0,
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from app.config.database import SessionLocal
+
+    parser = argparse.ArgumentParser(description="Career statistics maintenance")
+    parser.add_argument("command", choices=["rebuild"])
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    args = parser.parse_args()
+
+    session = SessionLocal()
+    try:
+        print(rebuild_all_statistics(session, chunk_size=args.chunk_size))
+    finally:
+        session.close()
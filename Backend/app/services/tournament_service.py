@@ -0,0 +1,317 @@
+"""
+Tournament Service
+
+Keeps the tournament points table in step with completed fixtures. Recording
+a result touches only the two teams' standing rows; the runs and balls for
+and against each team are stored so net run rate can be updated without
+replaying earlier matches. A vectorized full recompute rebuilds a whole
+table from tournament_matches alone.
+"""
+
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.match import Match, Innings
+from app.models.tournament import Tournament, TournamentMatch, TournamentStanding
+from app.services.scoring_service import BALLS_PER_OVER, overs_to_balls
+from app.utils.exceptions import ResourceNotFoundError, ValidationError
+
+WIN_POINTS = 2
+TIE_POINTS = 1
+
+STANDING_COUNTERS = (
+    "played", "won", "lost", "tied", "points",
+    "runs_for", "balls_for", "runs_against", "balls_against",
+)
+
+
+def calculate_net_run_rate(runs_for: int, balls_for: int, runs_against: int, balls_against: int) -> float:
+    """
+    Calculate net run rate from aggregate runs and balls.
+
+    Args:
+        runs_for: Runs scored
+        balls_for: Balls faced
+        runs_against: Runs conceded
+        balls_against: Balls bowled
+
+    Returns:
+        float: Runs per over scored minus runs per over conceded
+    """
+    rate_for = runs_for * BALLS_PER_OVER / balls_for if balls_for else 0.0
+    rate_against = runs_against * BALLS_PER_OVER / balls_against if balls_against else 0.0
+    return round(rate_for - rate_against, 3)
+
+
+def _effective_balls(innings: Innings, match: Match) -> int:
+    """Balls faced for run rate purposes; an all-out side is charged its full quota."""
+    if (innings.wickets or 0) >= match.total_players - 1:
+        return match.overs_per_innings * BALLS_PER_OVER
+    return overs_to_balls(innings.overs_completed)
+
+
+def winner_from_runs(team1: str, runs1: int, team2: str, runs2: int) -> Optional[str]:
+    """
+    Decide a fixture's winner from the runs each side scored.
+
+    Args:
+        team1: First team
+        runs1: Runs scored by the first team
+        team2: Second team
+        runs2: Runs scored by the second team
+
+    Returns:
+        Optional[str]: The side with more runs, or None for a tie
+    """
+    if runs1 == runs2:
+        return None
+    return team1 if runs1 > runs2 else team2
+
+
+def derive_result_from_match(db: Session, fixture: TournamentMatch) -> Tuple[int, int, int, int, Optional[str]]:
+    """
+    Read a fixture's scores from its linked match.
+
+    Args:
+        db: Database session
+        fixture: Tournament match linked to a scored match
+
+    Returns:
+        tuple: team1 runs, team1 balls, team2 runs, team2 balls, winner
+
+    Raises:
+        ValidationError: If the linked match has not been scored or either
+            innings is still in progress
+    """
+    match = db.query(Match).filter(Match.id == fixture.match_id).first()
+    innings_list = db.query(Innings).filter(
+        Innings.match_id == fixture.match_id).all() if match else []
+
+    figures = {
+        innings.batting_team: (innings.total_runs or 0, _effective_balls(innings, match))
+        for innings in innings_list
+    }
+    if fixture.team1 not in figures or fixture.team2 not in figures:
+        raise ValidationError("Linked match does not have an innings for both teams")
+    if not all(innings.is_complete for innings in innings_list
+               if innings.batting_team in (fixture.team1, fixture.team2)):
+        raise ValidationError("Linked match innings are not complete")
+
+    (runs1, balls1), (runs2, balls2) = figures[fixture.team1], figures[fixture.team2]
+    winner = match.winner or winner_from_runs(fixture.team1, runs1, fixture.team2, runs2)
+    return runs1, balls1, runs2, balls2, winner
+
+
+def _get_standings_for_update(db: Session, tournament_id: UUID, teams: List[str]) -> Dict[str, TournamentStanding]:
+    """
+    Lock the standing rows of the given teams, creating any that are missing.
+
+    Missing rows are inserted with ON CONFLICT DO NOTHING so two first
+    results for the same team cannot both insert it; the select then waits
+    on whichever insert won.
+    """
+    if not teams:
+        return {}
+    db.execute(
+        pg_insert(TournamentStanding).values([
+            dict({name: 0 for name in STANDING_COUNTERS},
+                 tournament_id=tournament_id, team_name=team, net_run_rate=0.0)
+            for team in sorted(teams)
+        ]).on_conflict_do_nothing(constraint="uq_tournament_standings_team")
+    )
+    rows = db.query(TournamentStanding).filter(
+        TournamentStanding.tournament_id == tournament_id,
+        TournamentStanding.team_name.in_(teams)
+    ).order_by(TournamentStanding.team_name).with_for_update().populate_existing().all()
+    return {row.team_name: row for row in rows}
+
+
+def _apply_fixture(standings: Dict[str, TournamentStanding], fixture: TournamentMatch, sign: int) -> None:
+    """
+    Add (sign=1) or remove (sign=-1) a fixture's contribution to both teams.
+
+    A no result counts as played and shares the tie points, but its runs and
+    balls stay out of net run rate.
+    """
+    sides = (
+        (fixture.team1, fixture.team1_score, fixture.team1_balls, fixture.team2_score, fixture.team2_balls),
+        (fixture.team2, fixture.team2_score, fixture.team2_balls, fixture.team1_score, fixture.team1_balls),
+    )
+    for team, scored, faced, conceded, bowled in sides:
+        standing = standings[team]
+        standing.played = (standing.played or 0) + sign
+        if fixture.winner == team:
+            standing.won = (standing.won or 0) + sign
+            standing.points = (standing.points or 0) + sign * WIN_POINTS
+        elif fixture.winner in (fixture.team1, fixture.team2):
+            standing.lost = (standing.lost or 0) + sign
+        else:
+            standing.tied = (standing.tied or 0) + sign
+            standing.points = (standing.points or 0) + sign * TIE_POINTS
+
+        if fixture.no_result:
+            continue
+        standing.runs_for = (standing.runs_for or 0) + sign * (scored or 0)
+        standing.balls_for = (standing.balls_for or 0) + sign * (faced or 0)
+        standing.runs_against = (standing.runs_against or 0) + sign * (conceded or 0)
+        standing.balls_against = (standing.balls_against or 0) + sign * (bowled or 0)
+        standing.net_run_rate = calculate_net_run_rate(
+            standing.runs_for, standing.balls_for, standing.runs_against, standing.balls_against)
+
+
+def record_match_result(db: Session, tournament_id: UUID, fixture_id: UUID, result) -> TournamentMatch:
+    """
+    Record (or correct) a fixture result and update both teams' standings.
+
+    Args:
+        db: Database session
+        tournament_id: Tournament identifier
+        fixture_id: Tournament match identifier
+        result: TournamentResultUpdate schema
+
+    Returns:
+        TournamentMatch: The completed fixture
+
+    Raises:
+        ResourceNotFoundError: If the fixture does not exist
+        ValidationError: If scores or overs are missing, the winner is not
+            playing or a winner is given for a no result
+    """
+    fixture = db.query(TournamentMatch).filter(
+        TournamentMatch.id == fixture_id,
+        TournamentMatch.tournament_id == tournament_id
+    ).with_for_update().first()
+    if fixture is None:
+        raise ResourceNotFoundError("Tournament match")
+
+    if result.winner is not None and result.winner not in (fixture.team1, fixture.team2):
+        raise ValidationError("Winner must be one of the fixture's teams")
+
+    if result.no_result:
+        if result.winner is not None:
+            raise ValidationError("A no result cannot have a winner")
+        figures = (
+            result.team1_score, overs_to_balls(result.team1_overs),
+            result.team2_score, overs_to_balls(result.team2_overs),
+            None,
+        )
+    elif result.team1_score is not None and result.team2_score is not None:
+        if result.team1_overs is None or result.team2_overs is None:
+            raise ValidationError("Overs are required for both teams when scores are given")
+        winner = result.winner or winner_from_runs(
+            fixture.team1, result.team1_score, fixture.team2, result.team2_score)
+        figures = (
+            result.team1_score, overs_to_balls(result.team1_overs),
+            result.team2_score, overs_to_balls(result.team2_overs),
+            winner,
+        )
+    elif fixture.match_id is not None:
+        figures = derive_result_from_match(db, fixture)
+    else:
+        raise ValidationError("Scores are required for fixtures without a linked match")
+
+    standings = _get_standings_for_update(db, tournament_id, [fixture.team1, fixture.team2])
+    if fixture.is_complete:
+        _apply_fixture(standings, fixture, sign=-1)
+
+    (fixture.team1_score, fixture.team1_balls,
+     fixture.team2_score, fixture.team2_balls, fixture.winner) = figures
+    fixture.no_result = result.no_result
+    fixture.is_complete = True
+    _apply_fixture(standings, fixture, sign=1)
+
+    db.commit()
+    db.refresh(fixture)
+    return fixture
+
+
+def recompute_standings(db: Session, tournament_id: UUID) -> List[TournamentStanding]:
+    """
+    Rebuild a tournament's whole points table from its completed fixtures.
+
+    Per-team totals are computed with NumPy bincounts over the fixture list
+    instead of a per-match Python loop.
+
+    Args:
+        db: Database session
+        tournament_id: Tournament identifier
+
+    Returns:
+        list: Standing rows ordered by points and net run rate
+    """
+    tournament = db.query(Tournament).filter(Tournament.id == tournament_id).first()
+    if tournament is None:
+        raise ResourceNotFoundError("Tournament")
+
+    fixtures = db.query(
+        TournamentMatch.team1, TournamentMatch.team2, TournamentMatch.winner,
+        TournamentMatch.team1_score, TournamentMatch.team1_balls,
+        TournamentMatch.team2_score, TournamentMatch.team2_balls,
+        TournamentMatch.no_result
+    ).filter(
+        TournamentMatch.tournament_id == tournament_id,
+        TournamentMatch.is_complete == True  # noqa: E712
+    ).all()
+
+    teams = list(dict.fromkeys(
+        list(tournament.teams or []) + [f[0] for f in fixtures] + [f[1] for f in fixtures]))
+    index = {team: i for i, team in enumerate(teams)}
+    n = len(teams)
+
+    t1 = np.array([index[f[0]] for f in fixtures], dtype=np.int64)
+    t2 = np.array([index[f[1]] for f in fixtures], dtype=np.int64)
+    # No results count towards points but not net run rate
+    counted = np.array([not f[7] for f in fixtures], dtype=np.float64)
+    runs1 = np.array([f[3] or 0 for f in fixtures], dtype=np.float64) * counted
+    balls1 = np.array([f[4] or 0 for f in fixtures], dtype=np.float64) * counted
+    runs2 = np.array([f[5] or 0 for f in fixtures], dtype=np.float64) * counted
+    balls2 = np.array([f[6] or 0 for f in fixtures], dtype=np.float64) * counted
+    win1 = np.array([f[2] == f[0] for f in fixtures], dtype=np.float64)
+    win2 = np.array([f[2] == f[1] for f in fixtures], dtype=np.float64)
+    tie = 1.0 - win1 - win2
+
+    def per_team(weights1, weights2):
+        return (np.bincount(t1, weights=weights1, minlength=n)
+                + np.bincount(t2, weights=weights2, minlength=n))
+
+    ones = np.ones(len(fixtures))
+    totals = {
+        "played": per_team(ones, ones),
+        "won": per_team(win1, win2),
+        "lost": per_team(win2, win1),
+        "tied": per_team(tie, tie),
+        "runs_for": per_team(runs1, runs2),
+        "balls_for": per_team(balls1, balls2),
+        "runs_against": per_team(runs2, runs1),
+        "balls_against": per_team(balls2, balls1),
+    }
+    totals["points"] = totals["won"] * WIN_POINTS + totals["tied"] * TIE_POINTS
+
+    rate_for = np.divide(totals["runs_for"] * BALLS_PER_OVER, totals["balls_for"],
+                         out=np.zeros(n), where=totals["balls_for"] > 0)
+    rate_against = np.divide(totals["runs_against"] * BALLS_PER_OVER, totals["balls_against"],
+                             out=np.zeros(n), where=totals["balls_against"] > 0)
+    net_run_rate = np.round(rate_for - rate_against, 3)
+
+    standings = _get_standings_for_update(db, tournament_id, teams)
+    for team, i in index.items():
+        standing = standings[team]
+        for name in STANDING_COUNTERS:
+            setattr(standing, name, int(totals[name][i]))
+        standing.net_run_rate = float(net_run_rate[i])
+
+    db.commit()
+    return get_standings(db, tournament_id)
+
+
+def get_standings(db: Session, tournament_id: UUID) -> List[TournamentStanding]:
+    """Get a tournament's points table ordered by points, then net run rate."""
+    return db.query(TournamentStanding).filter(
+        TournamentStanding.tournament_id == tournament_id
+    ).order_by(
+        TournamentStanding.points.desc(), TournamentStanding.net_run_rate.desc()
+    ).all()
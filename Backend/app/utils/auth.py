@@ -4,17 +4,24 @@ Authentication Utilities
 Handles password hashing, JWT token creation/verification, and user authentication.
 """
 
+import hashlib
+import time
+import uuid
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
+from sqlalchemy import event
 from sqlalchemy.orm import Session
 
 from app.config.settings import settings
-from app.config.database import get_db
+from app.config.database import get_db, run_db
 from app.models.user import User
+from app.services import auth_service
+from app.utils.cache import MemoryCacheBackend
+from app.utils.executors import BoundedExecutor
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
@@ -22,6 +29,20 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 # HTTP Bearer token scheme
 security = HTTPBearer()
 
+# Decoded token payloads keyed by token hash, and user snapshots keyed by id.
+# Both are per-process; the TTL bounds how long another worker's change to a
+# user can go unnoticed.
+token_cache = MemoryCacheBackend(
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    default_ttl=settings.AUTH_CACHE_TTL_SECONDS,
+)
+principal_cache = MemoryCacheBackend(
+    max_entries=settings.AUTH_CACHE_MAX_ENTRIES,
+    default_ttl=settings.AUTH_CACHE_TTL_SECONDS,
+)
+
+PRINCIPAL_FIELDS = ("id", "email", "name", "is_guest", "is_active", "created_at")
+
 
 def hash_password(password: str) -> str:
     """
@@ -50,6 +71,49 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+# Global password hashing pool
+# bcrypt releases the GIL, so a few threads keep hashing off the event loop
+password_hash_pool = BoundedExecutor(
+    "password-hash",
+    workers=settings.AUTH_HASH_WORKERS,
+    max_pending=settings.AUTH_HASH_MAX_PENDING,
+    overloaded_detail="Too many sign-in requests right now, please retry shortly",
+)
+
+
+async def hash_password_async(password: str) -> str:
+    """
+    Hash a password on the bounded hashing pool.
+
+    Args:
+        password: Plain text password
+
+    Returns:
+        str: Hashed password
+
+    Raises:
+        ServiceOverloadedError: If the hashing pool is saturated
+    """
+    return await password_hash_pool.run(hash_password, password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verify a password on the bounded hashing pool.
+
+    Args:
+        plain_password: Plain text password
+        hashed_password: Hashed password from database
+
+    Returns:
+        bool: True if password matches, False otherwise
+
+    Raises:
+        ServiceOverloadedError: If the hashing pool is saturated
+    """
+    return await password_hash_pool.run(verify_password, plain_password, hashed_password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """
     Create a JWT access token.
@@ -68,13 +132,27 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     else:
         expire = datetime.utcnow() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
 
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "iat": datetime.utcnow()})
     encoded_jwt = jwt.encode(
         to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
     return encoded_jwt
 
 
+def create_guest_token() -> tuple:
+    """
+    Create a stateless guest session token.
+
+    No database row is created; see `get_current_persisted_user`.
+
+    Returns:
+        tuple: (guest id, encoded JWT token)
+    """
+    guest_id = auth_service.new_guest_id()
+    token = create_access_token(data={"sub": str(guest_id), "is_guest": True})
+    return guest_id, token
+
+
 def verify_token(token: str) -> dict:
     """
     Verify and decode a JWT token.
@@ -100,6 +178,67 @@ def verify_token(token: str) -> dict:
         )
 
 
+def decode_token_cached(token: str) -> dict:
+    """
+    Verify and decode a JWT token, reusing earlier decodes of the same token.
+
+    Cached payloads never outlive the token's own expiry.
+
+    Args:
+        token: JWT token string
+
+    Returns:
+        dict: Decoded token payload
+
+    Raises:
+        HTTPException: If token is invalid or expired
+    """
+    key = hashlib.sha256(token.encode()).hexdigest()
+    payload = token_cache.get(key)
+    if payload is not None and payload.get("exp", 0) > time.time():
+        return payload
+
+    payload = verify_token(token)
+    remaining = int(payload.get("exp", 0) - time.time())
+    if remaining > 0:
+        token_cache.set(key, payload, ttl=min(remaining, settings.AUTH_CACHE_TTL_SECONDS))
+    return payload
+
+
+def invalidate_user(user_id) -> None:
+    """
+    Drop a cached user so the next request reloads it.
+
+    Call when a user's `is_active` flag changes or the user is deleted.
+    ORM updates and deletes of User rows call this automatically; bulk
+    statements that bypass the ORM must call it themselves.
+
+    Args:
+        user_id: User identifier
+    """
+    principal_cache.delete(str(user_id))
+
+
+@event.listens_for(User, "after_update")
+@event.listens_for(User, "after_delete")
+def _invalidate_user_on_change(mapper, connection, target) -> None:
+    invalidate_user(target.id)
+
+
+def get_user_by_id(db: Session, user_id: str) -> Optional[User]:
+    """
+    Load a user by id.
+
+    Args:
+        db: Database session
+        user_id: User identifier from the token subject
+
+    Returns:
+        Optional[User]: The user, or None if not found
+    """
+    return db.query(User).filter(User.id == user_id).first()
+
+
 async def get_current_user(
     credentials: HTTPAuthorizationCredentials = Depends(security),
     db: Session = Depends(get_db)
@@ -107,6 +246,10 @@ async def get_current_user(
     """
     Get the current authenticated user from JWT token.
 
+    On the hot path both the token decode and the user lookup are served
+    from short-lived in-process caches. A cached user is returned as a
+    detached User copy: reference it by id, do not add it to a session.
+
     Args:
         credentials: HTTP Bearer credentials
         db: Database session
@@ -118,7 +261,7 @@ async def get_current_user(
         HTTPException: If authentication fails
     """
     token = credentials.credentials
-    payload = verify_token(token)
+    payload = decode_token_cached(token)
 
     user_id: str = payload.get("sub")
     if user_id is None:
@@ -127,19 +270,75 @@ async def get_current_user(
             detail="Could not validate credentials",
         )
 
-    user = db.query(User).filter(User.id == user_id).first()
-    if user is None:
+    if payload.get("is_guest"):
+        try:
+            guest_id = uuid.UUID(user_id)
+        except ValueError:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Could not validate credentials",
+            )
+        issued_at = payload.get("iat")
+        return auth_service.build_guest_principal(
+            guest_id, datetime.utcfromtimestamp(issued_at) if issued_at else None)
+
+    snapshot = principal_cache.get(user_id)
+    if snapshot is not None:
+        user = User(**snapshot)
+    else:
+        user = await run_db(db, get_user_by_id, user_id)
+        if user is None:
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="User not found",
+            )
+        principal_cache.set(
+            user_id, {name: getattr(user, name) for name in PRINCIPAL_FIELDS})
+
+    if not user.is_active:
         raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Inactive user",
         )
 
+    return user
+
+
+async def get_current_persisted_user(
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Get the current user, creating the database row for a guest on first write.
+
+    Write endpoints depend on this instead of `get_current_user`, so every
+    guest that stores data has a row for ownership checks and the guest
+    reaper. Once persisted, guests are served from the principal cache.
+
+    Args:
+        current_user: Current user from token
+        db: Database session
+
+    Returns:
+        User: Current user backed by a database row
+    """
+    if not current_user.is_guest:
+        return current_user
+
+    user_id = str(current_user.id)
+    snapshot = principal_cache.get(user_id)
+    if snapshot is not None:
+        user = User(**snapshot)
+    else:
+        user = await run_db(db, auth_service.ensure_guest_user, current_user)
+        principal_cache.set(
+            user_id, {name: getattr(user, name) for name in PRINCIPAL_FIELDS})
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Inactive user",
         )
-
     return user
 
 
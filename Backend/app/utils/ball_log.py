@@ -0,0 +1,348 @@
+"""
+Packed Ball Log
+
+Compact in-memory representation of an innings' balls for live state. Each
+column is a typed `array`, the five boolean flags share one byte, and
+player names and wicket types are interned to integer ids in a shared
+`NameTable`, so a ball costs 49 bytes of column data instead of a full ORM
+`BallEvent` instance. Logs convert losslessly to and from `BallEvent` rows
+and to a self-contained byte string for cold storage.
+
+Usage:
+    python -m app.utils.ball_log benchmark --innings 10000
+"""
+
+import json
+import struct
+import sys
+import uuid
+from array import array
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from app.models.match import BallEvent
+
+FLAG_WICKET = 1
+FLAG_WIDE = 2
+FLAG_NO_BALL = 4
+FLAG_BYE = 8
+FLAG_LEG_BYE = 16
+
+FLAG_COLUMNS = (
+    ("is_wicket", FLAG_WICKET),
+    ("is_wide", FLAG_WIDE),
+    ("is_no_ball", FLAG_NO_BALL),
+    ("is_bye", FLAG_BYE),
+    ("is_leg_bye", FLAG_LEG_BYE),
+)
+
+# Sentinels for NULL columns
+NULL_RUNS = 0xFF
+NULL_TIMESTAMP = -(2 ** 63)
+
+# Largest positions the "H" over and "B" ball columns are allowed to hold;
+# BallEventCreate rejects anything beyond them
+MAX_OVER_NUMBER = 999
+MAX_BALL_NUMBER = 30
+
+# Serialized layout: magic, ball count, name table length, names, ids, columns
+SERIAL_MAGIC = b"PBL1"
+SERIAL_HEADER = struct.Struct("<4sII")
+SERIAL_COLUMNS = ("over", "ball", "runs", "flags", "batsman", "bowler",
+                  "wicket_type", "batsman_id", "bowler_id", "created_at")
+
+# Columns holding NameTable ids
+INTERNED_COLUMNS = ("batsman", "bowler", "wicket_type", "batsman_id", "bowler_id")
+
+EPOCH = datetime(1970, 1, 1)
+MICROSECOND = timedelta(microseconds=1)
+
+
+class NameTable:
+    """
+    Interns strings to small integer ids. Id 0 is reserved for None.
+
+    Shared by all live innings so a player's name is stored once. Player
+    identity keys are interned in their string form.
+    """
+    __slots__ = ("_ids", "_names")
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._names: List[Optional[str]] = [None]
+
+    def intern(self, name: Optional[str]) -> int:
+        if name is None:
+            return 0
+        name_id = self._ids.get(name)
+        if name_id is None:
+            name_id = self._ids[name] = len(self._names)
+            self._names.append(name)
+        return name_id
+
+    def name(self, name_id: int) -> Optional[str]:
+        return self._names[name_id]
+
+    def __len__(self) -> int:
+        return len(self._names) - 1
+
+
+def _pack_flags(ball) -> int:
+    flags = 0
+    for column, bit in FLAG_COLUMNS:
+        if getattr(ball, column):
+            flags |= bit
+    return flags
+
+
+def _pack_timestamp(value: Optional[datetime]) -> int:
+    if value is None:
+        return NULL_TIMESTAMP
+    return (value - EPOCH) // MICROSECOND
+
+
+def _key(player_id: Optional[uuid.UUID]) -> Optional[str]:
+    return str(player_id) if player_id is not None else None
+
+
+def _player_id(key: Optional[str]) -> Optional[uuid.UUID]:
+    return uuid.UUID(key) if key is not None else None
+
+
+def _unpack_timestamp(value: int) -> Optional[datetime]:
+    if value == NULL_TIMESTAMP:
+        return None
+    return EPOCH + value * MICROSECOND
+
+
+class PackedBallLog:
+    """
+    Column-packed ball log of one innings.
+
+    Flags that are NULL in the database unpack as False; every other column,
+    including NULL runs, names and timestamps, round-trips exactly.
+
+    Args:
+        innings_id: Innings the balls belong to
+        names: Shared name table for players and wicket types
+    """
+    __slots__ = ("innings_id", "names", "ids", "over", "ball", "runs", "flags",
+                 "batsman", "bowler", "wicket_type", "batsman_id", "bowler_id",
+                 "created_at")
+
+    def __init__(self, innings_id: uuid.UUID, names: NameTable):
+        self.innings_id = innings_id
+        self.names = names
+        self.ids = bytearray()           # 16 bytes per ball
+        self.over = array("H")
+        self.ball = array("B")
+        self.runs = array("B")
+        self.flags = array("B")
+        self.batsman = array("I")
+        self.bowler = array("I")
+        self.wicket_type = array("I")
+        self.batsman_id = array("I")
+        self.bowler_id = array("I")
+        self.created_at = array("q")     # Microseconds since the epoch
+
+    @classmethod
+    def from_ball_events(cls, innings_id: uuid.UUID, balls: Iterable[BallEvent],
+                         names: NameTable) -> "PackedBallLog":
+        """
+        Pack BallEvent rows, in (over, ball) order.
+
+        Args:
+            innings_id: Innings the balls belong to
+            balls: BallEvent rows
+            names: Shared name table
+
+        Returns:
+            PackedBallLog: Packed log
+        """
+        log = cls(innings_id, names)
+        for ball in balls:
+            log.append(ball)
+        return log
+
+    def append(self, ball) -> None:
+        """
+        Append a ball.
+
+        Args:
+            ball: BallEvent, or any object with the same attributes
+        """
+        self.ids += (ball.id or uuid.uuid4()).bytes
+        self.over.append(ball.over_number)
+        self.ball.append(ball.ball_number)
+        self.runs.append(NULL_RUNS if ball.runs is None else ball.runs)
+        self.flags.append(_pack_flags(ball))
+        self.batsman.append(self.names.intern(ball.batsman_name))
+        self.bowler.append(self.names.intern(ball.bowler_name))
+        self.wicket_type.append(self.names.intern(ball.wicket_type))
+        self.batsman_id.append(self.names.intern(_key(ball.batsman_id)))
+        self.bowler_id.append(self.names.intern(_key(ball.bowler_id)))
+        self.created_at.append(_pack_timestamp(ball.created_at))
+
+    def ball_event(self, index: int) -> BallEvent:
+        """
+        Unpack one ball as a transient BallEvent.
+
+        Args:
+            index: Position in the log
+
+        Returns:
+            BallEvent: Unsaved instance equal to the packed row
+        """
+        flags = self.flags[index]
+        runs = self.runs[index]
+        return BallEvent(
+            id=uuid.UUID(bytes=bytes(self.ids[index * 16:index * 16 + 16])),
+            innings_id=self.innings_id,
+            over_number=self.over[index],
+            ball_number=self.ball[index],
+            batsman_name=self.names.name(self.batsman[index]),
+            bowler_name=self.names.name(self.bowler[index]),
+            runs=None if runs == NULL_RUNS else runs,
+            wicket_type=self.names.name(self.wicket_type[index]),
+            batsman_id=_player_id(self.names.name(self.batsman_id[index])),
+            bowler_id=_player_id(self.names.name(self.bowler_id[index])),
+            created_at=_unpack_timestamp(self.created_at[index]),
+            **{column: bool(flags & bit) for column, bit in FLAG_COLUMNS}
+        )
+
+    def to_ball_events(self) -> List[BallEvent]:
+        """Unpack every ball as transient BallEvent instances."""
+        return [self.ball_event(i) for i in range(len(self))]
+
+    def __iter__(self) -> Iterator[BallEvent]:
+        for i in range(len(self)):
+            yield self.ball_event(i)
+
+    def __len__(self) -> int:
+        return len(self.over)
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the log with its own name table.
+
+        Columns are written little-endian, so the bytes are portable.
+
+        Returns:
+            bytes: Serialized log (not compressed)
+        """
+        local = NameTable()
+        remap = {}
+        for column in INTERNED_COLUMNS:
+            for name_id in set(getattr(self, column)):
+                remap[name_id] = local.intern(self.names.name(name_id))
+
+        names = json.dumps(local._names[1:]).encode()
+        parts = [SERIAL_HEADER.pack(SERIAL_MAGIC, len(self), len(names)), names, bytes(self.ids)]
+        for column in SERIAL_COLUMNS:
+            values = getattr(self, column)
+            if column in INTERNED_COLUMNS:
+                values = array(values.typecode, (remap[name_id] for name_id in values))
+            elif sys.byteorder == "big":
+                values = array(values.typecode, values)
+            if sys.byteorder == "big":
+                values.byteswap()
+            parts.append(values.tobytes())
+        return b"".join(parts)
+
+    @classmethod
+    def from_bytes(cls, innings_id: uuid.UUID, data: bytes, names: NameTable) -> "PackedBallLog":
+        """
+        Deserialize a log written by `to_bytes`.
+
+        Args:
+            innings_id: Innings the balls belong to
+            data: Serialized log
+            names: Name table to intern the log's names into
+
+        Returns:
+            PackedBallLog: Deserialized log
+
+        Raises:
+            ValueError: If the data is not a serialized ball log
+        """
+        magic, count, names_length = SERIAL_HEADER.unpack_from(data)
+        if magic != SERIAL_MAGIC:
+            raise ValueError("Not a packed ball log")
+
+        offset = SERIAL_HEADER.size
+        local_names = json.loads(data[offset:offset + names_length])
+        offset += names_length
+        remap = [0] + [names.intern(name) for name in local_names]
+
+        log = cls(innings_id, names)
+        log.ids = bytearray(data[offset:offset + count * 16])
+        offset += count * 16
+        for column in SERIAL_COLUMNS:
+            values = array(getattr(log, column).typecode)
+            size = values.itemsize * count
+            values.frombytes(data[offset:offset + size])
+            offset += size
+            if sys.byteorder == "big":
+                values.byteswap()
+            if column in INTERNED_COLUMNS:
+                values = array(values.typecode, (remap[name_id] for name_id in values))
+            setattr(log, column, values)
+        return log
+
+    def nbytes(self) -> int:
+        """Bytes held by the packed columns."""
+        return len(self.ids) + sum(
+            getattr(self, column).itemsize * len(self) for column in SERIAL_COLUMNS)
+
+
+def _benchmark(innings: int, balls_per_innings: int) -> dict:
+    """Measure memory held by packed logs of synthetic innings."""
+    import gc
+    import tracemalloc
+    from types import SimpleNamespace
+
+    players = [f"Player {i}" for i in range(22)]
+    player_ids = [uuid.uuid4() for _ in players]
+    created = datetime.utcnow()
+    template = [
+        SimpleNamespace(
+            id=uuid.uuid4(), over_number=i // 6, ball_number=i % 6 + 1,
+            batsman_name=players[i % 11], bowler_name=players[11 + (i // 6) % 5],
+            runs=i % 7, is_wicket=i % 29 == 0, wicket_type="bowled" if i % 29 == 0 else None,
+            is_wide=i % 17 == 0, is_no_ball=False, is_bye=False, is_leg_bye=i % 23 == 0,
+            batsman_id=player_ids[i % 11], bowler_id=player_ids[11 + (i // 6) % 5],
+            created_at=created + i * MICROSECOND,
+        )
+        for i in range(balls_per_innings)
+    ]
+
+    gc.collect()
+    tracemalloc.start()
+    names = NameTable()
+    logs = [
+        PackedBallLog.from_ball_events(uuid.uuid4(), template, names)
+        for _ in range(innings)
+    ]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    balls = innings * balls_per_innings
+    return {
+        "innings": innings,
+        "balls": balls,
+        "packed_bytes": sum(log.nbytes() for log in logs),
+        "traced_bytes": current,
+        "bytes_per_ball": round(current / balls, 1),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Packed ball log tools")
+    parser.add_argument("command", choices=["benchmark"])
+    parser.add_argument("--innings", type=int, default=10000)
+    parser.add_argument("--balls", type=int, default=120)
+    args = parser.parse_args()
+
+    print(_benchmark(args.innings, args.balls))
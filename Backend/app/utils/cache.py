@@ -0,0 +1,225 @@
+"""
+Cache Utilities
+
+Small key/value cache abstraction with an in-process LRU/TTL backend and a
+Redis-compatible backend. Values are JSON-serializable objects; counters
+(used for version stamps) are kept apart from evictable entries.
+"""
+
+import json
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+from app.config.settings import settings
+
+
+class CacheStats:
+    """Hit, miss and eviction counters for a cache backend."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.sets = 0
+
+    def to_dict(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "sets": self.sets,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class CacheBackend(ABC):
+    """
+    Interface implemented by cache backends.
+
+    Mirrors the subset of Redis commands the application relies on so a
+    Redis client (or a local fake of one) can be dropped in.
+    """
+
+    def __init__(self):
+        self.stats = CacheStats()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Get a value, or None if it is missing or expired."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """Store a value, expiring after `ttl` seconds (the default TTL if None)."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+
+    @abstractmethod
+    def incr(self, key: str) -> int:
+        """Increment a counter and return its new value."""
+
+    @abstractmethod
+    def get_counter(self, key: str) -> int:
+        """Get a counter's current value without incrementing it."""
+
+    @abstractmethod
+    def size(self) -> int:
+        """Number of cached values."""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Thread-safe in-process cache with LRU eviction and per-entry TTL.
+
+    Counters are bounded by the same LRU limit. A counter that was evicted
+    restarts above every value evicted so far, so a version counter never
+    repeats a number an older cached view may still be stored under.
+
+    Args:
+        max_entries: Maximum number of cached values before LRU eviction
+        default_ttl: Default time-to-live in seconds (None for no expiry)
+    """
+
+    def __init__(self, max_entries: int = 1024, default_ttl: Optional[int] = None):
+        super().__init__()
+        self.max_entries = max_entries
+        self.default_ttl = default_ttl
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._counters: "OrderedDict[str, int]" = OrderedDict()
+        self._counter_floor = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                self.stats.evictions += 1
+                self.stats.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats.hits += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl else None
+
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            self.stats.sets += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def incr(self, key: str) -> int:
+        with self._lock:
+            value = self._counters.get(key, self._counter_floor) + 1
+            self._counters[key] = value
+            self._counters.move_to_end(key)
+            while len(self._counters) > self.max_entries:
+                _, evicted = self._counters.popitem(last=False)
+                self._counter_floor = max(self._counter_floor, evicted + 1)
+            return value
+
+    def get_counter(self, key: str) -> int:
+        with self._lock:
+            value = self._counters.get(key)
+            if value is None:
+                return self._counter_floor
+            self._counters.move_to_end(key)
+            return value
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Cache backend on top of a Redis-compatible client.
+
+    The client only needs `get`, `set(key, value, ex=...)`, `delete`, `incr`
+    and `dbsize`, so a local fake can stand in for tests. Eviction is left to
+    Redis (configure `maxmemory-policy allkeys-lru`).
+
+    Args:
+        client: Redis-compatible client
+        default_ttl: Default time-to-live in seconds
+    """
+
+    def __init__(self, client, default_ttl: Optional[int] = None):
+        super().__init__()
+        self.client = client
+        self.default_ttl = default_ttl
+
+    def get(self, key: str) -> Optional[Any]:
+        raw = self.client.get(key)
+        if raw is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return json.loads(raw)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        ttl = self.default_ttl if ttl is None else ttl
+        self.client.set(key, json.dumps(value, default=str), ex=ttl or None)
+        self.stats.sets += 1
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+    def incr(self, key: str) -> int:
+        return int(self.client.incr(key))
+
+    def get_counter(self, key: str) -> int:
+        raw = self.client.get(key)
+        return int(raw) if raw is not None else 0
+
+    def size(self) -> int:
+        return int(self.client.dbsize())
+
+
+def create_cache_backend(backend: str, max_entries: int, default_ttl: Optional[int]) -> CacheBackend:
+    """
+    Create a cache backend by name.
+
+    Args:
+        backend: "memory" or "redis"
+        max_entries: LRU bound for the memory backend
+        default_ttl: Default entry time-to-live in seconds
+
+    Returns:
+        CacheBackend: Configured backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+        RuntimeError: If the redis backend is selected but not installed
+    """
+    if backend == "memory":
+        return MemoryCacheBackend(max_entries=max_entries, default_ttl=default_ttl)
+
+    if backend == "redis":
+        try:
+            import redis
+        except ImportError:
+            raise RuntimeError(
+                "CACHE_BACKEND=redis requires the 'redis' package to be installed")
+        return RedisCacheBackend(redis.Redis.from_url(settings.REDIS_URL), default_ttl=default_ttl)
+
+    raise ValueError(f"Unknown cache backend: {backend}")
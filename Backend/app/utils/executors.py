@@ -0,0 +1,85 @@
+"""
+Bounded Executors
+
+Thread pools for blocking work that releases the GIL (bcrypt, Pillow),
+with a cap on running plus queued jobs. Past the cap, callers are shed with
+a 429 instead of piling up behind the pool.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+from app.utils.exceptions import ServiceOverloadedError
+
+T = TypeVar("T")
+
+
+class BoundedExecutor:
+    """
+    Bounded thread pool run from async code.
+
+    A slot is held until the job itself finishes, not until its caller
+    stops waiting, so cancelled requests cannot push the pool past
+    `max_pending`. Cancelling a caller cancels its job if it has not
+    started yet.
+
+    Args:
+        name: Thread name prefix
+        workers: Number of threads
+        max_pending: Maximum running plus queued jobs
+        overloaded_detail: Error detail when the pool is saturated
+    """
+
+    def __init__(self, name: str, workers: int, max_pending: int, overloaded_detail: str):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.overloaded_detail = overloaded_detail
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=name)
+
+    def _finished(self, future: Future) -> None:
+        # Runs on the worker thread, or at cancellation for jobs never started
+        with self._lock:
+            self.pending -= 1
+            if future.cancelled():
+                self.cancelled += 1
+            elif future.exception() is not None:
+                self.failed += 1
+            else:
+                self.completed += 1
+
+    async def run(self, fn: Callable[..., T], *args) -> T:
+        """
+        Run a function on the pool.
+
+        Raises:
+            ServiceOverloadedError: If the pool is saturated
+        """
+        with self._lock:
+            if self.pending >= self.max_pending:
+                self.rejected += 1
+                raise ServiceOverloadedError(self.overloaded_detail)
+            self.pending += 1
+
+        future = self._executor.submit(fn, *args)
+        future.add_done_callback(self._finished)
+        return await asyncio.wrap_future(future)
+
+    def stats(self) -> dict:
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "queue_depth": max(0, self.pending - self.workers),
+            "completed": self.completed,
+            "failed": self.failed,
+            "cancelled": self.cancelled,
+            "rejected": self.rejected,
+        }
@@ -2,16 +2,105 @@
 File Upload Utilities
 
 Handles file validation, upload, and storage.
+
+Uploads are streamed to a local work directory in chunks, hashed on the
+way, and rejected as soon as they pass MAX_FILE_SIZE. Storage is
+content-addressed: the SHA-256 of the bytes names the object, in a sharded
+layout, so identical uploads are stored (and resized) once. Each image is
+stored as the original plus resized WebP and JPEG variants:
+
+    players/ab/cd/<sha256>.jpg                 original
+    players/ab/cd/<sha256>_avatar.webp         128x128 square crop
+    players/ab/cd/<sha256>_thumbnail.webp      fits 320x320
+    players/ab/cd/<sha256>_full.webp           fits 1600x1600
+    (and the same variants as .jpg for clients without WebP)
+
+Objects live in the configured storage backend (app.utils.storage), and
+reference counts in the stored_files table, so any replica can save or
+delete. References belong to the rows that use a key: a player or user
+profile adds one when its `profile_image_url` takes a key and drops it
+when the image is replaced or the profile deleted, in the same
+transaction. Content whose last reference goes is purged after the commit;
+uploads never attached are purged by `purge_orphaned_uploads` once
+UPLOAD_ORPHAN_RETENTION_HOURS pass. Pillow work runs on a bounded
+worker pool, off the event loop. `get_file_url` selects a variant.
+
+With an object storage backend, clients can also upload straight to the
+bucket (`presign_direct_upload`) and then register the object
+(`save_direct_upload`), so the request body never passes through the API.
 """
 
+import asyncio
+import hashlib
+import logging
 import os
+import posixpath
+import re
+import shutil
+import tempfile
 import uuid
-from typing import Optional
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 from fastapi import UploadFile, HTTPException, status
-from PIL import Image
+from fastapi.staticfiles import StaticFiles
+from PIL import Image, ImageOps
+from sqlalchemy import event, func, inspect, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, object_session
+from starlette.datastructures import Headers
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import NotModifiedResponse
+from starlette.types import Scope
 import aiofiles
 
+from app.config.database import SessionLocal, engine
 from app.config.settings import settings
+from app.models.player import PlayerProfile
+from app.models.upload import StoredFile
+from app.models.user import UserProfile
+from app.utils.executors import BoundedExecutor
+from app.utils.storage import IMMUTABLE_CACHE_CONTROL, storage
+
+logger = logging.getLogger(__name__)
+
+# Variant name -> (max width, max height, square crop)
+IMAGE_VARIANTS: Dict[str, Tuple[int, int, bool]] = {
+    "avatar": (128, 128, True),
+    "thumbnail": (320, 320, False),
+    "full": (1600, 1600, False),
+}
+
+# Variant formats: extension -> (Pillow format, save options)
+VARIANT_FORMATS: Dict[str, Tuple[str, dict]] = {
+    "webp": ("WEBP", {"quality": 80, "method": 4}),
+    "jpg": ("JPEG", {"quality": 82, "optimize": True, "progressive": True}),
+}
+
+CONTENT_TYPES = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+}
+
+# Prefix for direct uploads awaiting `save_direct_upload`; expire it with a
+# bucket lifecycle rule so abandoned uploads are cleaned up
+DIRECT_UPLOAD_PREFIX = "incoming/"
+DIRECT_UPLOAD_KEY = re.compile(r"^incoming/[0-9a-f]{32}\.([a-z0-9]+)$")
+
+# Refuse decompression bombs before any pixel data is decoded
+Image.MAX_IMAGE_PIXELS = settings.IMAGE_MAX_PIXELS
+
+
+# Global image processing pool
+# Pillow releases the GIL while decoding, resampling and encoding
+image_worker_pool = BoundedExecutor(
+    "image-worker",
+    workers=settings.IMAGE_WORKERS,
+    max_pending=settings.IMAGE_MAX_PENDING,
+    overloaded_detail="Too many uploads being processed right now, please retry shortly",
+)
 
 
 def validate_file(file: UploadFile) -> bool:
@@ -34,14 +123,30 @@ def validate_file(file: UploadFile) -> bool:
             detail="No filename provided"
         )
 
-    file_ext = file.filename.split(".")[-1].lower()
+    _validate_extension(file.filename)
+
+    # Reject early when the multipart part declared its size
+    if file.size is not None and file.size > settings.MAX_FILE_SIZE:
+        raise _too_large()
+
+    return True
+
+
+def _validate_extension(filename: str) -> str:
+    file_ext = filename.split(".")[-1].lower()
     if file_ext not in settings.ALLOWED_EXTENSIONS:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"File type not allowed. Allowed types: {', '.join(settings.ALLOWED_EXTENSIONS)}"
         )
+    return file_ext
 
-    return True
+
+def _too_large() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+        detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE / 1024 / 1024}MB"
+    )
 
 
 def generate_unique_filename(original_filename: str) -> str:
@@ -59,64 +164,246 @@ def generate_unique_filename(original_filename: str) -> str:
     return unique_name
 
 
-async def save_file(file: UploadFile, directory: str = None) -> str:
+def content_path(digest: str, original_filename: str, directory: Optional[str] = None) -> str:
+    """
+    Content-addressed storage key of an upload.
+
+    Files are sharded two levels deep by hash prefix, so no directory grows
+    past a few hundred entries.
+
+    Args:
+        digest: Hex SHA-256 of the file contents
+        original_filename: Uploaded file name, for its extension
+        directory: Optional top-level directory
+
+    Returns:
+        str: Storage key
     """
-    Save uploaded file to disk.
+    file_ext = original_filename.split(".")[-1].lower()
+    if file_ext == "jpeg":
+        file_ext = "jpg"
+    path = posixpath.join(digest[:2], digest[2:4], f"{digest}.{file_ext}")
+    return posixpath.join(directory, path) if directory else path
+
+
+def variant_path(file_path: str, variant: str, image_format: str = "webp") -> str:
+    """
+    Path of a resized variant of a stored image.
 
     Args:
-        file: Uploaded file
-        directory: Optional subdirectory within UPLOAD_DIR
+        file_path: Storage key or local path of the original
+        variant: Variant name from IMAGE_VARIANTS
+        image_format: Extension from VARIANT_FORMATS
 
     Returns:
-        str: Relative file path
+        str: Variant path in the same form as `file_path`
 
     Raises:
-        HTTPException: If save fails
+        ValueError: If the variant or format is unknown
+    """
+    if variant not in IMAGE_VARIANTS:
+        raise ValueError(f"Unknown image variant: {variant}")
+    if image_format not in VARIANT_FORMATS:
+        raise ValueError(f"Unknown image format: {image_format}")
+    stem = posixpath.splitext(file_path)[0]
+    return f"{stem}_{variant}.{image_format}"
+
+
+def variant_keys(key: str) -> List[str]:
+    """Storage keys of every resized variant of an original."""
+    return [
+        variant_path(key, variant, image_format)
+        for variant in IMAGE_VARIANTS for image_format in VARIANT_FORMATS
+    ]
+
+
+def process_image(file_path: str) -> Dict[str, str]:
+    """
+    Verify an uploaded image and write its resized variants.
+
+    Runs on the image worker pool. Orientation from EXIF is applied to the
+    variants, which are written without metadata.
+
+    Args:
+        file_path: Absolute path of the original
+
+    Returns:
+        Dict[str, str]: "<variant>.<format>" to variant path
+
+    Raises:
+        HTTPException: If the file is not a valid image
     """
     try:
-        # Validate file
-        validate_file(file)
+        with Image.open(file_path) as img:
+            img.verify()
+        # verify() leaves the image unusable, so decode from a fresh handle
+        with Image.open(file_path) as img:
+            img = ImageOps.exif_transpose(img)
+            img.load()
+    except (OSError, SyntaxError, ValueError, Image.DecompressionBombError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid image file"
+        )
 
-        # Generate unique filename
-        unique_filename = generate_unique_filename(file.filename)
+    has_alpha = img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info)
+    img = img.convert("RGBA" if has_alpha else "RGB")
 
-        # Determine save path
-        if directory:
-            save_dir = os.path.join(settings.UPLOAD_DIR, directory)
-            os.makedirs(save_dir, exist_ok=True)
-            file_path = os.path.join(save_dir, unique_filename)
-            relative_path = os.path.join(directory, unique_filename)
+    written = {}
+    for variant, (width, height, crop) in IMAGE_VARIANTS.items():
+        if crop:
+            resized = ImageOps.fit(img, (width, height), Image.Resampling.LANCZOS)
         else:
-            file_path = os.path.join(settings.UPLOAD_DIR, unique_filename)
-            relative_path = unique_filename
+            resized = img.copy()
+            resized.thumbnail((width, height), Image.Resampling.LANCZOS)
+
+        for image_format, (pillow_format, options) in VARIANT_FORMATS.items():
+            out = resized
+            if pillow_format == "JPEG" and out.mode != "RGB":
+                # JPEG has no alpha; flatten onto white
+                background = Image.new("RGB", out.size, (255, 255, 255))
+                background.paste(out, mask=out.getchannel("A"))
+                out = background
+            path = variant_path(file_path, variant, image_format)
+            out.save(path, pillow_format, **options)
+            written[f"{variant}.{image_format}"] = path
+    return written
+
+
+@contextmanager
+def _content_lock(key: str):
+    """
+    Serialize storing and deleting one content key across replicas.
 
-        # Save file
-        async with aiofiles.open(file_path, 'wb') as out_file:
-            content = await file.read()
+    A session-level advisory lock on a dedicated connection, so it spans
+    several transactions and the storage calls between them.
+    """
+    with engine.connect() as connection:
+        connection.execute(text("SELECT pg_advisory_lock(hashtext(:key))"), {"key": key})
+        try:
+            yield
+        finally:
+            connection.execute(text("SELECT pg_advisory_unlock(hashtext(:key))"), {"key": key})
+            connection.commit()
 
-            # Check file size
-            if len(content) > settings.MAX_FILE_SIZE:
-                raise HTTPException(
-                    status_code=status.HTTP_400_BAD_REQUEST,
-                    detail=f"File size exceeds maximum allowed size of {settings.MAX_FILE_SIZE / 1024 / 1024}MB"
-                )
 
-            await out_file.write(content)
+def _touch_stored(key: str) -> bool:
+    """Restart the orphan grace period of stored content; False if it is not stored."""
+    db = SessionLocal()
+    try:
+        updated = db.query(StoredFile).filter(StoredFile.key == key).update(
+            {StoredFile.created_at: datetime.utcnow()}, synchronize_session=False)
+        db.commit()
+        return bool(updated)
+    finally:
+        db.close()
 
-        # Verify it's a valid image
-        try:
-            img = Image.open(file_path)
-            img.verify()
-        except Exception:
-            # Delete invalid file
-            if os.path.exists(file_path):
-                os.remove(file_path)
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid image file"
+
+def _register(key: str, size: int, content_type: str) -> None:
+    """Record newly stored content, not yet referenced by any row."""
+    db = SessionLocal()
+    try:
+        db.execute(
+            pg_insert(StoredFile).values(
+                key=key, ref_count=0, size=size,
+                content_type=content_type, created_at=datetime.utcnow(),
+            ).on_conflict_do_update(
+                index_elements=[StoredFile.key],
+                set_={"created_at": datetime.utcnow()},
             )
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+def store_image(local_path: str, key: str) -> bool:
+    """
+    Verify and resize a local upload and store it under `key`.
+
+    Runs on the image worker pool. When the content is already stored no
+    Pillow or storage work is done. Concurrent first uploads of the same
+    content both write the same objects, which is harmless. Objects are
+    written under the content lock, so a concurrent purge cannot remove them
+    after they are registered. The content stays unreferenced until a
+    profile takes its key.
+
+    Args:
+        local_path: Path of the upload in its work directory
+        key: Content-addressed storage key
+
+    Returns:
+        bool: True if the content was already stored
+
+    Raises:
+        HTTPException: If the file is not a valid image
+    """
+    if _touch_stored(key):
+        return True
+
+    size = os.path.getsize(local_path)
+    variants = process_image(local_path)
+    content_type = CONTENT_TYPES.get(key.rsplit(".", 1)[-1], "application/octet-stream")
+    with _content_lock(key):
+        for name, path in variants.items():
+            variant, image_format = name.split(".")
+            storage.put_file(variant_path(key, variant, image_format), path, CONTENT_TYPES[image_format])
+
+        # The original goes last, so an existing original implies its variants
+        storage.put_file(key, local_path, content_type)
+        _register(key, size, content_type)
+    return False
+
 
-        return relative_path
+async def save_file(file: UploadFile, directory: str = None) -> str:
+    """
+    Save an uploaded image and its resized variants to storage.
+
+    By the time this runs Starlette has already spooled the multipart body;
+    its size is capped before parsing by BodySizeLimitMiddleware. The file
+    is copied in UPLOAD_CHUNK_SIZE chunks to a private work file, hashed as
+    it is read, and rejected as soon as it exceeds MAX_FILE_SIZE.
+    Identical content is stored once. The key is unreferenced until a
+    profile takes it.
+
+    Args:
+        file: Uploaded file
+        directory: Optional top-level directory, e.g. "players"
+
+    Returns:
+        str: Storage key of the original; pass it to `get_file_url`
+
+    Raises:
+        HTTPException: If the file is invalid or the save fails
+        ServiceOverloadedError: If the image worker pool is saturated
+    """
+    work_dir = None
+    try:
+        # Validate file
+        validate_file(file)
+
+        # Stream to a private work directory so a partial upload is never stored
+        work_dir = tempfile.mkdtemp(prefix="upload-")
+        local_path = os.path.join(work_dir, generate_unique_filename(file.filename))
+        digest = hashlib.sha256()
+        size = 0
+        async with aiofiles.open(local_path, 'wb') as out_file:
+            while True:
+                chunk = await file.read(settings.UPLOAD_CHUNK_SIZE)
+                if not chunk:
+                    break
+                size += len(chunk)
+                if size > settings.MAX_FILE_SIZE:
+                    raise _too_large()
+                digest.update(chunk)
+                await out_file.write(chunk)
+
+        key = content_path(digest.hexdigest(), file.filename, directory)
+
+        # Deduplicate, verify, resize and store off the event loop
+        await image_worker_pool.run(store_image, local_path, key)
+
+        return key
 
     except HTTPException:
         raise
@@ -125,36 +412,279 @@ async def save_file(file: UploadFile, directory: str = None) -> str:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to save file: {str(e)}"
         )
+    finally:
+        if work_dir:
+            shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def presign_direct_upload(filename: str) -> dict:
+    """
+    Presign an upload of an image straight to object storage.
+
+    The client POSTs the file to the returned URL with the returned form
+    fields, then calls `save_direct_upload` with the upload id. The storage
+    service enforces MAX_FILE_SIZE.
+
+    Args:
+        filename: Name of the file to upload, for its type
+
+    Returns:
+        dict: upload_id, url, fields, max_size and expires_in
+
+    Raises:
+        HTTPException: If the file type is not allowed or the storage
+            backend does not support direct uploads
+    """
+    file_ext = _validate_extension(filename)
+    if not storage.supports_direct_upload:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Direct uploads need an object storage backend; upload through the API instead"
+        )
+
+    upload_id = f"{DIRECT_UPLOAD_PREFIX}{uuid.uuid4().hex}.{file_ext}"
+    presigned = storage.presign_upload(upload_id, CONTENT_TYPES[file_ext], settings.MAX_FILE_SIZE)
+    return {
+        "upload_id": upload_id,
+        "url": presigned["url"],
+        "fields": presigned["fields"],
+        "max_size": settings.MAX_FILE_SIZE,
+        "expires_in": settings.S3_PRESIGN_EXPIRE_SECONDS,
+    }
+
+
+def _upload_not_found() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_404_NOT_FOUND,
+        detail="Upload not found"
+    )
+
+
+def _store_direct_upload(upload_id: str, directory: Optional[str]) -> str:
+    if not storage.exists(upload_id):
+        raise _upload_not_found()
+    if storage.size(upload_id) > settings.MAX_FILE_SIZE:
+        storage.delete([upload_id])
+        raise _too_large()
+
+    work_dir = tempfile.mkdtemp(prefix="upload-")
+    try:
+        local_path = os.path.join(work_dir, posixpath.basename(upload_id))
+        storage.get_file(upload_id, local_path)
+        digest = hashlib.sha256()
+        with open(local_path, "rb") as f:
+            for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+                digest.update(chunk)
+
+        key = content_path(digest.hexdigest(), upload_id, directory)
+        store_image(local_path, key)
+        return key
+    finally:
+        storage.delete([upload_id])
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+async def save_direct_upload(upload_id: str, directory: str = None) -> str:
+    """
+    Register an image uploaded with `presign_direct_upload`.
+
+    The object is fetched once on the image worker pool to verify it and
+    build its variants, then stored under its content-addressed key.
+
+    Args:
+        upload_id: Upload id returned by `presign_direct_upload`
+        directory: Optional top-level directory, e.g. "players"
+
+    Returns:
+        str: Storage key of the original; pass it to `get_file_url`
+
+    Raises:
+        HTTPException: If the upload is unknown, too large or not a valid image
+        ServiceOverloadedError: If the image worker pool is saturated
+    """
+    if not DIRECT_UPLOAD_KEY.match(upload_id):
+        raise _upload_not_found()
+    return await image_worker_pool.run(_store_direct_upload, upload_id, directory)
+
+
+def purge_if_unreferenced(key: str, saved_before: Optional[datetime] = None) -> bool:
+    """
+    Delete stored content and its variants if no row references it.
+
+    The stored_files row is deleted and committed first, so a failed storage
+    call can only leave unreferenced objects behind; the content lock keeps
+    a concurrent save of the same content from storing it in between.
+
+    Args:
+        key: Storage key, as returned by `save_file`
+        saved_before: Only purge content last saved before this time
+
+    Returns:
+        bool: True if the content was purged
+    """
+    with _content_lock(key):
+        db = SessionLocal()
+        try:
+            stored = db.query(StoredFile).filter(
+                StoredFile.key == key).with_for_update().first()
+            if stored is None or stored.ref_count > 0:
+                return False
+            if saved_before is not None and stored.created_at and stored.created_at >= saved_before:
+                return False
+            db.delete(stored)
+            db.commit()
+        except Exception:
+            db.rollback()
+            return False
+        finally:
+            db.close()
+
+        try:
+            storage.delete([key] + variant_keys(key))
+        except Exception:
+            return False
+        return True
 
 
-def delete_file(file_path: str) -> bool:
+def purge_orphaned_uploads(older_than_hours: int, batch_size: int = 500) -> int:
     """
-    Delete a file from storage.
+    Purge uploads that no row has referenced since they were last saved.
 
     Args:
-        file_path: Relative file path
+        older_than_hours: Grace period for clients to attach an upload
+        batch_size: Keys examined per run
 
     Returns:
-        bool: True if deleted successfully
+        int: Number of uploads purged
     """
+    cutoff = datetime.utcnow() - timedelta(hours=older_than_hours)
+    db = SessionLocal()
+    try:
+        keys = [key for (key,) in db.query(StoredFile.key).filter(
+            StoredFile.ref_count <= 0, StoredFile.created_at < cutoff
+        ).limit(batch_size)]
+    finally:
+        db.close()
+    return sum(purge_if_unreferenced(key, saved_before=cutoff) for key in keys)
+
+
+# Sessions collect the keys their rows let go of, to purge after commit
+RELEASED_UPLOADS = "released_uploads"
+
+
+def _is_upload_key(key: Optional[str]) -> bool:
+    # Only keys from save_file are counted; URLs stored by older clients are not
+    return bool(key) and "://" not in key
+
+
+def _reference(connection, target, key: Optional[str], delta: int) -> None:
+    """Count a row taking (+1) or letting go of (-1) a key, in the row's transaction."""
+    if not _is_upload_key(key):
+        return
+    stored_files = StoredFile.__table__
+    connection.execute(
+        update(stored_files).where(stored_files.c.key == key).values(
+            ref_count=func.greatest(stored_files.c.ref_count + delta, 0)))
+    if delta < 0:
+        object_session(target).info.setdefault(RELEASED_UPLOADS, set()).add(key)
+
+
+def _load_replaced_image(target, value, oldvalue, initiator):
+    """Load the previous key on assignment, so the flush sees what was replaced."""
+    return value
+
+
+def _reference_inserted_image(mapper, connection, target) -> None:
+    _reference(connection, target, target.profile_image_url, 1)
+
+
+def _reference_replaced_image(mapper, connection, target) -> None:
+    history = inspect(target).attrs.profile_image_url.history
+    added, deleted = history.added or (), history.deleted or ()
+    for key in added:
+        if key not in deleted:
+            _reference(connection, target, key, 1)
+    for key in deleted:
+        if key not in added:
+            _reference(connection, target, key, -1)
+
+
+def _release_deleted_image(mapper, connection, target) -> None:
+    _reference(connection, target, target.profile_image_url, -1)
+
+
+for _owner in (PlayerProfile, UserProfile):
+    event.listen(_owner.profile_image_url, "set", _load_replaced_image,
+                 active_history=True, retval=True)
+    event.listen(_owner, "after_insert", _reference_inserted_image)
+    event.listen(_owner, "after_update", _reference_replaced_image)
+    event.listen(_owner, "after_delete", _release_deleted_image)
+
+
+def _purge_released(keys) -> None:
+    # The commit has already succeeded; a key that fails here is left to
+    # purge_orphaned_uploads
+    for key in keys:
+        try:
+            purge_if_unreferenced(key)
+        except Exception:
+            logger.exception("upload_purge_failed", extra={"fields": {"key": key}})
+
+
+# On Session itself, so async sessions (which run a sync Session) are covered
+@event.listens_for(Session, "after_commit")
+def _purge_released_uploads(session) -> None:
+    keys = session.info.pop(RELEASED_UPLOADS, None)
+    if not keys:
+        return
     try:
-        full_path = os.path.join(settings.UPLOAD_DIR, file_path)
-        if os.path.exists(full_path):
-            os.remove(full_path)
-            return True
-        return False
-    except Exception:
-        return False
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _purge_released(keys)
+    else:
+        # An AsyncSession commits on the event loop; keep storage calls off it
+        loop.run_in_executor(None, _purge_released, keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _keep_released_uploads(session) -> None:
+    session.info.pop(RELEASED_UPLOADS, None)
 
 
-def get_file_url(filename: str) -> str:
+def get_file_url(filename: str, variant: Optional[str] = None, image_format: str = "webp") -> str:
     """
     Generate accessible URL for uploaded file.
 
     Args:
-        filename: File name or relative path
+        filename: File name or relative path, as returned by `save_file`
+        variant: Resized variant ("avatar", "thumbnail", "full"); the original if omitted
+        image_format: Variant format, "webp" or "jpg"
 
     Returns:
         str: File URL
     """
-    return f"/uploads/{filename}"
+    if variant is None:
+        return storage.url(filename)
+    return storage.url(variant_path(filename, variant, image_format))
+
+
+class UploadStaticFiles(StaticFiles):
+    """
+    StaticFiles for the filesystem storage backend with long-lived caching.
+
+    Stored names derive from content (or a random id for older uploads), so
+    a URL's bytes never change: responses are marked immutable for a year
+    and carry the file name as a strong ETag, which is stable across
+    servers, unlike the default mtime/size tag. Conditional requests get a
+    304 with the same headers.
+    """
+
+    def file_response(self, full_path, stat_result: os.stat_result, scope: Scope,
+                      status_code: int = 200) -> Response:
+        response = FileResponse(
+            full_path, status_code=status_code, stat_result=stat_result, method=scope["method"])
+        response.headers["etag"] = f'"{os.path.basename(full_path)}"'
+        response.headers["cache-control"] = IMMUTABLE_CACHE_CONTROL
+        if self.is_not_modified(response.headers, Headers(scope=scope)):
+            return NotModifiedResponse(response.headers)
+        return response
@@ -0,0 +1,137 @@
+"""
+Request Metrics
+
+In-process per-route latency histograms with percentile estimates, rendered
+in the Prometheus text exposition format for the /metrics endpoint.
+"""
+
+import bisect
+import threading
+from typing import Dict, List, Optional, Tuple
+
+# Upper bounds in seconds, roughly doubling from 1 ms to 10 s
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0,
+)
+
+QUANTILES = (0.5, 0.95, 0.99)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Observations are counted into cumulative buckets; quantiles are estimated
+    by linear interpolation within the bucket that contains them.
+    """
+    __slots__ = ("counts", "total", "count", "statuses")
+
+    def __init__(self):
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total = 0.0
+        self.count = 0
+        self.statuses: Dict[str, int] = {}
+
+    def observe(self, seconds: float, status_code: int) -> None:
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total += seconds
+        self.count += 1
+        status_class = f"{status_code // 100}xx"
+        self.statuses[status_class] = self.statuses.get(status_class, 0) + 1
+
+    def quantile(self, q: float) -> float:
+        """Estimate the q-quantile (0 < q < 1) in seconds."""
+        if self.count == 0:
+            return 0.0
+
+        rank = q * self.count
+        seen = 0
+        for i, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = LATENCY_BUCKETS[i - 1] if i > 0 else 0.0
+                upper = LATENCY_BUCKETS[i] if i < len(LATENCY_BUCKETS) else LATENCY_BUCKETS[-1]
+                return lower + (upper - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return LATENCY_BUCKETS[-1]
+
+
+class RequestMetrics:
+    """Latency histograms keyed by (method, route template)."""
+
+    def __init__(self):
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, method: str, route: str, seconds: float, status_code: int) -> None:
+        key = (method, route)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = self._histograms[key] = LatencyHistogram()
+            histogram.observe(seconds, status_code)
+
+    def snapshot(self) -> Dict[Tuple[str, str], dict]:
+        """Per-route count and p50/p95/p99 in seconds."""
+        with self._lock:
+            return {
+                key: {
+                    "count": histogram.count,
+                    **{f"p{int(q * 100)}": histogram.quantile(q) for q in QUANTILES},
+                }
+                for key, histogram in self._histograms.items()
+            }
+
+    def render_prometheus(self, extra_gauges: Optional[Dict[str, float]] = None) -> str:
+        """
+        Render all histograms in Prometheus text format.
+
+        Args:
+            extra_gauges: Additional gauge name to value pairs to expose
+
+        Returns:
+            str: Exposition text
+        """
+        lines: List[str] = [
+            "# HELP http_request_duration_seconds Request latency by route",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        quantile_lines: List[str] = [
+            "# HELP http_request_duration_quantile_seconds Estimated latency percentiles by route",
+            "# TYPE http_request_duration_quantile_seconds gauge",
+        ]
+        status_lines: List[str] = [
+            "# HELP http_requests_total Requests by route and status class",
+            "# TYPE http_requests_total counter",
+        ]
+
+        with self._lock:
+            for (method, route), histogram in sorted(self._histograms.items()):
+                labels = f'method="{method}",route="{route}"'
+                cumulative = 0
+                for bound, bucket_count in zip(LATENCY_BUCKETS, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(
+                        f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(
+                    f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {histogram.count}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {histogram.total:.6f}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {histogram.count}")
+
+                for q in QUANTILES:
+                    quantile_lines.append(
+                        f'http_request_duration_quantile_seconds{{{labels},quantile="{q}"}} '
+                        f"{histogram.quantile(q):.6f}")
+                for status_class, count in sorted(histogram.statuses.items()):
+                    status_lines.append(
+                        f'http_requests_total{{{labels},status="{status_class}"}} {count}')
+
+        output = lines + quantile_lines + status_lines
+        for name, value in (extra_gauges or {}).items():
+            output.append(f"# TYPE {name} gauge")
+            output.append(f"{name} {value}")
+        return "\n".join(output) + "\n"
+
+
+# Global request metrics registry
+request_metrics = RequestMetrics()
@@ -0,0 +1,211 @@
+"""
+ASGI Middleware
+
+A pure-ASGI middleware that adds security headers and records request
+timing for metrics and the access log. Working on raw ASGI messages avoids
+the extra task and response streaming that each `@app.middleware("http")`
+(BaseHTTPMiddleware) layer adds to every request. A second one caps request
+bodies on upload routes before they are parsed.
+
+Usage:
+    python -m app.utils.middleware benchmark --requests 5000
+"""
+
+import time
+from typing import Callable
+
+from fastapi import HTTPException, status
+
+from app.utils.metrics import request_metrics
+from app.utils.request_log import log_request
+
+SECURITY_HEADERS = [
+    (b"x-content-type-options", b"nosniff"),
+    (b"x-frame-options", b"DENY"),
+    (b"x-xss-protection", b"1; mode=block"),
+]
+
+
+class RequestContextMiddleware:
+    """
+    Adds security headers to every HTTP response and times each request.
+
+    Args:
+        app: Wrapped ASGI application
+        route_resolver: Callable mapping an ASGI scope to its route template
+    """
+
+    def __init__(self, app, route_resolver: Callable[[dict], str]):
+        self.app = app
+        self.route_resolver = route_resolver
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter()
+        status_code = 500
+
+        async def send_with_headers(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = list(message.get("headers", ())) + SECURITY_HEADERS
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            process_time = time.perf_counter() - start_time
+            route = self.route_resolver(scope)
+            request_metrics.observe(scope["method"], route, process_time, status_code)
+            log_request(scope["method"], scope["path"], route,
+                        status_code, process_time * 1000)
+
+
+class BodySizeLimitMiddleware:
+    """
+    Rejects request bodies over a size limit with 413, before they are parsed.
+
+    Starlette spools a multipart body to a temporary file before the route
+    runs, so a size check in the route comes too late to stop a client
+    sending gigabytes. Here a declared Content-Length over the limit fails
+    on the first read, and chunked bodies fail once the bytes received pass
+    it. The error is raised from `receive`, inside the body parse, so it is
+    answered by the app's HTTPException handler like any other error.
+
+    Args:
+        app: Wrapped ASGI application
+        max_body_size: Largest body accepted, in bytes
+        path_prefix: Only requests under this path are limited
+    """
+
+    def __init__(self, app, max_body_size: int, path_prefix: str):
+        self.app = app
+        self.max_body_size = max_body_size
+        self.path_prefix = path_prefix
+
+    def _too_large(self) -> HTTPException:
+        return HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail=f"Request body exceeds maximum allowed size of {self.max_body_size} bytes"
+        )
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not scope["path"].startswith(self.path_prefix):
+            await self.app(scope, receive, send)
+            return
+
+        declared = dict(scope["headers"]).get(b"content-length")
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            if declared is not None and declared.isdigit() and int(declared) > self.max_body_size:
+                raise self._too_large()
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_body_size:
+                    raise self._too_large()
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def _stacked_middleware_app(routes, route_resolver: Callable[[dict], str]):
+    """
+    An app with the two BaseHTTPMiddleware layers this middleware replaced.
+
+    Kept for the benchmark only, as the baseline to compare against.
+    """
+    from fastapi import FastAPI, Request
+
+    app = FastAPI(routes=routes)
+
+    @app.middleware("http")
+    async def log_requests(request: Request, call_next):
+        start_time = time.perf_counter()
+        response = await call_next(request)
+        process_time = time.perf_counter() - start_time
+        route = route_resolver(request.scope)
+        request_metrics.observe(request.method, route, process_time, response.status_code)
+        log_request(request.method, request.url.path, route,
+                    response.status_code, process_time * 1000)
+        return response
+
+    @app.middleware("http")
+    async def add_security_headers(request: Request, call_next):
+        response = await call_next(request)
+        for name, value in SECURITY_HEADERS:
+            response.headers[name.decode()] = value.decode()
+        return response
+
+    return app
+
+
+async def _benchmark(requests: int, concurrency: int) -> dict:
+    """
+    Compare requests/sec through the stacked and the pure ASGI middleware.
+
+    Both apps serve the application's own routes in-process over httpx's
+    ASGI transport, so the figures exclude the server and the network.
+    `/api/auth/me` is called with a guest token, which needs no database.
+    """
+    import asyncio
+
+    import httpx
+    from fastapi import FastAPI
+
+    from app.main import app, route_template
+    from app.utils.auth import create_guest_token
+    from app.utils.request_log import start_access_log, stop_access_log
+
+    _, token = create_guest_token()
+    paths = {"/": {}, "/api/auth/me": {"Authorization": f"Bearer {token}"}}
+
+    asgi_app = FastAPI(routes=app.routes)
+    asgi_app.add_middleware(RequestContextMiddleware, route_resolver=route_template)
+    variants = {
+        "stacked": _stacked_middleware_app(app.routes, route_template),
+        "asgi": asgi_app,
+    }
+
+    async def drive(client, path: str, headers: dict, count: int) -> None:
+        for _ in range(count):
+            response = await client.get(path, headers=headers)
+            assert response.status_code == 200, response.text
+
+    start_access_log()
+    results = {"requests": requests, "concurrency": concurrency}
+    try:
+        for path, headers in paths.items():
+            for name, variant in variants.items():
+                transport = httpx.ASGITransport(app=variant)
+                async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+                    await drive(client, path, headers, 50)
+                    start = time.perf_counter()
+                    await asyncio.gather(*(
+                        drive(client, path, headers, requests // concurrency)
+                        for _ in range(concurrency)))
+                    elapsed = time.perf_counter() - start
+                results[f"{name} {path}"] = round(requests // concurrency * concurrency / elapsed, 1)
+            results[f"speedup {path}"] = round(
+                results[f"asgi {path}"] / results[f"stacked {path}"], 2)
+    finally:
+        stop_access_log()
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+    import asyncio
+
+    parser = argparse.ArgumentParser(description="Middleware tools")
+    parser.add_argument("command", choices=["benchmark"])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    print(asyncio.run(_benchmark(args.requests, args.concurrency)))
@@ -0,0 +1,67 @@
+"""
+Query Budget Utilities
+
+Counts the SQL statements a block of code issues on a session, so read
+paths that must not degrade into N+1 loads can assert a fixed budget.
+"""
+
+import logging
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(RuntimeError):
+    """Raised when a block issues more statements than its budget allows."""
+
+
+class QueryCounter:
+    """Statements issued inside a `query_budget` block."""
+
+    def __init__(self):
+        self.statements: List[str] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def query_budget(db: Session, budget: int, label: str, strict: bool = False) -> Iterator[QueryCounter]:
+    """
+    Count statements issued on a session and check them against a budget.
+
+    Args:
+        db: Database session
+        budget: Maximum number of statements
+        label: Name of the code path, for the error message
+        strict: Raise when over budget instead of logging; for tests and
+            the scorecard check command, never set on serving paths
+
+    Yields:
+        QueryCounter: Statements issued so far
+
+    Raises:
+        QueryBudgetExceeded: If strict and the block exceeded its budget
+    """
+    connection = db.connection()
+    counter = QueryCounter()
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        counter.statements.append(statement)
+
+    event.listen(connection, "before_cursor_execute", count)
+    try:
+        yield counter
+    finally:
+        event.remove(connection, "before_cursor_execute", count)
+
+    if counter.count > budget:
+        if strict:
+            raise QueryBudgetExceeded(f"{label} issued {counter.count} queries, budget is {budget}")
+        logger.warning("query_budget_exceeded", extra={"fields": {
+            "label": label, "queries": counter.count, "budget": budget}})
@@ -0,0 +1,113 @@
+"""
+Request Logging
+
+Structured JSON access log written off the request path. Records are put on
+an in-memory queue by the request handler and written to stdout by a
+background listener thread, so a slow or blocked stdout never delays a
+response. Records from the application's module loggers (`app.*`) go
+through the same queue, so background jobs log in the same format.
+"""
+
+import copy
+import json
+import logging
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from app.config.settings import settings
+
+
+class JSONLineFormatter(logging.Formatter):
+    """Formats a log record as one JSON object per line."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S") + f".{int(record.msecs):03d}Z",
+            "level": record.levelname.lower(),
+            "event": record.getMessage(),
+        }
+        entry.update(getattr(record, "fields", {}))
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, separators=(",", ":"), default=str)
+
+
+class _DroppingQueueHandler(QueueHandler):
+    """QueueHandler that drops records instead of blocking when the queue is full."""
+
+    dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Render the message and traceback now, keeping them in separate fields."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            _DroppingQueueHandler.dropped += 1
+
+
+_listener: Optional[QueueListener] = None
+
+access_logger = logging.getLogger("app.access")
+app_logger = logging.getLogger("app")
+
+
+def start_access_log() -> None:
+    """Attach the queue-backed JSON handler to the app loggers and start the writer thread."""
+    global _listener
+    if _listener is not None:
+        return
+
+    log_queue: queue.Queue = queue.Queue(maxsize=settings.ACCESS_LOG_QUEUE_SIZE)
+    stream_handler = logging.StreamHandler(sys.stdout)
+    formatter = JSONLineFormatter()
+    formatter.converter = time.gmtime
+    stream_handler.setFormatter(formatter)
+
+    access_logger.setLevel(logging.INFO)
+    access_logger.propagate = False
+    access_logger.addHandler(_DroppingQueueHandler(log_queue))
+
+    # Module loggers (logging.getLogger(__name__)) propagate to "app"
+    app_logger.setLevel(logging.INFO)
+    app_logger.propagate = False
+    app_logger.addHandler(_DroppingQueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+
+
+def stop_access_log() -> None:
+    """Flush pending records and stop the writer thread."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+def log_request(method: str, path: str, route: str, status_code: int, duration_ms: float) -> None:
+    """Emit one structured access log line."""
+    if settings.ACCESS_LOG_ENABLED:
+        access_logger.info("request", extra={"fields": {
+            "method": method,
+            "path": path,
+            "route": route,
+            "status": status_code,
+            "duration_ms": round(duration_ms, 3),
+        }})
+
+
+def dropped_log_lines() -> int:
+    """Number of access log lines dropped because the queue was full."""
+    return _DroppingQueueHandler.dropped
@@ -0,0 +1,112 @@
+"""
+Response Utilities
+
+orjson-backed JSON response class, used as the application default.
+
+orjson serializes UUIDs, datetimes and numpy values natively, several
+times faster than the standard library encoder. Routes that serve large
+trusted payloads (ball logs, scoreboards, scorecards, list pages) build
+plain dicts and return `FastJSONResponse(...)` themselves: FastAPI passes
+a returned Response through untouched, skipping `response_model`
+validation and `jsonable_encoder`, which dominate the cost otherwise.
+The `response_model` stays on such routes for the OpenAPI schema.
+
+Usage:
+    python -m app.utils.responses benchmark --balls 300
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(value: Any) -> Any:
+    if isinstance(value, BaseModel):
+        return value.model_dump(mode="json")
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=_default, option=ORJSON_OPTIONS)
+
+
+def _benchmark(balls: int, iterations: int) -> dict:
+    """
+    Compare the default response path with the fast path for one innings.
+
+    The default path validates a BallEventResponse per ball, runs
+    jsonable_encoder and json.dumps, as FastAPI does for a response_model
+    route. The fast path is the dict serializer plus orjson.
+    """
+    import json
+    import time
+    import uuid
+    from datetime import datetime, timedelta
+    from types import SimpleNamespace
+
+    from fastapi.encoders import jsonable_encoder
+
+    from app.schemas.match import BallEventResponse, serialize_ball_event
+
+    innings_id = uuid.uuid4()
+    players = [uuid.uuid4() for _ in range(22)]
+    created = datetime.utcnow()
+    rows = [
+        SimpleNamespace(
+            id=uuid.uuid4(), innings_id=innings_id, over_number=i // 6, ball_number=i % 6 + 1,
+            batsman_name=f"Player {i % 11}", bowler_name=f"Player {11 + (i // 6) % 5}",
+            batsman_id=players[i % 11], bowler_id=players[11 + (i // 6) % 5],
+            runs=i % 7, is_wicket=i % 29 == 0, wicket_type="bowled" if i % 29 == 0 else None,
+            is_wide=i % 17 == 0, is_no_ball=False, is_bye=False, is_leg_bye=i % 23 == 0,
+            created_at=created + timedelta(seconds=30 * i),
+        )
+        for i in range(balls)
+    ]
+
+    def to_model(row) -> BallEventResponse:
+        fields = serialize_ball_event(row)
+        for name in ("id", "innings_id", "batsman_id", "bowler_id"):
+            fields[name] = str(fields[name]) if fields[name] else None
+        return BallEventResponse(**fields)
+
+    def default_path() -> bytes:
+        models = [to_model(row) for row in rows]
+        return json.dumps(jsonable_encoder(models), separators=(",", ":")).encode()
+
+    def fast_path() -> bytes:
+        return FastJSONResponse([serialize_ball_event(row) for row in rows]).body
+
+    results = {"balls": balls, "iterations": iterations}
+    for name, path in (("default", default_path), ("fast", fast_path)):
+        path()
+        start = time.perf_counter()
+        for _ in range(iterations):
+            body = path()
+        elapsed = time.perf_counter() - start
+        results[name] = {
+            "payload_bytes": len(body),
+            "ms_per_response": round(elapsed * 1000 / iterations, 3),
+            "responses_per_second": round(iterations / elapsed, 1),
+        }
+    results["speedup"] = round(
+        results["fast"]["responses_per_second"] / results["default"]["responses_per_second"], 1)
+    return results
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="JSON response tools")
+    parser.add_argument("command", choices=["benchmark"])
+    parser.add_argument("--balls", type=int, default=300)
+    parser.add_argument("--iterations", type=int, default=500)
+    args = parser.parse_args()
+
+    print(_benchmark(args.balls, args.iterations))
@@ -0,0 +1,258 @@
+"""
+Storage Utilities
+
+Object storage abstraction for uploads, with a local filesystem backend and
+an S3-compatible backend. Keys are relative paths such as
+"players/ab/cd/<sha256>.jpg"; backends never see the database.
+
+The S3 backend lets clients upload straight to the bucket with presigned
+POSTs and read objects from a public base URL (a CDN or the bucket), so
+image bytes need not pass through the API workers.
+"""
+
+import os
+import shutil
+from abc import ABC, abstractmethod
+from typing import Iterable, Optional
+
+from app.config.settings import settings
+
+# Stored objects never change once written: their names derive from content
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+class StorageBackend(ABC):
+    """
+    Interface implemented by storage backends.
+
+    `supports_direct_upload` tells callers whether `presign_upload` returns
+    a presigned upload; backends without direct uploads return None.
+    """
+    supports_direct_upload = False
+
+    @abstractmethod
+    def put_file(self, key: str, local_path: str, content_type: str) -> None:
+        """Store a local file under a key, moving or copying it."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_file(self, key: str, local_path: str) -> None:
+        """Copy an object to a local file."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def exists(self, key: str) -> bool:
+        """Whether an object exists."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def size(self, key: str) -> int:
+        """Size of an object in bytes."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(self, keys: Iterable[str]) -> None:
+        """Delete objects; missing keys are ignored."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def url(self, key: str) -> str:
+        """URL clients fetch an object from."""
+        raise NotImplementedError
+
+    @abstractmethod
+    def presign_upload(self, key: str, content_type: str, max_size: int) -> Optional[dict]:
+        """
+        Presign a direct-to-storage upload of one object.
+
+        Returns:
+            Optional[dict]: "url" and form "fields" for a multipart POST, or
+                None if the backend does not support direct uploads
+        """
+        raise NotImplementedError
+
+
+class FileSystemStorage(StorageBackend):
+    """
+    Storage backend on a local directory, served by the `/uploads` mount.
+
+    Args:
+        root: Directory holding the objects
+        base_url: URL prefix the directory is served under
+    """
+
+    def __init__(self, root: str, base_url: str = "/uploads"):
+        self.root = root
+        self.base_url = base_url.rstrip("/")
+
+    def _path(self, key: str) -> str:
+        path = os.path.normpath(os.path.join(self.root, key))
+        if not path.startswith(os.path.normpath(self.root) + os.sep):
+            raise ValueError(f"Storage key escapes the upload directory: {key}")
+        return path
+
+    def put_file(self, key: str, local_path: str, content_type: str) -> None:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        shutil.move(local_path, path)
+
+    def get_file(self, key: str, local_path: str) -> None:
+        shutil.copyfile(self._path(key), local_path)
+
+    def exists(self, key: str) -> bool:
+        return os.path.exists(self._path(key))
+
+    def size(self, key: str) -> int:
+        return os.path.getsize(self._path(key))
+
+    def delete(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            try:
+                os.remove(self._path(key))
+            except FileNotFoundError:
+                pass
+
+    def url(self, key: str) -> str:
+        return f"{self.base_url}/{key}"
+
+    def presign_upload(self, key: str, content_type: str, max_size: int) -> Optional[dict]:
+        # Files only arrive through the API
+        return None
+
+
+class S3Storage(StorageBackend):
+    """
+    Storage backend on an S3-compatible bucket (AWS S3, MinIO, ...).
+
+    The client only needs `upload_file`, `download_file`, `head_object`,
+    `delete_objects`, `generate_presigned_url` and `generate_presigned_post`,
+    so a local fake can stand in for tests. Files are uploaded with
+    multipart transfers above `multipart_chunk_size`, streaming from disk.
+
+    Args:
+        client: boto3-compatible S3 client
+        bucket: Bucket name
+        public_url: Base URL objects are publicly readable under; when
+            empty, `url` returns presigned GET URLs instead
+        presign_expires: Lifetime of presigned URLs in seconds
+        multipart_chunk_size: Part size for multipart uploads in bytes
+    """
+    supports_direct_upload = True
+
+    def __init__(self, client, bucket: str, public_url: str = "",
+                 presign_expires: int = 900, multipart_chunk_size: int = 8 * 1024 * 1024):
+        self.client = client
+        self.bucket = bucket
+        self.public_url = public_url.rstrip("/")
+        self.presign_expires = presign_expires
+        self.multipart_chunk_size = multipart_chunk_size
+
+    def _transfer_config(self):
+        try:
+            from boto3.s3.transfer import TransferConfig
+        except ImportError:
+            return None
+        return TransferConfig(
+            multipart_threshold=self.multipart_chunk_size,
+            multipart_chunksize=self.multipart_chunk_size)
+
+    def put_file(self, key: str, local_path: str, content_type: str) -> None:
+        self.client.upload_file(
+            local_path, self.bucket, key,
+            ExtraArgs={"ContentType": content_type, "CacheControl": IMMUTABLE_CACHE_CONTROL},
+            Config=self._transfer_config())
+        os.remove(local_path)
+
+    def get_file(self, key: str, local_path: str) -> None:
+        self.client.download_file(self.bucket, key, local_path)
+
+    def _head(self, key: str) -> Optional[dict]:
+        try:
+            return self.client.head_object(Bucket=self.bucket, Key=key)
+        except Exception as e:
+            # botocore's ClientError carries the HTTP status in its response
+            code = getattr(e, "response", {}).get("Error", {}).get("Code")
+            if code in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def exists(self, key: str) -> bool:
+        return self._head(key) is not None
+
+    def size(self, key: str) -> int:
+        head = self._head(key)
+        if head is None:
+            raise FileNotFoundError(key)
+        return int(head["ContentLength"])
+
+    def delete(self, keys: Iterable[str]) -> None:
+        keys = list(keys)
+        # delete_objects accepts at most 1000 keys per request
+        for start in range(0, len(keys), 1000):
+            self.client.delete_objects(Bucket=self.bucket, Delete={
+                "Objects": [{"Key": key} for key in keys[start:start + 1000]],
+                "Quiet": True,
+            })
+
+    def url(self, key: str) -> str:
+        if self.public_url:
+            return f"{self.public_url}/{key}"
+        return self.client.generate_presigned_url(
+            "get_object", Params={"Bucket": self.bucket, "Key": key},
+            ExpiresIn=self.presign_expires)
+
+    def presign_upload(self, key: str, content_type: str, max_size: int) -> dict:
+        post = self.client.generate_presigned_post(
+            self.bucket, key,
+            Fields={"Content-Type": content_type},
+            Conditions=[
+                {"Content-Type": content_type},
+                ["content-length-range", 1, max_size],
+            ],
+            ExpiresIn=self.presign_expires)
+        return {"url": post["url"], "fields": post["fields"]}
+
+
+def create_storage_backend(backend: str) -> StorageBackend:
+    """
+    Create a storage backend by name.
+
+    Args:
+        backend: "filesystem" or "s3"
+
+    Returns:
+        StorageBackend: Configured backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+        RuntimeError: If the s3 backend is selected but boto3 is not installed
+    """
+    if backend == "filesystem":
+        return FileSystemStorage(settings.UPLOAD_DIR)
+
+    if backend == "s3":
+        try:
+            import boto3
+        except ImportError:
+            raise RuntimeError(
+                "STORAGE_BACKEND=s3 requires the 'boto3' package to be installed")
+        client = boto3.client(
+            "s3",
+            endpoint_url=settings.S3_ENDPOINT_URL or None,
+            region_name=settings.S3_REGION,
+            aws_access_key_id=settings.S3_ACCESS_KEY_ID or None,
+            aws_secret_access_key=settings.S3_SECRET_ACCESS_KEY or None,
+        )
+        return S3Storage(
+            client,
+            bucket=settings.S3_BUCKET,
+            public_url=settings.S3_PUBLIC_URL,
+            presign_expires=settings.S3_PRESIGN_EXPIRE_SECONDS,
+            multipart_chunk_size=settings.S3_MULTIPART_CHUNK_SIZE,
+        )
+
+    raise ValueError(f"Unknown storage backend: {backend}")
+
+
+# Global storage backend
+storage = create_storage_backend(settings.STORAGE_BACKEND)
@@ -0,0 +1,37 @@
+"""
+Guest accounts and the cached principals that outlive them.
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.match import Match
+from app.models.user import User
+from app.services import auth_service
+from app.utils.auth import principal_cache
+
+
+def guest(db, days_idle: int) -> User:
+    guest_id = auth_service.new_guest_id()
+    user = User(id=guest_id, email=auth_service.guest_email(guest_id), name=auth_service.GUEST_NAME,
+                password_hash=auth_service.UNUSABLE_PASSWORD, is_guest=True,
+                updated_at=datetime.utcnow() - timedelta(days=days_idle))
+    db.add(user)
+    db.commit()
+    principal_cache.set(str(user.id), {"id": user.id, "is_guest": True, "is_active": True})
+    return user
+
+
+def test_reaped_guests_leave_the_principal_cache(db):
+    abandoned = guest(db, days_idle=40)
+    recent = guest(db, days_idle=1)
+    scorer = guest(db, days_idle=40)
+    db.add(Match(created_by=scorer.id, team1="Lions", team2="Tigers", overs_per_innings=20, total_players=11))
+    db.commit()
+    abandoned_id, recent_id, scorer_id = abandoned.id, recent.id, scorer.id
+
+    assert auth_service.reap_abandoned_guests(db, retention_days=30, batch_size=1) == 1
+
+    assert db.get(User, abandoned_id) is None
+    assert principal_cache.get(str(abandoned_id)) is None
+    assert principal_cache.get(str(recent_id)) is not None
+    assert principal_cache.get(str(scorer_id)) is not None
@@ -0,0 +1,119 @@
+"""
+Cache backends and the version-keyed scoreboard cache.
+"""
+
+import pytest
+
+from app.models.match import Match, Innings
+from app.schemas.match import BallEventCreate
+from app.services import scoreboard_service, scoring_service
+from app.utils import cache
+from app.utils.cache import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+
+
+class FakeRedis:
+    """In-memory stand-in for the redis client calls RedisCacheBackend makes."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def set(self, key, value, ex=None):
+        self.values[key] = value.encode() if isinstance(value, str) else value
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+    def incr(self, key):
+        self.values[key] = str(int(self.values.get(key, 0)) + 1).encode()
+        return int(self.values[key])
+
+    def dbsize(self):
+        return len(self.values)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def test_memory_backend_evicts_least_recently_used(clock):
+    backend = MemoryCacheBackend(max_entries=2, default_ttl=60)
+    backend.set("a", 1)
+    backend.set("b", 2)
+    assert backend.get("a") == 1
+    backend.set("c", 3)
+
+    assert backend.get("b") is None
+    assert (backend.get("a"), backend.get("c")) == (1, 3)
+
+    backend.set("short", 4, ttl=5)
+    clock[0] += 6
+    assert backend.get("short") is None
+    assert backend.stats.to_dict() == {
+        "hits": 3, "misses": 2, "evictions": 3, "sets": 4, "hit_ratio": 0.6}
+
+
+def test_evicted_counters_never_repeat_a_version():
+    backend = MemoryCacheBackend(max_entries=2)
+    for _ in range(3):
+        backend.incr("version:a")
+    backend.incr("version:b")
+    backend.incr("version:c")
+
+    # "a" was evicted at 3, so it restarts above every evicted value
+    assert backend.get_counter("version:a") == 4
+    assert backend.incr("version:a") == 5
+
+
+def test_redis_backend_round_trip():
+    backend = RedisCacheBackend(FakeRedis(), default_ttl=60)
+    backend.set("view", {"runs": 10})
+    assert backend.get("view") == {"runs": 10}
+    assert backend.get_counter("version") == 0
+    assert backend.incr("version") == 1
+    backend.delete("view")
+    assert backend.get("view") is None
+    assert backend.size() == 1
+
+
+def test_backends_must_implement_the_interface():
+    class Incomplete(CacheBackend):
+        def get(self, key):
+            return None
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_scoreboard_is_served_from_cache_until_a_write(db, user, monkeypatch):
+    monkeypatch.setattr(scoreboard_service, "scoreboard_cache", MemoryCacheBackend())
+    match = Match(created_by=user.id, team1="Lions", team2="Tigers",
+                  overs_per_innings=20, total_players=11)
+    db.add(match)
+    db.flush()
+    innings = Innings(match_id=match.id, innings_number=1,
+                      batting_team="Lions", bowling_team="Tigers")
+    db.add(innings)
+    db.commit()
+
+    def bowl(ball: int) -> None:
+        scoring_service.record_ball_events_batch(db, innings.id, [BallEventCreate(
+            over_number=0, ball_number=ball, runs=4, batsman_name="Opener", bowler_name="Bowler")])
+        scoreboard_service.invalidate_scoreboard(match.id)
+
+    bowl(1)
+    first = scoreboard_service.get_scoreboard(db, match.id)
+    assert first["version"] == 1
+    assert scoreboard_service.get_cached_scoreboard(match.id) == first
+
+    bowl(2)
+    assert scoreboard_service.get_cached_scoreboard(match.id) is None
+    second = scoreboard_service.get_scoreboard(db, match.id)
+    assert second["version"] == 2
+    assert [ball["ball"] for ball in second["recent_balls"]] == [1, 2]
+    assert second["innings"][0]["total_runs"] == 8
@@ -0,0 +1,56 @@
+"""
+Ball event exports, live and archived.
+"""
+
+from datetime import datetime
+
+import pyarrow.dataset as ds
+
+from app.models.match import Match, Innings
+from app.schemas.match import BallEventCreate
+from app.services import archive_service, export_service, scoring_service
+
+
+def archived_match(db, user) -> Match:
+    match = Match(created_by=user.id, team1="Lions", team2="Tigers",
+                  overs_per_innings=20, total_players=11)
+    db.add(match)
+    db.flush()
+    innings = Innings(match_id=match.id, innings_number=1,
+                      batting_team="Lions", bowling_team="Tigers")
+    db.add(innings)
+    db.commit()
+    scoring_service.record_ball_events_batch(db, innings.id, [
+        BallEventCreate(over_number=0, ball_number=ball, runs=ball % 4,
+                        batsman_name="Opener", bowler_name="Bowler")
+        for ball in range(1, 7)
+    ])
+    innings.is_complete = True
+    innings.stats_applied = True
+    db.commit()
+    assert archive_service.archive_match(db, match.id) == 6
+    return match
+
+
+def test_full_export_includes_archived_innings(db, user, tmp_path):
+    archived_match(db, user)
+
+    result = export_service.export_ball_events(db, str(tmp_path), safety_lag_seconds=0)
+
+    assert result["rows"] == 6
+    table = ds.dataset(str(tmp_path), format="parquet", partitioning="hive").to_table()
+    assert sorted(table.column("runs").to_pylist()) == sorted(ball % 4 for ball in range(1, 7))
+
+
+def test_incremental_export_skips_older_archives(db, user, tmp_path, monkeypatch):
+    archived_match(db, user)
+    opened = []
+    unpack = archive_service.unpack_archive
+    monkeypatch.setattr(archive_service, "unpack_archive",
+                        lambda archive, names=None: opened.append(archive) or unpack(archive, names))
+
+    result = export_service.export_ball_events(
+        db, str(tmp_path), since=datetime.utcnow(), safety_lag_seconds=0)
+
+    assert result["rows"] == 0
+    assert opened == []
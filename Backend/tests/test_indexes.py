@@ -0,0 +1,82 @@
+"""
+Check that the hot lookups are served by the composite indexes.
+
+Each query is planned with sequential scans disabled, so the test asserts
+that the index can serve the query's filter and order, whatever the table
+sizes in the test database.
+"""
+
+import uuid
+from datetime import datetime
+
+import pytest
+from sqlalchemy import text
+
+from app.models.match import Match, Innings, BallEvent, InningsArchive
+from app.models.player import PlayerProfile
+from app.models.tournament import Tournament, TournamentMatch
+
+OWNER = uuid.uuid4()
+MATCH = uuid.uuid4()
+INNINGS = uuid.uuid4()
+TOURNAMENT = uuid.uuid4()
+
+
+def _plan_indexes(plan: dict) -> set:
+    names = {plan["Index Name"]} if "Index Name" in plan else set()
+    for child in plan.get("Plans", []):
+        names |= _plan_indexes(child)
+    return names
+
+
+def explain_indexes(db, query) -> set:
+    """Names of the indexes in the plan of an ORM query."""
+    compiled = query.statement.compile(
+        dialect=db.get_bind().dialect, compile_kwargs={"render_postcompile": True})
+    params = {key: str(value) if isinstance(value, uuid.UUID) else value
+              for key, value in compiled.params.items()}
+    connection = db.connection()
+    connection.exec_driver_sql("SET LOCAL enable_seqscan = off")
+    plan = connection.exec_driver_sql(
+        "EXPLAIN (FORMAT JSON) " + str(compiled), params).scalar()
+    return _plan_indexes(plan[0]["Plan"])
+
+
+def index_family(db, name: str) -> set:
+    """An index and the per-partition indexes attached to it."""
+    children = db.execute(text("""
+        SELECT child.relname FROM pg_inherits
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        WHERE parent.relname = :name
+    """), {"name": name}).scalars().all()
+    return {name, *children}
+
+
+HOT_QUERIES = {
+    "ix_ball_events_innings_over_ball": lambda db: db.query(
+        BallEvent.over_number, BallEvent.ball_number
+    ).filter(BallEvent.innings_id == INNINGS).order_by(
+        BallEvent.over_number.desc(), BallEvent.ball_number.desc()).limit(1),
+    "ix_innings_match_number": lambda db: db.query(Innings).filter(
+        Innings.match_id == MATCH).order_by(Innings.innings_number),
+    "ix_innings_archives_archived_at": lambda db: db.query(InningsArchive.innings_id).filter(
+        InningsArchive.archived_at > datetime(2026, 1, 1)),
+    "ix_matches_created_by_match_date": lambda db: db.query(Match).filter(
+        Match.created_by == OWNER).order_by(Match.match_date.desc(), Match.id.desc()).limit(20),
+    "ix_tournament_matches_tournament_date": lambda db: db.query(TournamentMatch).filter(
+        TournamentMatch.tournament_id == TOURNAMENT).order_by(TournamentMatch.scheduled_date),
+    "ix_tournament_matches_match_id": lambda db: db.query(TournamentMatch).filter(
+        TournamentMatch.match_id == MATCH),
+    "ix_tournaments_created_by_created_at": lambda db: db.query(Tournament).filter(
+        Tournament.created_by == OWNER).order_by(Tournament.created_at.desc(), Tournament.id.desc()).limit(20),
+    "ix_player_profiles_created_by_name": lambda db: db.query(PlayerProfile).filter(
+        PlayerProfile.created_by == OWNER, PlayerProfile.name.in_(["Player 1", "Player 2"])
+    ).order_by(PlayerProfile.name),
+}
+
+
+@pytest.mark.parametrize("index_name", sorted(HOT_QUERIES))
+def test_hot_query_uses_index(db, index_name):
+    used = explain_indexes(db, HOT_QUERIES[index_name](db))
+    assert used & index_family(db, index_name), f"{index_name} not used; plan used {sorted(used)}"
@@ -0,0 +1,38 @@
+"""
+Player totals read from the ball log by identity.
+"""
+
+from app.models.match import Match, Innings
+from app.models.player import Player
+from app.schemas.match import BallEventCreate
+from app.services import archive_service, player_service, scoring_service
+
+
+def test_totals_are_unchanged_by_archiving(db, user):
+    match = Match(created_by=user.id, team1="Lions", team2="Tigers",
+                  overs_per_innings=20, total_players=11)
+    db.add(match)
+    db.flush()
+    innings = Innings(match_id=match.id, innings_number=1,
+                      batting_team="Lions", bowling_team="Tigers")
+    db.add(innings)
+    db.commit()
+    scoring_service.record_ball_events_batch(db, innings.id, [
+        BallEventCreate(over_number=over, ball_number=ball, runs=(over + ball) % 5,
+                        batsman_name="Second" if over else "Opener", bowler_name="Quick",
+                        is_wide=ball == 2, is_bye=ball == 3, is_no_ball=ball == 4,
+                        is_wicket=ball == 6, wicket_type="run_out" if over else "bowled")
+        for over in range(2) for ball in range(1, 7)
+    ])
+    player_ids = [player.id for player in db.query(Player).filter(Player.created_by == user.id)]
+    live = {player_id: player_service.get_player_totals(db, player_id) for player_id in player_ids}
+
+    innings.is_complete = True
+    innings.stats_applied = True
+    db.commit()
+    assert archive_service.archive_match(db, match.id) == 12
+
+    assert {player_id: player_service.get_player_totals(db, player_id) for player_id in player_ids} == live
+    bowler = next(totals for totals in live.values() if totals["name"] == "Quick")
+    assert bowler["bowling"]["wickets"] == 1
+    assert bowler["bowling"]["balls_bowled"] == 8
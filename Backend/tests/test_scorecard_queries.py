@@ -0,0 +1,116 @@
+"""
+Check that scorecards load in a fixed number of queries.
+
+The budgets are enforced strictly here; serving paths only log overruns.
+"""
+
+from datetime import datetime, timedelta
+
+from app.models.match import Match, Innings
+from app.models.tournament import Tournament, TournamentMatch
+from app.schemas.match import BallEventCreate
+from app.services import archive_service, scoring_service
+from app.services.scorecard_service import (
+    SCORECARD_QUERY_BUDGET,
+    TOURNAMENT_QUERY_BUDGET,
+    get_match_scorecard,
+    get_tournament_scorecards,
+)
+from app.utils.query_budget import query_budget
+
+FIXTURES = 50
+
+
+def create_match(db, user, innings_count: int = 2) -> Match:
+    """A match whose innings each hold two overs of balls."""
+    match = Match(created_by=user.id, team1="Lions", team2="Tigers",
+                  overs_per_innings=20, total_players=11)
+    db.add(match)
+    db.flush()
+    for number in range(1, innings_count + 1):
+        batting, bowling = ("Lions", "Tigers") if number % 2 else ("Tigers", "Lions")
+        innings = Innings(match_id=match.id, innings_number=number,
+                          batting_team=batting, bowling_team=bowling)
+        db.add(innings)
+        db.commit()
+        add_balls(db, innings)
+    return match
+
+
+def add_balls(db, innings: Innings, first_over: int = 0) -> None:
+    scoring_service.record_ball_events_batch(db, innings.id, [
+        BallEventCreate(
+            over_number=over, ball_number=ball, runs=(over + ball) % 5,
+            batsman_name=f"{innings.batting_team} {ball % 2 + 1}",
+            bowler_name=f"{innings.bowling_team} {over % 3 + 1}",
+            is_wicket=ball == 6, wicket_type="bowled" if ball == 6 else None,
+        )
+        for over in range(first_over, first_over + 2) for ball in range(1, 7)
+    ])
+
+
+def archive(db, match: Match) -> None:
+    db.query(Innings).filter(Innings.match_id == match.id).update(
+        {Innings.is_complete: True, Innings.stats_applied: True})
+    db.commit()
+    assert archive_service.archive_match(db, match.id) > 0
+
+
+def test_match_scorecard_with_archived_and_live_innings(db, user):
+    match = create_match(db, user)
+    archive(db, match)
+    # A super over scored after the match was archived
+    super_over = Innings(match_id=match.id, innings_number=3,
+                         batting_team="Lions", bowling_team="Tigers")
+    db.add(super_over)
+    db.commit()
+    add_balls(db, super_over)
+    match_id = match.id
+    db.expire_all()
+
+    with query_budget(db, SCORECARD_QUERY_BUDGET, "Match scorecard", strict=True) as counter:
+        scorecard = get_match_scorecard(db, match_id)
+
+    assert counter.count == SCORECARD_QUERY_BUDGET
+    assert [innings["innings_number"] for innings in scorecard["innings"]] == [1, 2, 3]
+    assert all(innings["batting"] for innings in scorecard["innings"])
+
+
+def test_tournament_scorecards_with_50_fixtures(db, user):
+    tournament = Tournament(created_by=user.id, name="League", format="round_robin",
+                            teams=["Lions", "Tigers"])
+    db.add(tournament)
+    db.commit()
+
+    start = datetime(2026, 1, 1)
+    for number in range(FIXTURES):
+        match = create_match(db, user)
+        if number % 5 == 0:
+            archive(db, match)
+        db.add(TournamentMatch(tournament_id=tournament.id, match_id=match.id,
+                               team1="Lions", team2="Tigers",
+                               scheduled_date=start + timedelta(days=number)))
+    db.commit()
+    tournament_id = tournament.id
+    db.expire_all()
+
+    with query_budget(db, TOURNAMENT_QUERY_BUDGET, "Tournament scorecards", strict=True) as counter:
+        page = get_tournament_scorecards(db, tournament_id)
+
+    assert counter.count <= TOURNAMENT_QUERY_BUDGET
+    assert len(page["fixtures"]) == FIXTURES
+    assert all(len(fixture["scorecard"]["innings"]) == 2 for fixture in page["fixtures"])
+
+
+def test_overrun_logs_outside_tests(db, user, caplog):
+    match = create_match(db, user, innings_count=1)
+    match_id = match.id
+    db.expire_all()
+
+    with caplog.at_level("WARNING", logger="app.utils.query_budget"):
+        with query_budget(db, 1, "Match scorecard"):
+            get_match_scorecard(db, match_id)
+
+    (record,) = caplog.records
+    assert record.fields["label"] == "Match scorecard"
+    assert record.fields["queries"] > record.fields["budget"] == 1
@@ -0,0 +1,105 @@
+"""
+Ball deltas and batched ball recording.
+"""
+
+import pydantic
+import pytest
+
+from app.models.match import Match, Innings, BallEvent, InningsSnapshot
+from app.schemas.match import BallEventBatchCreate, BallEventCreate
+from app.services import scoring_service
+from app.services.scoring_service import InningsDelta, compute_ball_delta, sum_deltas
+from app.utils.exceptions import ValidationError
+
+
+def ball(over: int = 0, number: int = 1, **fields) -> BallEventCreate:
+    return BallEventCreate(over_number=over, ball_number=number,
+                           batsman_name="Opener", bowler_name="Bowler", **fields)
+
+
+def delta(d: InningsDelta) -> tuple:
+    return d.runs, d.extras, d.wickets, d.legal_balls
+
+
+@pytest.mark.parametrize("fields, expected", [
+    ({"runs": 4}, (4, 0, 0, 1)),
+    ({"runs": 0, "is_wicket": True, "wicket_type": "bowled"}, (0, 0, 1, 1)),
+    # A wide carries a penalty run; runs run off it are extras too
+    ({"runs": 0, "is_wide": True}, (1, 1, 0, 0)),
+    ({"runs": 2, "is_wide": True}, (3, 3, 0, 0)),
+    # Runs off the bat on a no-ball go to the batsman, only the penalty is extra
+    ({"runs": 4, "is_no_ball": True}, (5, 1, 0, 0)),
+    ({"runs": 1, "is_no_ball": True, "is_bye": True}, (2, 2, 0, 0)),
+    # Byes and leg-byes are extras but still legal deliveries
+    ({"runs": 2, "is_bye": True}, (2, 2, 0, 1)),
+    ({"runs": 1, "is_leg_bye": True}, (1, 1, 0, 1)),
+])
+def test_compute_ball_delta(fields, expected):
+    assert delta(compute_ball_delta(ball(**fields))) == expected
+
+
+def test_an_over_with_extras_needs_six_legal_balls():
+    over = [ball(number=1, runs=1), ball(number=2, is_wide=True), ball(number=3, runs=4, is_no_ball=True),
+            *[ball(number=n, runs=0) for n in range(4, 8)], ball(number=8, runs=2, is_leg_bye=True)]
+
+    assert delta(sum_deltas(over)) == (1 + 1 + 5 + 2, 1 + 1 + 2, 0, 6)
+
+
+@pytest.fixture
+def innings(db, user) -> Innings:
+    match = Match(created_by=user.id, team1="Lions", team2="Tigers",
+                  overs_per_innings=20, total_players=11)
+    db.add(match)
+    db.flush()
+    innings = Innings(match_id=match.id, innings_number=1,
+                      batting_team="Lions", bowling_team="Tigers")
+    db.add(innings)
+    db.commit()
+    return innings
+
+
+def test_batch_updates_aggregates_and_snapshots_overs(db, innings):
+    balls = [ball(0, n, runs=1) for n in range(1, 7)] + [
+        ball(1, 1, is_wide=True), ball(1, 2, runs=2, is_bye=True), ball(1, 3, is_wicket=True, wicket_type="bowled")]
+
+    scoring_service.record_ball_events_batch(db, innings.id, balls)
+
+    db.refresh(innings)
+    assert (innings.total_runs, innings.extras, innings.wickets) == (9, 3, 1)
+    assert innings.overs_completed == 1.2
+    snapshots = db.query(InningsSnapshot).filter(InningsSnapshot.innings_id == innings.id).all()
+    assert [(s.over_number, s.total_runs, s.legal_balls) for s in snapshots] == [(0, 6, 6)]
+    check = scoring_service.verify_innings(db, innings.id)
+    assert check["consistent"] and check["snapshots_consistent"]
+
+
+def test_batch_must_follow_recorded_balls(db, innings):
+    scoring_service.record_ball_events_batch(db, innings.id, [ball(0, n) for n in range(1, 4)])
+
+    for overlapping in ([ball(0, 3), ball(0, 4)], [ball(0, 1)]):
+        with pytest.raises(ValidationError) as error:
+            scoring_service.record_ball_events_batch(db, innings.id, overlapping)
+        assert error.value.status_code == 422
+
+    # The rejected batches left nothing behind and released the innings lock
+    scoring_service.record_ball_events_batch(db, innings.id, [ball(0, 4, runs=6)])
+    assert db.query(BallEvent).filter(BallEvent.innings_id == innings.id).count() == 4
+    db.refresh(innings)
+    assert innings.total_runs == 6
+
+
+def test_batch_balls_must_be_in_order():
+    with pytest.raises(pydantic.ValidationError):
+        BallEventBatchCreate(balls=[ball(0, 2), ball(0, 1)])
+    with pytest.raises(pydantic.ValidationError):
+        BallEventBatchCreate(balls=[ball(1, 1), ball(0, 6)])
+    with pytest.raises(pydantic.ValidationError):
+        BallEventBatchCreate(balls=[ball(0, 1), ball(0, 1)])
+
+
+def test_complete_innings_takes_no_more_balls(db, innings):
+    innings.is_complete = True
+    db.commit()
+
+    with pytest.raises(ValidationError):
+        scoring_service.record_ball_events_batch(db, innings.id, [ball(0, 1)])
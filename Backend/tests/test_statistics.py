@@ -0,0 +1,61 @@
+"""
+Career statistics folded in as innings complete.
+"""
+
+import threading
+
+from app.config.database import SessionLocal
+from app.models.match import Match, Innings
+from app.models.player import PlayerProfile
+from app.schemas.match import BallEventCreate
+from app.services import scoring_service, statistics_service
+
+INNINGS = 12
+
+
+def completed_innings(db, user, batsman: str) -> Innings:
+    """A completed innings in its own match: one over of boundaries by `batsman`."""
+    match = Match(created_by=user.id, team1="Lions", team2="Tigers",
+                  overs_per_innings=20, total_players=11)
+    db.add(match)
+    db.flush()
+    innings = Innings(match_id=match.id, innings_number=1,
+                      batting_team="Lions", bowling_team="Tigers")
+    db.add(innings)
+    db.commit()
+    scoring_service.record_ball_events_batch(db, innings.id, [
+        BallEventCreate(over_number=0, ball_number=ball, runs=4,
+                        batsman_name=batsman, bowler_name="Bowler")
+        for ball in range(1, 7)
+    ])
+    innings.is_complete = True
+    db.commit()
+    return innings
+
+
+def test_concurrent_innings_sharing_a_player_all_count(db, user):
+    profile = PlayerProfile(created_by=user.id, name="Opener", role="Batsman")
+    db.add(profile)
+    db.commit()
+    innings_ids = [completed_innings(db, user, "Opener").id for _ in range(INNINGS)]
+
+    start = threading.Barrier(INNINGS)
+
+    def apply(innings_id):
+        session = SessionLocal()
+        try:
+            start.wait()
+            statistics_service.apply_innings_statistics(session, innings_id)
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=apply, args=(innings_id,)) for innings_id in innings_ids]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    db.refresh(profile)
+    assert profile.total_runs == 24 * INNINGS
+    assert profile.matches_played == INNINGS
+    assert profile.balls_faced == 6 * INNINGS
@@ -0,0 +1,172 @@
+"""
+Round trips through the storage backends.
+
+S3Storage runs against an in-memory fake of the S3 client calls it uses,
+answering errors the way MinIO and AWS do through botocore: a ClientError
+whose `response` carries the error code.
+"""
+
+import base64
+import json
+import os
+
+import pytest
+
+from app.utils.storage import FileSystemStorage, IMMUTABLE_CACHE_CONTROL, S3Storage, StorageBackend
+
+KEY = "players/ab/cd/abcd.jpg"
+
+
+class FakeClientError(Exception):
+    """Stand-in for botocore.exceptions.ClientError."""
+
+    def __init__(self, code: str, status: int, operation: str):
+        super().__init__(f"An error occurred ({code}) when calling the {operation} operation")
+        self.response = {"Error": {"Code": code}, "ResponseMetadata": {"HTTPStatusCode": status}}
+
+
+class FakeS3Client:
+    """In-memory bucket speaking the boto3 client calls S3Storage makes."""
+
+    def __init__(self, bucket: str, endpoint: str = "http://minio:9000"):
+        self.bucket = bucket
+        self.endpoint = endpoint
+        self.objects = {}
+        self.delete_requests = 0
+
+    def _check_bucket(self, bucket: str, operation: str) -> None:
+        if bucket != self.bucket:
+            raise FakeClientError("NoSuchBucket", 404, operation)
+
+    def upload_file(self, filename, bucket, key, ExtraArgs=None, Config=None):
+        self._check_bucket(bucket, "PutObject")
+        with open(filename, "rb") as f:
+            self.objects[key] = (f.read(), dict(ExtraArgs or {}))
+
+    def download_file(self, bucket, key, filename):
+        self._check_bucket(bucket, "GetObject")
+        if key not in self.objects:
+            raise FakeClientError("404", 404, "HeadObject")
+        with open(filename, "wb") as f:
+            f.write(self.objects[key][0])
+
+    def head_object(self, Bucket, Key):
+        self._check_bucket(Bucket, "HeadObject")
+        if Key not in self.objects:
+            # HEAD responses have no body, so the code is the bare status
+            raise FakeClientError("404", 404, "HeadObject")
+        body, extra = self.objects[Key]
+        return {"ContentLength": len(body), "ContentType": extra.get("ContentType")}
+
+    def delete_objects(self, Bucket, Delete):
+        self._check_bucket(Bucket, "DeleteObjects")
+        if len(Delete["Objects"]) > 1000:
+            raise FakeClientError("MalformedXML", 400, "DeleteObjects")
+        self.delete_requests += 1
+        for item in Delete["Objects"]:
+            self.objects.pop(item["Key"], None)
+        return {}
+
+    def generate_presigned_url(self, operation, Params, ExpiresIn):
+        return f"{self.endpoint}/{Params['Bucket']}/{Params['Key']}?X-Amz-Expires={ExpiresIn}"
+
+    def generate_presigned_post(self, bucket, key, Fields=None, Conditions=None, ExpiresIn=3600):
+        policy = {"conditions": [{"bucket": bucket}, {"key": key}, *(Conditions or [])]}
+        fields = dict(Fields or {}, key=key, policy=base64.b64encode(json.dumps(policy).encode()).decode())
+        return {"url": f"{self.endpoint}/{bucket}", "fields": fields}
+
+
+@pytest.fixture
+def client():
+    return FakeS3Client("uploads")
+
+
+@pytest.fixture
+def s3(client):
+    return S3Storage(client, bucket="uploads", presign_expires=60)
+
+
+def local_file(tmp_path, content: bytes) -> str:
+    path = tmp_path / "upload.jpg"
+    path.write_bytes(content)
+    return str(path)
+
+
+def test_s3_round_trip(s3, client, tmp_path):
+    source = local_file(tmp_path, b"jpeg bytes")
+    assert not s3.exists(KEY)
+
+    s3.put_file(KEY, source, "image/jpeg")
+    assert not os.path.exists(source)
+    assert client.objects[KEY][1] == {"ContentType": "image/jpeg", "CacheControl": IMMUTABLE_CACHE_CONTROL}
+    assert s3.exists(KEY)
+    assert s3.size(KEY) == len(b"jpeg bytes")
+
+    copy = tmp_path / "copy.jpg"
+    s3.get_file(KEY, str(copy))
+    assert copy.read_bytes() == b"jpeg bytes"
+
+    s3.delete([KEY, "players/ab/cd/missing.jpg"])
+    assert not s3.exists(KEY)
+    with pytest.raises(FileNotFoundError):
+        s3.size(KEY)
+
+
+def test_s3_head_only_treats_not_found_as_missing(client):
+    other_bucket = S3Storage(client, bucket="elsewhere")
+    with pytest.raises(FakeClientError) as error:
+        other_bucket.exists(KEY)
+    assert error.value.response["Error"]["Code"] == "NoSuchBucket"
+
+    class BrokenClient(FakeS3Client):
+        def head_object(self, Bucket, Key):
+            raise ConnectionError("endpoint unreachable")
+
+    with pytest.raises(ConnectionError):
+        S3Storage(BrokenClient("uploads"), bucket="uploads").exists(KEY)
+
+
+def test_s3_delete_batches_of_1000(s3, client):
+    keys = [f"players/{i:04d}.jpg" for i in range(2500)]
+    client.objects.update({key: (b"x", {}) for key in keys})
+    s3.delete(keys)
+    assert client.objects == {}
+    assert client.delete_requests == 3
+
+
+def test_s3_presign(s3, client):
+    assert s3.url(KEY) == f"http://minio:9000/uploads/{KEY}?X-Amz-Expires=60"
+    assert S3Storage(client, bucket="uploads", public_url="https://cdn.example.com/").url(KEY) \
+        == f"https://cdn.example.com/{KEY}"
+
+    post = s3.presign_upload("incoming/0123.jpg", "image/jpeg", max_size=1024)
+    assert post["url"] == "http://minio:9000/uploads"
+    assert post["fields"]["key"] == "incoming/0123.jpg"
+    assert post["fields"]["Content-Type"] == "image/jpeg"
+    policy = json.loads(base64.b64decode(post["fields"]["policy"]))
+    assert ["content-length-range", 1, 1024] in policy["conditions"]
+    assert {"Content-Type": "image/jpeg"} in policy["conditions"]
+
+
+def test_filesystem_round_trip(tmp_path):
+    storage = FileSystemStorage(str(tmp_path / "uploads"))
+    storage.put_file(KEY, local_file(tmp_path, b"jpeg bytes"), "image/jpeg")
+    assert storage.exists(KEY)
+    assert storage.size(KEY) == len(b"jpeg bytes")
+    assert storage.url(KEY) == f"/uploads/{KEY}"
+
+    storage.delete([KEY, "players/ab/cd/missing.jpg"])
+    assert not storage.exists(KEY)
+    with pytest.raises(ValueError):
+        storage.exists("../outside.jpg")
+    assert not storage.supports_direct_upload
+    assert storage.presign_upload(KEY, "image/jpeg", 1024) is None
+
+
+def test_backends_must_implement_the_interface():
+    class Incomplete(StorageBackend):
+        def put_file(self, key, local_path, content_type):
+            pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,91 @@
+"""
+Tournament standings kept in step with fixture results.
+"""
+
+import threading
+
+import pytest
+
+from app.config.database import SessionLocal
+from app.models.tournament import Tournament, TournamentMatch, TournamentStanding
+from app.schemas.tournament import TournamentResultUpdate
+from app.services import tournament_service
+from app.utils.exceptions import ValidationError
+
+TEAMS = ["Lions", "Tigers", "Bears"]
+
+
+def tournament_with_fixtures(db, user, pairs):
+    tournament = Tournament(created_by=user.id, name="League", format="round_robin", teams=TEAMS)
+    db.add(tournament)
+    db.flush()
+    fixtures = [TournamentMatch(tournament_id=tournament.id, team1=team1, team2=team2)
+                for team1, team2 in pairs]
+    db.add_all(fixtures)
+    db.commit()
+    return tournament, fixtures
+
+
+def standings(db, tournament_id):
+    db.expire_all()
+    return {row.team_name: row for row in tournament_service.get_standings(db, tournament_id)}
+
+
+def test_manual_scores_need_overs(db, user):
+    tournament, (fixture,) = tournament_with_fixtures(db, user, [("Lions", "Tigers")])
+
+    with pytest.raises(ValidationError):
+        tournament_service.record_match_result(db, tournament.id, fixture.id, TournamentResultUpdate(
+            team1_score=160, team2_score=150, team2_overs=20))
+
+
+def test_no_result_stays_out_of_net_run_rate(db, user):
+    tournament, (played, abandoned) = tournament_with_fixtures(
+        db, user, [("Lions", "Tigers"), ("Lions", "Tigers")])
+
+    tournament_service.record_match_result(db, tournament.id, played.id, TournamentResultUpdate(
+        team1_score=180, team1_overs=20, team2_score=120, team2_overs=20))
+    tournament_service.record_match_result(db, tournament.id, abandoned.id, TournamentResultUpdate(
+        team1_score=12, team1_overs=1.3, team2_score=0, no_result=True))
+
+    table = standings(db, tournament.id)
+    lions = table["Lions"]
+    assert (lions.played, lions.won, lions.tied, lions.points) == (2, 1, 1, 3)
+    assert (lions.runs_for, lions.balls_for, lions.runs_against, lions.balls_against) == (180, 120, 120, 120)
+    assert lions.net_run_rate == 3.0
+
+    # The full recompute agrees with the incremental updates
+    tournament_service.recompute_standings(db, tournament.id)
+    rebuilt = standings(db, tournament.id)
+    assert rebuilt["Lions"].net_run_rate == 3.0
+    assert rebuilt["Tigers"].net_run_rate == -3.0
+    assert rebuilt["Bears"].played == 0
+
+
+def test_concurrent_first_results_share_standing_rows(db, user):
+    tournament, fixtures = tournament_with_fixtures(
+        db, user, [("Lions", "Tigers"), ("Lions", "Bears"), ("Tigers", "Bears")] * 2)
+    start = threading.Barrier(len(fixtures))
+    errors = []
+
+    def record(fixture_id):
+        session = SessionLocal()
+        try:
+            start.wait()
+            tournament_service.record_match_result(session, tournament.id, fixture_id, TournamentResultUpdate(
+                team1_score=100, team1_overs=20, team2_score=90, team2_overs=20))
+        except Exception as error:
+            errors.append(error)
+        finally:
+            session.close()
+
+    threads = [threading.Thread(target=record, args=(fixture.id,)) for fixture in fixtures]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert db.query(TournamentStanding).filter(
+        TournamentStanding.tournament_id == tournament.id).count() == len(TEAMS)
+    assert sum(row.played for row in standings(db, tournament.id).values()) == 2 * len(fixtures)
@@ -0,0 +1,138 @@
+"""
+Upload references owned by profiles.
+
+Content is stored unreferenced, gains a reference per profile using its
+key, and is purged from storage when the last one lets go.
+"""
+
+import asyncio
+import hashlib
+from datetime import datetime, timedelta
+
+import pytest
+from PIL import Image
+
+from app.models.player import PlayerProfile
+from app.models.upload import StoredFile
+from app.utils import file_upload
+from app.utils.storage import FileSystemStorage
+
+
+@pytest.fixture
+def storage(tmp_path, monkeypatch):
+    backend = FileSystemStorage(str(tmp_path / "uploads"))
+    monkeypatch.setattr(file_upload, "storage", backend)
+    return backend
+
+
+def upload(tmp_path, color: str) -> str:
+    """Store a small image as save_file would and return its key."""
+    path = tmp_path / f"{color}.png"
+    Image.new("RGB", (64, 64), color).save(path)
+    key = file_upload.content_path(hashlib.sha256(path.read_bytes()).hexdigest(), path.name, "players")
+    file_upload.store_image(str(path), key)
+    return key
+
+
+def ref_count(db, key: str):
+    db.expire_all()
+    stored = db.get(StoredFile, key)
+    return None if stored is None else stored.ref_count
+
+
+def profile(db, user, key: str) -> PlayerProfile:
+    player = PlayerProfile(created_by=user.id, name="Keeper", role="Wicket-keeper",
+                           profile_image_url=key)
+    db.add(player)
+    db.commit()
+    return player
+
+
+def test_profiles_own_references(db, user, storage, tmp_path):
+    key = upload(tmp_path, "red")
+    assert ref_count(db, key) == 0
+
+    first = profile(db, user, key)
+    second = profile(db, user, key)
+    assert ref_count(db, key) == 2
+
+    # The first profile letting go leaves the content to the second
+    first.profile_image_url = upload(tmp_path, "blue")
+    db.commit()
+    assert ref_count(db, key) == 1
+    assert storage.exists(key)
+
+    db.delete(second)
+    db.commit()
+    assert ref_count(db, key) is None
+    assert not storage.exists(key)
+    assert not any(storage.exists(variant) for variant in file_upload.variant_keys(key))
+
+
+def test_rolled_back_change_keeps_reference(db, user, storage, tmp_path):
+    key = upload(tmp_path, "red")
+    player = profile(db, user, key)
+
+    player.profile_image_url = upload(tmp_path, "blue")
+    db.flush()
+    db.rollback()
+
+    assert ref_count(db, key) == 1
+    assert storage.exists(key)
+
+
+def test_orphaned_uploads_are_purged_after_retention(db, user, storage, tmp_path):
+    orphan = upload(tmp_path, "red")
+    kept = upload(tmp_path, "blue")
+    profile(db, user, kept)
+
+    assert file_upload.purge_orphaned_uploads(older_than_hours=1) == 0
+    db.query(StoredFile).update({StoredFile.created_at: datetime.utcnow() - timedelta(hours=2)})
+    db.commit()
+
+    assert file_upload.purge_orphaned_uploads(older_than_hours=1) == 1
+    assert not storage.exists(orphan)
+    assert ref_count(db, kept) == 1
+    assert storage.exists(kept)
+
+
+def post_upload(headers, chunks):
+    """Drive the app with an upload sent as separate body messages."""
+    from app.main import app
+
+    body = iter(chunks)
+    sent, read = [], []
+
+    async def receive():
+        chunk = next(body, None)
+        if chunk is None:
+            return {"type": "http.request", "body": b"", "more_body": False}
+        read.append(len(chunk))
+        return {"type": "http.request", "body": chunk, "more_body": True}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "POST",
+        "scheme": "http", "path": "/api/uploads", "raw_path": b"/api/uploads", "root_path": "",
+        "query_string": b"", "server": ("test", 80), "client": ("test", 1234),
+        "headers": [(b"content-type", b"multipart/form-data; boundary=b"), *headers],
+    }
+    asyncio.run(app(scope, receive, send))
+    return sent[0]["status"], sum(read)
+
+
+def test_oversized_upload_bodies_are_refused_before_parsing():
+    limit = file_upload.settings.MAX_FILE_SIZE + file_upload.settings.UPLOAD_REQUEST_OVERHEAD
+    chunk = 65536
+    chunks = [b'--b\r\nContent-Disposition: form-data; name="file"; filename="a.png"\r\n\r\n',
+              *[b"x" * chunk] * (4 * limit // chunk)]
+
+    # Declared length over the limit: refused before any of the body is read
+    assert post_upload([(b"content-length", str(4 * limit).encode())], chunks) == (413, 0)
+
+    # Chunked body: refused once the bytes read pass the limit
+    status, read = post_upload([(b"transfer-encoding", b"chunked")], chunks)
+    assert status == 413
+    assert limit < read <= limit + chunk